@@ -10,6 +10,7 @@ from fastapi.responses import JSONResponse
 
 from docvector.core import DocVectorException, get_logger, settings, setup_logging
 from docvector.db import close_db
+from docvector.vectordb.qdrant_client import shutdown_all as shutdown_qdrant_clients
 
 # Setup logging
 setup_logging()
@@ -43,6 +44,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down DocVector API")
     await search_service.close()
+    await shutdown_qdrant_clients()
     await close_db()
 
 
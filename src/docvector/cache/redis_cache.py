@@ -1,11 +1,11 @@
 """Redis caching implementation."""
 
-import json
 from typing import Any, Optional
 
 import redis.asyncio as redis
 
 from docvector.core import get_logger, settings
+from docvector.utils.json_utils import dumps_bytes, loads
 
 logger = get_logger(__name__)
 
@@ -55,7 +55,7 @@ class RedisCache:
         try:
             value = await self.client.get(full_key)
             if value:
-                return json.loads(value)
+                return loads(value)
         except Exception as e:
             logger.warning("Cache get error", key=key, error=str(e))
 
@@ -77,7 +77,7 @@ class RedisCache:
             await self.client.setex(
                 full_key,
                 ttl,
-                json.dumps(value),
+                dumps_bytes(value),
             )
             return True
         except Exception as e:
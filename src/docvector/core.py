@@ -172,6 +172,10 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = Field(default="postgresql+asyncpg://localhost/docvector")
+    database_pool_size: int = Field(default=10)  # Connections kept open (PostgreSQL only)
+    database_max_overflow: int = Field(default=20)  # Extra connections opened under load
+    database_statement_cache_size: int = Field(default=1024)  # Prepared statements kept per connection (asyncpg)
+    database_command_timeout: Optional[float] = Field(default=60.0)  # Seconds before a query is cancelled (asyncpg)
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0")
@@ -180,21 +184,33 @@ class Settings(BaseSettings):
     # Vector Database - ChromaDB (local mode)
     chroma_persist_directory: str = Field(default="./data/chroma")
     chroma_collection: str = Field(default="documents")
+    chroma_upsert_batch_size: int = Field(default=512)  # Records per ChromaDB upsert call
+    chroma_upsert_concurrency: int = Field(default=4)  # Sub-batches in flight per upsert
+    chroma_upsert_coalesce_ms: float = Field(default=5.0)  # Window for merging concurrent upserts
+    chroma_upsert_max_coalesced: int = Field(default=2048)  # Max records merged into one write
 
     # Vector Database - Qdrant (cloud/hybrid mode)
     qdrant_host: str = Field(default="localhost")
     qdrant_port: int = Field(default=6333)
     qdrant_grpc_port: int = Field(default=6334)
-    qdrant_use_grpc: bool = Field(default=False)
+    qdrant_use_grpc: bool = Field(default=True)  # gRPC for local deployments; set false to force HTTP
     qdrant_collection: str = Field(default="documents")
     qdrant_url: Optional[str] = Field(default=None)  # Cloud URL (e.g., https://xxx.cloud.qdrant.io:6333)
     qdrant_api_key: Optional[str] = Field(default=None)  # Cloud API key
+    qdrant_pool_size: Optional[int] = Field(default=None)  # Connection/channel pool size (None: 100 for HTTP, client default for gRPC)
+    qdrant_upsert_batch_size: int = Field(default=256)  # Points per coalesced upsert request
+    qdrant_upsert_batch_timeout_ms: float = Field(default=50.0)  # Max wait before flushing a partial batch
+    qdrant_quantization: str = Field(default="scalar")  # New collections: none, scalar (int8), product, binary
+    qdrant_vectors_on_disk: bool = Field(default=False)  # New collections: full vectors on disk, read when rescoring
 
     # Embeddings
     embedding_provider: str = Field(default="local")  # "local" or "openai"
     embedding_model: str = Field(default="sentence-transformers/all-MiniLM-L6-v2")
-    embedding_device: str = Field(default="cpu")  # "cpu" or "cuda"
+    embedding_device: str = Field(default="cpu")  # "cpu", "cuda", "mps", or "auto" (best available)
     embedding_batch_size: int = Field(default=32)
+    embedding_backend: str = Field(default="torch")  # "torch", "onnx", or "openvino" (needs sentence-transformers>=3.2 + optimum)
+    embedding_threads: Optional[int] = Field(default=None)  # Torch CPU threads for local models (None: torch default)
+    embedding_half_precision: bool = Field(default=True)  # BF16/FP16 inference for local models on CUDA
     embedding_cache_enabled: bool = Field(default=True)
     openai_api_key: Optional[str] = Field(default=None)
 
@@ -212,6 +228,7 @@ class Settings(BaseSettings):
     crawler_max_depth: int = Field(default=3)
     crawler_max_pages: int = Field(default=100)
     crawler_concurrent_requests: int = Field(default=5)
+    crawler_max_body_bytes: int = Field(default=5 * 1024 * 1024)  # Larger pages are skipped while crawling
     crawler_user_agent: str = Field(
         default="DocVector/0.1.0 (https://github.com/docvector/docvector)"
     )
@@ -262,7 +279,11 @@ def setup_logging(level: Optional[str] = None) -> None:
 
 
 class StructuredLogger:
-    """Logger wrapper that supports structured logging with keyword arguments."""
+    """Logger wrapper that supports structured logging with keyword arguments.
+
+    Messages are only formatted when the underlying logger is enabled for
+    their level, so disabled debug calls cost a level check.
+    """
 
     def __init__(self, logger: logging.Logger):
         """
@@ -291,27 +312,41 @@ class StructuredLogger:
 
     def debug(self, msg: str, **kwargs) -> None:
         """Log debug message with structured data."""
-        self._logger.debug(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format_message(msg, **kwargs))
 
     def info(self, msg: str, **kwargs) -> None:
         """Log info message with structured data."""
-        self._logger.info(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(self._format_message(msg, **kwargs))
 
     def warning(self, msg: str, **kwargs) -> None:
         """Log warning message with structured data."""
-        self._logger.warning(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(self._format_message(msg, **kwargs))
 
     def error(self, msg: str, **kwargs) -> None:
         """Log error message with structured data."""
-        self._logger.error(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(self._format_message(msg, **kwargs))
 
     def critical(self, msg: str, **kwargs) -> None:
         """Log critical message with structured data."""
-        self._logger.critical(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(self._format_message(msg, **kwargs))
 
     def exception(self, msg: str, **kwargs) -> None:
         """Log exception message with structured data."""
-        self._logger.exception(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.exception(self._format_message(msg, **kwargs))
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message at ``level`` would be emitted.
+
+        Hot paths can test this before a debug call to skip building its
+        keyword arguments entirely.
+        """
+        return self._logger.isEnabledFor(level)
 
 
 def get_logger(name: str) -> StructuredLogger:
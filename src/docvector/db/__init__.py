@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engin
 from sqlalchemy.orm import sessionmaker
 
 from docvector.core import get_logger, settings
+from docvector.utils.json_utils import dumps, loads
 
 logger = get_logger(__name__)
 
@@ -43,16 +44,30 @@ def get_engine() -> AsyncEngine:
         if is_sqlite:
             # SQLite specific args
             connect_args = {"check_same_thread": False}
+        elif settings.database_url.startswith("postgresql+asyncpg"):
+            connect_args = {
+                # SQLAlchemy's asyncpg dialect prepares each statement once
+                # per connection and reuses it from this cache; the default of
+                # 100 is smaller than the set of distinct ORM statements
+                "prepared_statement_cache_size": settings.database_statement_cache_size,
+                "command_timeout": settings.database_command_timeout,
+            }
         
         # pooling args
         kwargs = {}
         if not is_sqlite:
             # PostgreSQL/others support pooling
             kwargs = {
-                "pool_size": 10,
-                "max_overflow": 20,
+                "pool_size": settings.database_pool_size,
+                "max_overflow": settings.database_max_overflow,
             }
-            
+
+        # Metadata JSON/JSONB columns are written for every document and
+        # chunk; the engine's dialect codec encodes and decodes them with
+        # orjson when it is installed
+        kwargs["json_serializer"] = dumps
+        kwargs["json_deserializer"] = loads
+
         _engine = create_async_engine(
             settings.database_url,
             echo=settings.environment == "development",
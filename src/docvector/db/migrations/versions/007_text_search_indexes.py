@@ -0,0 +1,44 @@
+"""Add trigram indexes for Q&A and issue text search.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+QuestionRepository.search_by_text and IssueRepository.search_by_text match
+``ILIKE '%query%'`` against several text columns, which without an index
+scans and re-reads every row on each search. pg_trgm GIN indexes serve those
+same ILIKE predicates from the index, so results are unchanged.
+"""
+
+from alembic import op
+
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+# (index name, table, column) for every column searched with ILIKE
+_TRIGRAM_INDEXES = [
+    ("idx_questions_title_trgm", "questions", "title"),
+    ("idx_questions_body_trgm", "questions", "body"),
+    ("idx_issues_title_trgm", "issues", "title"),
+    ("idx_issues_description_trgm", "issues", "description"),
+    ("idx_issues_error_message_trgm", "issues", "error_message"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for index_name, table, column in _TRIGRAM_INDEXES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON {table} USING GIN ({column} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for index_name, _table, _column in reversed(_TRIGRAM_INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
@@ -1,12 +1,13 @@
 """Chunk repository."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from docvector.models import Chunk
+from docvector.models import Chunk, Document
 
 
 class ChunkRepository:
@@ -24,13 +25,15 @@ class ChunkRepository:
         return chunk
 
     async def create_many(self, chunks: List[Chunk]) -> List[Chunk]:
-        """Create multiple chunks."""
+        """
+        Create multiple chunks.
+
+        The rows go out as batched multi-row INSERTs whose RETURNING clause
+        loads server defaults (Chunk uses eager_defaults), so no per-chunk
+        refresh query is needed afterwards.
+        """
         self.session.add_all(chunks)
         await self.session.flush()
-
-        for chunk in chunks:
-            await self.session.refresh(chunk)
-
         return chunks
 
     async def get_by_id(self, chunk_id: UUID) -> Optional[Chunk]:
@@ -60,6 +63,16 @@ class ChunkRepository:
         await self.session.refresh(chunk)
         return chunk
 
+    async def mark_embedded(self, documents: Sequence[Document], embedded_at: datetime) -> None:
+        """Record that the chunks of these documents are stored in the vector DB."""
+        if not documents:
+            return
+        await self.session.execute(
+            update(Chunk)
+            .where(Chunk.document_id.in_([document.id for document in documents]))
+            .values(embedded_at=embedded_at)
+        )
+
     async def delete(self, chunk_id: UUID) -> bool:
         """Delete chunk."""
         chunk = await self.get_by_id(chunk_id)
@@ -1,6 +1,6 @@
 """Document repository."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import func, select
@@ -23,6 +23,11 @@ class DocumentRepository:
         await self.session.refresh(document)
         return document
 
+    def add(self, document: Document) -> Document:
+        """Stage a new document; the session's next flush inserts it."""
+        self.session.add(document)
+        return document
+
     async def get_by_id(self, document_id: UUID) -> Optional[Document]:
         """Get document by ID."""
         result = await self.session.execute(select(Document).where(Document.id == document_id))
@@ -52,6 +57,23 @@ class DocumentRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_many_by_content_hash(
+        self,
+        source_id: UUID,
+        content_hashes: List[str],
+    ) -> Dict[str, Document]:
+        """Get documents by content hash, keyed by hash."""
+        if not content_hashes:
+            return {}
+
+        result = await self.session.execute(
+            select(Document).where(
+                Document.source_id == source_id,
+                Document.content_hash.in_(set(content_hashes)),
+            )
+        )
+        return {document.content_hash: document for document in result.scalars()}
+
     async def list_by_source(
         self,
         source_id: UUID,
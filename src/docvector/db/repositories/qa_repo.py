@@ -1,13 +1,14 @@
 """Q&A repositories - Question, Answer, Comment, Tag, Vote."""
 
-from typing import List, Optional
+from typing import List, Optional, Type
 from uuid import UUID
 
 from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from docvector.models import Answer, Comment, Question, Tag, Vote, question_tags
+from docvector.models import Answer, Base, Comment, Question, Tag, Vote, question_tags
 
 
 class TagRepository:
@@ -35,11 +36,34 @@ class TagRepository:
 
     async def get_or_create(self, name: str, category: Optional[str] = None) -> Tag:
         """Get existing tag or create new one."""
-        tag = await self.get_by_name(name)
-        if tag:
-            return tag
-        tag = Tag(name=name, category=category)
-        return await self.create(tag)
+        tags = await self.get_or_create_many([name], category=category)
+        return tags[0]
+
+    async def get_or_create_many(
+        self,
+        names: List[str],
+        category: Optional[str] = None,
+    ) -> List[Tag]:
+        """
+        Get existing tags or create new ones, in the order given.
+
+        Missing tags are inserted in one INSERT ... ON CONFLICT (name) DO
+        NOTHING, which also tolerates a concurrent insert of the same tag,
+        and all of them are read back in one SELECT, rather than a lookup and
+        a possible insert per name. Repeated names are returned once.
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return []
+
+        await self.session.execute(
+            pg_insert(Tag)
+            .values([{"name": name, "category": category} for name in names])
+            .on_conflict_do_nothing(index_elements=[Tag.name])
+        )
+        result = await self.session.execute(select(Tag).where(Tag.name.in_(names)))
+        tags = {tag.name: tag for tag in result.scalars()}
+        return [tags[name] for name in names]
 
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[Tag]:
         """List all tags ordered by usage."""
@@ -64,6 +88,14 @@ class TagRepository:
             update(Tag).where(Tag.id == tag_id).values(usage_count=Tag.usage_count + 1)
         )
 
+    async def increment_usage_many(self, tag_ids: List[UUID]) -> None:
+        """Increment usage count for several tags in one statement."""
+        if not tag_ids:
+            return
+        await self.session.execute(
+            update(Tag).where(Tag.id.in_(tag_ids)).values(usage_count=Tag.usage_count + 1)
+        )
+
     async def decrement_usage(self, tag_id: UUID) -> None:
         """Decrement tag usage count."""
         await self.session.execute(
@@ -318,16 +350,35 @@ class VoteRepository:
         return result.scalar_one_or_none()
 
     async def upsert(self, vote: Vote) -> Vote:
-        """Create or update a vote."""
-        existing = await self.get_by_voter_and_target(
-            vote.voter_id, vote.target_type, vote.target_id
+        """
+        Create or update a vote.
+
+        A single INSERT ... ON CONFLICT against uq_votes_voter_target replaces
+        the SELECT-then-INSERT/UPDATE round trips and cannot race with a
+        concurrent vote from the same voter. Re-casting an unchanged vote
+        updates nothing, so only then is the stored row read back.
+        """
+        values = {
+            column.key: getattr(vote, column.key)
+            for column in Vote.__table__.columns
+            if getattr(vote, column.key) is not None
+        }
+        statement = pg_insert(Vote).values(**values)
+        statement = statement.on_conflict_do_update(
+            constraint="uq_votes_voter_target",
+            set_={"value": statement.excluded.value},
+            where=Vote.value.is_distinct_from(statement.excluded.value),
+        ).returning(Vote)
+
+        result = await self.session.scalars(
+            statement, execution_options={"populate_existing": True}
         )
-        if existing:
-            existing.value = vote.value
-            await self.session.flush()
-            await self.session.refresh(existing)
-            return existing
-        return await self.create(vote)
+        stored = result.one_or_none()
+        if stored is None:
+            stored = await self.get_by_voter_and_target(
+                vote.voter_id, vote.target_type, vote.target_id
+            )
+        return stored
 
     async def delete(
         self,
@@ -352,6 +403,38 @@ class VoteRepository:
         )
         return result.scalar() or 0
 
+    async def refresh_score(self, model: Type[Base], target_type: str, target_id: UUID) -> int:
+        """
+        Recount a target's votes and store the total as its vote_score.
+
+        The votes are summed inside a single UPDATE ... RETURNING, instead of
+        a SUM query, a load of the target and a write back with refresh. A
+        copy of the target already loaded in the session is updated from the
+        returned row.
+
+        Args:
+            model: Mapped class of the target (Question, Answer, Issue, ...)
+            target_type: Target type the votes were cast with
+            target_id: Target ID
+
+        Returns:
+            The new score, or 0 if the target does not exist
+        """
+        score = (
+            select(func.coalesce(func.sum(Vote.value), 0))
+            .where(and_(Vote.target_type == target_type, Vote.target_id == target_id))
+            .scalar_subquery()
+        )
+        result = await self.session.scalars(
+            update(model)
+            .where(model.id == target_id)
+            .values(vote_score=score)
+            .returning(model),
+            execution_options={"populate_existing": True, "synchronize_session": False},
+        )
+        target = result.one_or_none()
+        return target.vote_score if target is not None else 0
+
     async def list_by_target(
         self,
         target_type: str,
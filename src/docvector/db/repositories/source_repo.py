@@ -3,7 +3,7 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from docvector.models import Source
@@ -44,6 +44,11 @@ class SourceRepository:
         )
         return list(result.scalars().all())
 
+    async def count(self) -> int:
+        """Count all sources."""
+        result = await self.session.execute(select(func.count(Source.id)))
+        return result.scalar_one()
+
     async def list_active(self) -> List[Source]:
         """List active sources."""
         result = await self.session.execute(
@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import List
 
+import numpy as np
+
 
 class BaseEmbedder(ABC):
     """Abstract base class for embedding generators."""
@@ -20,6 +22,23 @@ class BaseEmbedder(ABC):
         """
         pass
 
+    async def embed_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings as a single float32 array.
+
+        Embedders that produce arrays natively should override this to skip
+        the round trip through Python lists.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Array of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.empty((0, self.get_dimension()), dtype=np.float32)
+        return np.asarray(await self.embed(texts), dtype=np.float32)
+
     @abstractmethod
     async def embed_query(self, text: str) -> List[float]:
         """
@@ -1,12 +1,15 @@
 """Embedding cache using Redis."""
 
 import hashlib
-import json
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
 
 import redis.asyncio as redis
 
 from docvector.core import get_logger, settings
+from docvector.utils.json_utils import dumps_bytes, loads
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = get_logger(__name__)
 
@@ -65,7 +68,7 @@ class EmbeddingCache:
         try:
             cached = await self.client.get(cache_key)
             if cached:
-                embedding = json.loads(cached)
+                embedding = loads(cached)
                 logger.debug("Cache hit", key=cache_key[:50])
                 return embedding
         except Exception as e:
@@ -95,7 +98,7 @@ class EmbeddingCache:
             await self.client.setex(
                 cache_key,
                 self.ttl,
-                json.dumps(embedding),
+                dumps_bytes(embedding),
             )
             logger.debug("Cached embedding", key=cache_key[:50])
         except Exception as e:
@@ -137,7 +140,7 @@ class EmbeddingCache:
             for text, result in zip(texts, results):
                 if result:
                     try:
-                        embedding = json.loads(result)
+                        embedding = loads(result)
                         cached[text] = embedding
                     except Exception as e:
                         logger.warning("Failed to deserialize cached embedding", error=str(e))
@@ -155,7 +158,7 @@ class EmbeddingCache:
         self,
         texts: List[str],
         model: str,
-        embeddings: List[List[float]],
+        embeddings: Union[Sequence[Sequence[float]], "np.ndarray"],
     ) -> None:
         """
         Cache multiple embeddings.
@@ -163,11 +166,11 @@ class EmbeddingCache:
         Args:
             texts: List of texts
             model: Model name
-            embeddings: List of embedding vectors
+            embeddings: Embedding vectors, as lists or rows of a NumPy array
         """
         await self.initialize()
 
-        if not texts or not embeddings:
+        if not texts or len(embeddings) == 0:
             return
 
         if len(texts) != len(embeddings):
@@ -182,7 +185,7 @@ class EmbeddingCache:
                 pipe.setex(
                     cache_key,
                     self.ttl,
-                    json.dumps(embedding),
+                    dumps_bytes(embedding),
                 )
 
             await pipe.execute()
@@ -5,6 +5,7 @@ from typing import List, Optional
 import httpx
 
 from docvector.core import DocVectorException, get_logger, settings
+from docvector.utils.json_utils import loads
 
 from .base import BaseEmbedder
 
@@ -95,7 +96,7 @@ class OpenAIEmbedder(BaseEmbedder):
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = loads(response.content)
             embeddings = [item["embedding"] for item in data["data"]]
 
             return embeddings
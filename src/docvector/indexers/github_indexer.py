@@ -24,6 +24,7 @@ import aiohttp
 
 from docvector.core import get_logger
 from docvector.services.qa_service import QAService
+from docvector.utils.json_utils import loads
 
 logger = get_logger(__name__)
 
@@ -118,7 +119,7 @@ class GitHubIndexer:
                 try:
                     async with session.get(url, params=params) as resp:
                         if resp.status == 200:
-                            issues = await resp.json()
+                            issues = await resp.json(loads=loads)
 
                             if not issues:
                                 logger.info("No more issues to import", page=page)
@@ -238,7 +239,7 @@ class GitHubIndexer:
         try:
             async with session.get(url) as resp:
                 if resp.status == 200:
-                    comments = await resp.json()
+                    comments = await resp.json(loads=loads)
 
                     for idx, comment in enumerate(comments):
                         comment_id = comment["id"]
@@ -404,7 +405,7 @@ class GitHubIndexer:
                         headers=headers,
                     ) as resp:
                         if resp.status == 200:
-                            result = await resp.json()
+                            result = await resp.json(loads=loads)
 
                             if "errors" in result:
                                 logger.error("GraphQL errors", errors=result["errors"])
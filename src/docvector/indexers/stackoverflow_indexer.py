@@ -27,6 +27,7 @@ import aiohttp
 
 from docvector.core import get_logger
 from docvector.services.qa_service import QAService
+from docvector.utils.json_utils import loads
 
 logger = get_logger(__name__)
 
@@ -100,7 +101,7 @@ class StackOverflowIndexer:
                 try:
                     async with session.get(url, params=params) as resp:
                         if resp.status == 200:
-                            data = await resp.json()
+                            data = await resp.json(loads=loads)
                             questions = data.get("items", [])
 
                             if not questions:
@@ -205,7 +206,7 @@ class StackOverflowIndexer:
         try:
             async with session.get(url, params=params) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(loads=loads)
                     answers = data.get("items", [])
 
                     for a in answers:
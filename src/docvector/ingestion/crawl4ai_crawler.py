@@ -2,9 +2,10 @@
 
 import asyncio
 from typing import Dict, List, Optional, Set
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urljoin
 from urllib.robotparser import RobotFileParser
 
+import aiohttp
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
 
 # Try to import URL seeding (available in newer versions)
@@ -15,6 +16,7 @@ except ImportError:
     HAS_URL_SEEDER = False
 
 from docvector.core import DocVectorException, get_logger, settings
+from docvector.utils.url_utils import is_crawlable_url, normalize_url, parse_url
 
 from .base import BaseFetcher, FetchedDocument
 
@@ -57,7 +59,10 @@ class Crawl4AICrawler(BaseFetcher):
         self.respect_robots = respect_robots
         self.headless = headless
         self._crawler: Optional[AsyncWebCrawler] = None
+        self._session: Optional[aiohttp.ClientSession] = None
         self._robots_cache: Dict[str, RobotFileParser] = {}
+        # In-flight robots.txt fetches, so concurrent callers share one request
+        self._robots_pending: Dict[str, asyncio.Future] = {}
 
     async def _get_crawler(self) -> AsyncWebCrawler:
         """Get or create the crawler instance."""
@@ -70,11 +75,23 @@ class Crawl4AICrawler(BaseFetcher):
             await self._crawler.start()
         return self._crawler
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the HTTP session used for robots.txt."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={"User-Agent": settings.crawler_user_agent},
+            )
+        return self._session
+
     async def close(self) -> None:
         """Close crawler and cleanup resources."""
         if self._crawler:
             await self._crawler.close()
             self._crawler = None
+        if self._session:
+            await self._session.close()
+            self._session = None
 
     async def fetch(self, config: Dict) -> List[FetchedDocument]:
         """
@@ -103,7 +120,7 @@ class Crawl4AICrawler(BaseFetcher):
 
         # Auto-detect allowed domain from start URL if not specified
         if not allowed_domains:
-            parsed = urlparse(start_url)
+            parsed = parse_url(start_url)
             allowed_domains = [parsed.netloc]
 
         logger.info(
@@ -117,9 +134,14 @@ class Crawl4AICrawler(BaseFetcher):
         try:
             crawler = await self._get_crawler()
 
-            # Load robots.txt if respecting it
+            # Load robots.txt for every allowed domain up front, in parallel;
+            # hosts found later are loaded on demand by _can_fetch
             if respect_robots:
-                await self._load_robots_txt(start_url)
+                scheme = parse_url(start_url).scheme
+                await asyncio.gather(
+                    self._load_robots_txt(start_url),
+                    *(self._load_robots_txt(f"{scheme}://{domain}") for domain in allowed_domains),
+                )
 
             # Try sitemap-based discovery first (more efficient)
             urls_to_fetch = None
@@ -162,38 +184,62 @@ class Crawl4AICrawler(BaseFetcher):
 
     async def _load_robots_txt(self, url: str) -> None:
         """Load and cache robots.txt for the domain."""
-        parsed = urlparse(url)
+        parsed = parse_url(url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
 
         if base_url in self._robots_cache:
             return
 
+        pending = self._robots_pending.get(base_url)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_robots_txt(base_url))
+            self._robots_pending[base_url] = pending
+
+        # Shield so one cancelled caller does not abort the shared fetch
+        await asyncio.shield(pending)
+
+    async def _fetch_robots_txt(self, base_url: str) -> None:
+        """Fetch, parse and cache robots.txt for ``base_url``."""
         robots_url = f"{base_url}/robots.txt"
         rp = RobotFileParser()
         rp.set_url(robots_url)
 
         try:
-            # Fetch robots.txt
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, rp.read)
+            # Fetch robots.txt on the event loop; status handling follows
+            # RobotFileParser.read()
+            session = await self._get_session()
+            async with session.get(robots_url) as response:
+                if response.status in (401, 403):
+                    rp.disallow_all = True
+                elif 400 <= response.status < 500:
+                    rp.allow_all = True
+                else:
+                    response.raise_for_status()
+                    rp.parse((await response.text()).splitlines())
             self._robots_cache[base_url] = rp
             logger.debug("Loaded robots.txt", url=robots_url)
         except Exception as e:
             logger.warning("Failed to load robots.txt", url=robots_url, error=str(e))
             # Create permissive parser on failure
+            rp.allow_all = True
             self._robots_cache[base_url] = rp
+        finally:
+            self._robots_pending.pop(base_url, None)
 
-    def _can_fetch(self, url: str) -> bool:
-        """Check if URL is allowed by robots.txt."""
+    async def _can_fetch(self, url: str) -> bool:
+        """Check if URL is allowed by robots.txt, loading it for new hosts."""
         if not self.respect_robots:
             return True
 
-        parsed = urlparse(url)
+        parsed = parse_url(url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
 
         rp = self._robots_cache.get(base_url)
-        if not rp:
-            return True  # Allow if robots.txt not loaded
+        if rp is None:
+            await self._load_robots_txt(url)
+            rp = self._robots_cache.get(base_url)
+            if rp is None:
+                return True  # Allow if robots.txt could not be loaded
 
         return rp.can_fetch(settings.crawler_user_agent, url)
 
@@ -208,7 +254,7 @@ class Crawl4AICrawler(BaseFetcher):
         if not HAS_URL_SEEDER:
             return None
 
-        parsed = urlparse(start_url)
+        parsed = parse_url(start_url)
         domain = parsed.netloc
 
         try:
@@ -228,7 +274,7 @@ class Crawl4AICrawler(BaseFetcher):
 
                 # Filter by robots.txt if needed
                 if respect_robots:
-                    urls = [url for url in urls if self._can_fetch(url)]
+                    urls = [url for url in urls if await self._can_fetch(url)]
 
                 logger.info("Discovered URLs from sitemap", count=len(urls), domain=domain)
                 return urls[:max_pages]
@@ -248,7 +294,7 @@ class Crawl4AICrawler(BaseFetcher):
         documents: List[FetchedDocument] = []
 
         async def fetch_one(url: str) -> Optional[FetchedDocument]:
-            if respect_robots and not self._can_fetch(url):
+            if respect_robots and not await self._can_fetch(url):
                 return None
 
             async with semaphore:
@@ -344,146 +390,124 @@ class Crawl4AICrawler(BaseFetcher):
         """
         Crawl website using BFS (breadth-first search).
 
+        A pool of ``concurrent_requests`` workers drains a shared FIFO queue,
+        so a slow page only holds up its own worker instead of the whole
+        depth level.
+
         Returns documents as they are fetched.
         """
-        visited: Set[str] = set()
         documents: List[FetchedDocument] = []
 
-        # Queue: (url, depth)
-        queue: List[tuple[str, int]] = [(self._normalize_url(start_url), 0)]
+        # Queue: (url, depth). URLs are deduplicated when enqueued, so every
+        # queued URL is unique and needs no re-check when popped.
+        start = self._normalize_url(start_url)
+        queue: "asyncio.Queue[tuple[str, int]]" = asyncio.Queue()
+        queue.put_nowait((start, 0))
+        enqueued: Set[str] = {start}
+
+        # Set once max_pages documents are collected
+        done = asyncio.Event()
+
+        async def fetch_and_extract(url: str, depth: int) -> Optional[tuple[FetchedDocument, List[str]]]:
+            try:
+                run_config = CrawlerRunConfig(
+                    cache_mode=CacheMode.BYPASS,
+                    process_iframes=False,
+                    remove_overlay_elements=True,
+                )
 
-        semaphore = asyncio.Semaphore(self.concurrent_requests)
+                result = await crawler.arun(url=url, config=run_config)
 
-        while queue and len(documents) < max_pages:
-            # Get batch of URLs at same depth level
-            batch: List[tuple[str, int]] = []
-            current_depth = queue[0][1] if queue else 0
-
-            while queue and queue[0][1] == current_depth and len(batch) < self.concurrent_requests:
-                url, depth = queue.pop(0)
-                if url not in visited:
-                    visited.add(url)
-                    batch.append((url, depth))
-
-            if not batch:
-                continue
-
-            logger.debug("Crawling batch", depth=current_depth, urls=len(batch))
-
-            # Fetch batch concurrently
-            async def fetch_and_extract(url: str, depth: int) -> Optional[tuple[FetchedDocument, List[str]]]:
-                async with semaphore:
-                    try:
-                        run_config = CrawlerRunConfig(
-                            cache_mode=CacheMode.BYPASS,
-                            process_iframes=False,
-                            remove_overlay_elements=True,
-                        )
-
-                        result = await crawler.arun(url=url, config=run_config)
-
-                        if not result.success:
-                            logger.warning("Failed to fetch", url=url)
-                            return None
-
-                        content = result.markdown.raw_markdown if result.markdown else ""
-
-                        doc = FetchedDocument(
-                            url=url,
-                            content=content.encode("utf-8"),
-                            mime_type="text/markdown",
-                            title=result.metadata.get("title") if result.metadata else None,
-                            metadata={
-                                "status_code": result.status_code,
-                                "crawl4ai": True,
-                                "depth": depth,
-                            },
-                        )
-
-                        # Extract links for next level
-                        new_links = []
-                        if depth < max_depth and result.links:
-                            internal_links = result.links.get("internal", [])
-                            for link_info in internal_links:
-                                link_url = link_info.get("href", "") if isinstance(link_info, dict) else str(link_info)
-                                normalized = self._normalize_url(link_url)
-                                if normalized and self._should_crawl(normalized, allowed_domains, respect_robots):
-                                    if normalized not in visited:
-                                        new_links.append(normalized)
-
-                        return (doc, new_links)
-
-                    except Exception as e:
-                        logger.warning("Failed to fetch URL", url=url, error=str(e))
-                        return None
+                if not result.success:
+                    logger.warning("Failed to fetch", url=url)
+                    return None
 
-            # Fetch all URLs in batch
-            tasks = [fetch_and_extract(url, depth) for url, depth in batch]
-            results = await asyncio.gather(*tasks)
+                content = result.markdown.raw_markdown if result.markdown else ""
+
+                doc = FetchedDocument(
+                    url=url,
+                    content=content.encode("utf-8"),
+                    mime_type="text/markdown",
+                    title=result.metadata.get("title") if result.metadata else None,
+                    metadata={
+                        "status_code": result.status_code,
+                        "crawl4ai": True,
+                        "depth": depth,
+                    },
+                )
 
-            # Process results
-            for result in results:
-                if result is None:
-                    continue
+                # Extract links for next level
+                new_links = []
+                if depth < max_depth and result.links:
+                    internal_links = result.links.get("internal", [])
+                    for link_info in internal_links:
+                        link_url = link_info.get("href", "") if isinstance(link_info, dict) else str(link_info)
+                        normalized = self._normalize_url(link_url)
+                        if normalized in enqueued:
+                            continue
+                        if await self._should_crawl(normalized, allowed_domains, respect_robots):
+                            new_links.append(normalized)
+
+                return (doc, new_links)
+
+            except Exception as e:
+                logger.warning("Failed to fetch URL", url=url, error=str(e))
+                return None
 
-                doc, new_links = result
-                documents.append(doc)
+        async def worker() -> None:
+            while True:
+                url, depth = await queue.get()
+                try:
+                    if done.is_set():
+                        continue
 
-                # Add new links to queue
-                for link in new_links:
-                    if link not in visited and len(visited) + len(queue) < max_pages * 2:
-                        queue.append((link, doc.metadata.get("depth", 0) + 1))
+                    result = await fetch_and_extract(url, depth)
+                    if result is None or done.is_set():
+                        continue
 
-                if len(documents) >= max_pages:
-                    break
+                    doc, new_links = result
+                    documents.append(doc)
 
-            logger.info("Crawl progress", fetched=len(documents), visited=len(visited), queue=len(queue))
+                    # Add new links to queue
+                    for link in new_links:
+                        if link not in enqueued and len(enqueued) < max_pages * 2:
+                            enqueued.add(link)
+                            queue.put_nowait((link, depth + 1))
 
-        return documents
+                    logger.debug("Crawled page", url=url, depth=depth, fetched=len(documents))
 
-    def _normalize_url(self, url: str) -> str:
-        """Normalize URL by removing fragments and trailing slashes."""
-        if not url:
-            return ""
+                    if len(documents) >= max_pages:
+                        done.set()
+                finally:
+                    queue.task_done()
 
-        parsed = urlparse(url)
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrent_requests)]
+        drained = asyncio.create_task(queue.join())
+        limit_reached = asyncio.create_task(done.wait())
 
-        # Remove fragment
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        try:
+            # Stop when the frontier is exhausted or enough pages are collected
+            await asyncio.wait({drained, limit_reached}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (*workers, drained, limit_reached):
+                task.cancel()
+            await asyncio.gather(*workers, drained, limit_reached, return_exceptions=True)
 
-        # Remove trailing slash (except for root)
-        if normalized.endswith("/") and parsed.path != "/":
-            normalized = normalized[:-1]
+        logger.info("Crawl progress", fetched=len(documents), visited=len(enqueued) - queue.qsize(), queue=queue.qsize())
 
-        # Keep query string for pagination, etc.
-        if parsed.query:
-            normalized = f"{normalized}?{parsed.query}"
+        return documents
 
-        return normalized
+    def _normalize_url(self, url: str) -> str:
+        """Normalize URL by removing fragments and trailing slashes."""
+        return normalize_url(url)
 
-    def _should_crawl(self, url: str, allowed_domains: List[str], respect_robots: bool = True) -> bool:
+    async def _should_crawl(self, url: str, allowed_domains: List[str], respect_robots: bool = True) -> bool:
         """Check if URL should be crawled."""
-        if not url:
+        if not is_crawlable_url(url, tuple(allowed_domains)):
             return False
 
-        parsed = urlparse(url)
-
-        # Skip non-http(s) URLs
-        if parsed.scheme not in ("http", "https"):
-            return False
-
-        # Skip common non-content extensions
-        skip_extensions = {".pdf", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".css", ".js", ".ico", ".woff", ".woff2", ".ttf", ".eot"}
-        if any(parsed.path.lower().endswith(ext) for ext in skip_extensions):
-            return False
-
-        # Check allowed domains
-        if allowed_domains:
-            if not any(parsed.netloc.endswith(domain) for domain in allowed_domains):
-                return False
-
         # Check robots.txt
-        if respect_robots and not self._can_fetch(url):
+        if respect_robots and not await self._can_fetch(url):
             return False
 
         return True
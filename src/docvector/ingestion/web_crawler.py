@@ -1,18 +1,36 @@
 """Web crawler for fetching documentation from websites."""
 
 import asyncio
+from collections import deque
 from typing import Dict, List, Optional, Set
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
 
 from docvector.core import DocVectorException, get_logger, settings
+from docvector.utils.url_utils import parse_url
 
 from .base import BaseFetcher, FetchedDocument
 
 logger = get_logger(__name__)
 
+# lxml parses in C; html.parser is the pure-Python fallback
+_HTML_PARSER = "lxml" if etree is not None else "html.parser"
+
+# Crawled pages are only scanned for links and the title, so the parser is
+# told to build just those elements instead of the whole tree
+_PAGE_STRAINER = SoupStrainer(["a", "title"])
+_TITLE_STRAINER = SoupStrainer("title")
+
+# Sitemaps are streamed into the XML parser in chunks of this size
+_SITEMAP_CHUNK_SIZE = 65536
+
 
 class WebCrawler(BaseFetcher):
     """
@@ -23,6 +41,10 @@ class WebCrawler(BaseFetcher):
     - Configurable depth and page limits
     - Concurrent fetching
     - Sitemap support
+
+    The HTTP session is created on first use and kept open across fetch
+    calls so connections are reused; call ``close()`` (or use the crawler
+    as an async context manager) to release it.
     """
 
     def __init__(
@@ -32,6 +54,7 @@ class WebCrawler(BaseFetcher):
         concurrent_requests: Optional[int] = None,
         respect_robots_txt: bool = True,
         user_agent: Optional[str] = None,
+        max_body_bytes: Optional[int] = None,
     ):
         """
         Initialize web crawler.
@@ -42,12 +65,15 @@ class WebCrawler(BaseFetcher):
             concurrent_requests: Number of concurrent requests
             respect_robots_txt: Whether to respect robots.txt
             user_agent: User agent string
+            max_body_bytes: Pages larger than this are skipped while crawling
+                and rejected when fetched
         """
         self.max_depth = max_depth or settings.crawler_max_depth
         self.max_pages = max_pages or settings.crawler_max_pages
         self.concurrent_requests = concurrent_requests or settings.crawler_concurrent_requests
         self.respect_robots_txt = respect_robots_txt
         self.user_agent = user_agent or settings.crawler_user_agent
+        self.max_body_bytes = max_body_bytes or settings.crawler_max_body_bytes
 
         self.visited_urls: Set[str] = set()
         self.session: Optional[aiohttp.ClientSession] = None
@@ -86,47 +112,58 @@ class WebCrawler(BaseFetcher):
         # Initialize session
         await self._init_session()
 
-        try:
-            # Check for sitemap first
-            sitemap_urls = await self._fetch_sitemap(start_url)
-
-            if sitemap_urls:
-                logger.info("Found sitemap", urls=len(sitemap_urls))
-                urls_to_fetch = list(sitemap_urls)[:max_pages]
-            else:
-                # Crawl recursively
-                urls_to_fetch = await self._crawl_recursive(
-                    start_url=start_url,
-                    max_depth=max_depth,
-                    max_pages=max_pages,
-                    allowed_domains=allowed_domains,
-                )
-
-            # Fetch all discovered URLs
-            documents = await self._fetch_urls(urls_to_fetch)
+        crawled: Dict[str, FetchedDocument] = {}
+
+        # Check for sitemap first
+        sitemap_urls = await self._fetch_sitemap(start_url)
+
+        if sitemap_urls:
+            logger.info("Found sitemap", urls=len(sitemap_urls))
+            urls_to_fetch = list(sitemap_urls)[:max_pages]
+        else:
+            # Crawl recursively
+            urls_to_fetch = await self._crawl_recursive(
+                start_url=start_url,
+                max_depth=max_depth,
+                max_pages=max_pages,
+                allowed_domains=allowed_domains,
+                documents=crawled,
+            )
 
-            logger.info("Web crawl completed", documents=len(documents))
+        # Pages already downloaded during link discovery are reused;
+        # only the rest are fetched
+        documents = [crawled[url] for url in urls_to_fetch if url in crawled]
+        remaining = [url for url in urls_to_fetch if url not in crawled]
+        documents.extend(await self._fetch_urls(remaining))
 
-            return documents
+        logger.info("Web crawl completed", documents=len(documents))
 
-        finally:
-            await self._close_session()
+        return documents
 
     async def fetch_single(self, url: str, config: Optional[Dict] = None) -> FetchedDocument:
         """Fetch a single URL."""
         await self._init_session()
 
-        try:
-            return await self._fetch_url(url)
-        finally:
-            await self._close_session()
+        return await self._fetch_url(url)
 
     async def _init_session(self) -> None:
         """Initialize aiohttp session."""
         if self.session is None:
             timeout = aiohttp.ClientTimeout(total=30)
+            # Size the pool to the crawl's concurrency so connections stay
+            # alive between pages instead of being re-established
+            connector = aiohttp.TCPConnector(
+                limit=self.concurrent_requests * 4,
+                limit_per_host=self.concurrent_requests,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True,
+            )
+            # aiohttp advertises and decodes gzip/deflate itself, and brotli
+            # when the "crawler" extra's speedups are installed
             self.session = aiohttp.ClientSession(
                 timeout=timeout,
+                connector=connector,
                 headers={"User-Agent": self.user_agent},
             )
 
@@ -140,31 +177,77 @@ class WebCrawler(BaseFetcher):
         """Close crawler and cleanup resources."""
         await self._close_session()
 
+    async def __aenter__(self) -> "WebCrawler":
+        await self._init_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
     async def _fetch_sitemap(self, base_url: str) -> Set[str]:
-        """Try to fetch and parse sitemap.xml."""
+        """Try to fetch and parse sitemap.xml, following sitemap indexes."""
         await self._init_session()
 
-        parsed = urlparse(base_url)
+        parsed = parse_url(base_url)
         sitemap_url = f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"
 
+        if etree is None:
+            logger.debug("lxml not installed, skipping sitemap", url=sitemap_url)
+            return set()
+
+        urls: Set[str] = set()
+        await self._read_sitemap(sitemap_url, urls, seen=set())
+
+        return urls
+
+    async def _read_sitemap(self, sitemap_url: str, urls: Set[str], seen: Set[str]) -> None:
+        """Stream one sitemap into ``urls`` and recurse into nested sitemaps."""
+        if sitemap_url in seen:
+            return
+        seen.add(sitemap_url)
+
+        nested: List[str] = []
+
         try:
             async with self.session.get(sitemap_url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    soup = BeautifulSoup(content, "xml")
-
-                    # Extract URLs from sitemap
-                    urls = set()
-                    for loc in soup.find_all("loc"):
-                        url = loc.text.strip()
-                        if url:
-                            urls.add(url)
-
-                    return urls
+                if response.status != 200:
+                    return
+
+                # Parse while downloading so large sitemaps are never held
+                # in memory as a whole
+                parser = etree.XMLPullParser(events=("end",))
+                async for chunk in response.content.iter_chunked(_SITEMAP_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    self._collect_sitemap_locs(parser, urls, nested)
+                parser.close()
+                self._collect_sitemap_locs(parser, urls, nested)
         except Exception as e:
-            logger.debug("Failed to fetch sitemap", error=str(e))
-
-        return set()
+            logger.debug("Failed to fetch sitemap", url=sitemap_url, error=str(e))
+
+        for nested_url in nested:
+            await self._read_sitemap(nested_url, urls, seen)
+
+    def _collect_sitemap_locs(self, parser, urls: Set[str], nested: List[str]) -> None:
+        """Drain parser events, sorting ``<loc>`` entries into pages and sitemaps."""
+        for _, elem in parser.read_events():
+            tag = elem.tag.rpartition("}")[2]
+
+            if tag == "loc":
+                loc = (elem.text or "").strip()
+                if not loc:
+                    continue
+                parent = elem.getparent()
+                if parent is not None and parent.tag.rpartition("}")[2] == "sitemap":
+                    nested.append(loc)
+                elif self._should_crawl(loc, []):
+                    urls.add(loc)
+
+            elif tag in ("url", "sitemap"):
+                # Free the finished entry and any siblings already visited
+                elem.clear()
+                parent = elem.getparent()
+                while parent is not None and elem.getprevious() is not None:
+                    del parent[0]
 
     async def _crawl_recursive(
         self,
@@ -172,13 +255,20 @@ class WebCrawler(BaseFetcher):
         max_depth: int,
         max_pages: int,
         allowed_domains: List[str],
+        documents: Optional[Dict[str, FetchedDocument]] = None,
     ) -> List[str]:
-        """Recursively crawl URLs."""
-        to_visit = [(start_url, 0)]  # (url, depth)
+        """
+        Recursively crawl URLs.
+
+        If ``documents`` is given, every page downloaded for link discovery
+        is stored in it by URL so callers need not fetch it again.
+        """
+        to_visit = deque([(start_url, 0)])  # (url, depth)
         discovered = {start_url}
+        oversized: Set[str] = set()
 
         while to_visit and len(discovered) < max_pages:
-            url, depth = to_visit.pop(0)
+            url, depth = to_visit.popleft()
 
             if url in self.visited_urls:
                 continue
@@ -194,12 +284,34 @@ class WebCrawler(BaseFetcher):
                     if response.status != 200:
                         continue
 
-                    content_type = response.headers.get("Content-Type", "")
-                    if "text/html" not in content_type:
+                    # Skip oversized pages before reading the body when the
+                    # server declares a length, and before parsing otherwise
+                    if (response.content_length or 0) > self.max_body_bytes:
+                        oversized.add(url)
+                        continue
+
+                    content = await response.read()
+                    if len(content) > self.max_body_bytes:
+                        oversized.add(url)
                         continue
 
-                    html = await response.text()
-                    soup = BeautifulSoup(html, "html.parser")
+                    mime_type = self._parse_mime_type(response)
+
+                    soup = None
+                    title = None
+                    if "text/html" in mime_type:
+                        html = self._decode_body(response, content)
+                        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_PAGE_STRAINER)
+                        if soup.title:
+                            title = soup.title.string
+
+                    if documents is not None:
+                        documents[url] = self._build_document(
+                            url, response, content, mime_type, title
+                        )
+
+                    if soup is None:
+                        continue
 
                     # Extract links
                     for link in soup.find_all("a", href=True):
@@ -221,11 +333,14 @@ class WebCrawler(BaseFetcher):
                 logger.warning("Failed to crawl URL", url=url, error=str(e))
                 continue
 
-        return list(discovered)
+        if oversized:
+            logger.info("Skipped oversized pages", count=len(oversized))
+
+        return [url for url in discovered if url not in oversized]
 
     def _should_crawl(self, url: str, allowed_domains: List[str]) -> bool:
         """Check if URL should be crawled."""
-        parsed = urlparse(url)
+        parsed = parse_url(url)
 
         # Skip non-http(s) URLs
         if parsed.scheme not in ("http", "https"):
@@ -263,34 +378,77 @@ class WebCrawler(BaseFetcher):
         return documents
 
     async def _fetch_url(self, url: str) -> FetchedDocument:
-        """Fetch a single URL."""
+        """
+        Fetch a single URL.
+
+        Raises:
+            DocVectorException: If the body is larger than max_body_bytes
+        """
         async with self.session.get(url) as response:
             response.raise_for_status()
 
+            # Reject oversized pages before reading the body when the server
+            # declares a length, and before parsing otherwise
+            if (response.content_length or 0) > self.max_body_bytes:
+                raise self._oversized_error(url)
+
             content = await response.read()
-            content_type = response.headers.get("Content-Type", "text/html")
+            if len(content) > self.max_body_bytes:
+                raise self._oversized_error(url)
 
-            # Parse content type
-            mime_type = content_type.split(";")[0].strip()
+            mime_type = self._parse_mime_type(response)
 
             # Extract title from HTML
             title = None
             if "text/html" in mime_type:
                 try:
-                    html = content.decode("utf-8", errors="ignore")
-                    soup = BeautifulSoup(html, "html.parser")
+                    html = self._decode_body(response, content)
+                    soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_TITLE_STRAINER)
                     if soup.title:
                         title = soup.title.string
                 except Exception:
                     pass
 
-            return FetchedDocument(
-                url=url,
-                content=content,
-                mime_type=mime_type,
-                title=title,
-                metadata={
-                    "status_code": response.status,
-                    "headers": dict(response.headers),
-                },
-            )
+            return self._build_document(url, response, content, mime_type, title)
+
+    def _oversized_error(self, url: str) -> DocVectorException:
+        """Build the error for a page larger than max_body_bytes."""
+        return DocVectorException(
+            code="DOCUMENT_TOO_LARGE",
+            message=f"Page exceeds {self.max_body_bytes} bytes: {url}",
+            details={"url": url, "max_body_bytes": self.max_body_bytes},
+        )
+
+    @staticmethod
+    def _parse_mime_type(response: aiohttp.ClientResponse) -> str:
+        """Get the MIME type from a response's Content-Type header."""
+        content_type = response.headers.get("Content-Type", "text/html")
+        return content_type.split(";")[0].strip()
+
+    @staticmethod
+    def _decode_body(response: aiohttp.ClientResponse, content: bytes) -> str:
+        """Decode a body using the declared charset, without charset sniffing."""
+        try:
+            return content.decode(response.charset or "utf-8", errors="ignore")
+        except LookupError:
+            return content.decode("utf-8", errors="ignore")
+
+    @staticmethod
+    def _build_document(
+        url: str,
+        response: aiohttp.ClientResponse,
+        content: bytes,
+        mime_type: str,
+        title: Optional[str],
+    ) -> FetchedDocument:
+        """Build a fetched document from a response and its body."""
+        return FetchedDocument(
+            url=url,
+            content=content,
+            mime_type=mime_type,
+            title=title,
+            metadata={
+                "status_code": response.status,
+                "headers": dict(response.headers),
+            },
+        )
@@ -9,7 +9,6 @@ Provides tools for:
 """
 
 import asyncio
-import json
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
@@ -19,6 +18,7 @@ from docvector.services.library_service import LibraryService
 from docvector.services.qa_service import QAService
 from docvector.services.search_service import SearchService
 from docvector.utils.context_proof import ContextProof
+from docvector.utils.json_utils import dumps, loads
 from docvector.utils.token_utils import TokenLimiter
 
 logger = get_logger(__name__)
@@ -409,7 +409,7 @@ class MCPServer:
                         }
                     }
 
-                return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+                return {"content": [{"type": "text", "text": dumps(result, indent=True)}]}
 
             else:
                 return {"error": {"code": -32601, "message": f"Unknown method: {method}"}}
@@ -1007,17 +1007,26 @@ async def run_stdio_server():
             if not line:
                 break
 
-            request = json.loads(line)
+            request = loads(line)
             response = await server.handle_request(request)
 
-            sys.stdout.write(json.dumps(response) + "\n")
-            sys.stdout.flush()
+            _write_stdio_message(response)
 
         except Exception as e:
             logger.error(f"Error in stdio server: {e}")
             error_response = {"error": {"code": -32603, "message": str(e)}}
-            sys.stdout.write(json.dumps(error_response) + "\n")
-            sys.stdout.flush()
+            _write_stdio_message(error_response)
+
+
+def _write_stdio_message(message: Dict[str, Any]) -> None:
+    """Write one JSON-RPC message line to stdout."""
+    import sys
+
+    # Written as UTF-8 bytes: unlike json.dumps, the output is not ASCII-only,
+    # and the text layer's encoding may not be UTF-8 on every platform
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps(message).encode() + b"\n")
+    sys.stdout.buffer.flush()
 
 
 async def run_http_server(host: str = "0.0.0.0", port: int = 8001):
@@ -1035,14 +1044,15 @@ async def run_http_server(host: str = "0.0.0.0", port: int = 8001):
     async def handle_mcp(request: web.Request) -> web.Response:
         """Handle MCP HTTP requests."""
         try:
-            body = await request.json()
+            body = await request.json(loads=loads)
             response = await server.handle_request(body)
-            return web.json_response(response)
+            return web.json_response(response, dumps=dumps)
         except Exception as e:
             logger.error(f"Error handling MCP request: {e}")
             return web.json_response(
                 {"error": {"code": -32603, "message": str(e)}},
                 status=500,
+                dumps=dumps,
             )
 
     app = web.Application()
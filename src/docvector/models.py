@@ -112,6 +112,10 @@ class Document(Base):
     source = relationship("Source", back_populates="documents")
     chunks = relationship("Chunk", back_populates="document", cascade="all, delete-orphan")
 
+    # Ingestion inserts documents without a follow-up refresh; fetch server
+    # defaults via RETURNING in the INSERT itself
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<Document(id={self.id}, title={self.title}, status={self.status})>"
 
@@ -154,6 +158,10 @@ class Chunk(Base):
     # Relationships
     document = relationship("Document", back_populates="chunks")
 
+    # Chunks are inserted in bulk; fetch server defaults via RETURNING in the
+    # same INSERT instead of a refresh query per row
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<Chunk(id={self.id}, document_id={self.document_id}, index={self.index})>"
 
@@ -12,6 +12,10 @@ logger = get_logger(__name__)
 # Pre-compiled regex pattern for section splitting
 _SECTION_PATTERN = re.compile(r"\n(?=#{1,6}\s)|(?:\n\n+)")
 
+# Non-empty lines of a section, matched in place so paragraph text can be
+# sliced from the section instead of split out and joined back together
+_LINE_PATTERN = re.compile(r"[^\n]+")
+
 
 class SemanticChunker(BaseChunker):
     """
@@ -96,22 +100,36 @@ class SemanticChunker(BaseChunker):
                 )
             ]
 
-        # Split large sections into paragraphs
-        paragraphs = [p.strip() for p in section.split("\n") if p.strip()]
-
         chunks: List[TextChunk] = []
         current_chunk: List[str] = []
         current_size = 0
         chunk_start = start_offset
 
-        for para in paragraphs:
+        # Span of the current chunk's lines within the section. While every
+        # line is already stripped and the lines are adjacent, the chunk text
+        # is a single slice of the section rather than a join of its lines.
+        span_start = span_end = 0
+        contiguous = True
+
+        def _chunk_text() -> str:
+            if contiguous:
+                return section[span_start:span_end]
+            return "\n".join(current_chunk)
+
+        # Split large sections into paragraphs
+        for match in _LINE_PATTERN.finditer(section):
+            line = match.group()
+            para = line.strip()
+            if not para:
+                continue
             para_size = len(para)
+            clean = para_size == len(line)
 
             # If single paragraph is too large, split it by fixed size
             if para_size > max_size:
                 # First, save any accumulated chunk
                 if current_chunk:
-                    chunk_text = "\n".join(current_chunk)
+                    chunk_text = _chunk_text()
                     chunks.append(
                         TextChunk(
                             content=chunk_text,
@@ -146,7 +164,7 @@ class SemanticChunker(BaseChunker):
             # If adding this paragraph exceeds max size
             if current_size + para_size > max_size and current_chunk:
                 # Save current chunk
-                chunk_text = "\n".join(current_chunk)
+                chunk_text = _chunk_text()
                 chunks.append(
                     TextChunk(
                         content=chunk_text,
@@ -161,13 +179,21 @@ class SemanticChunker(BaseChunker):
                 current_chunk = [para]
                 current_size = para_size
                 chunk_start = chunk_start + len(chunk_text) + 1
+                span_start, span_end = match.span()
+                contiguous = clean
             else:
+                if not current_chunk:
+                    span_start = match.start()
+                    contiguous = clean
+                else:
+                    contiguous = contiguous and clean and match.start() == span_end + 1
+                span_end = match.end()
                 current_chunk.append(para)
                 current_size += para_size + 1  # +1 for newline
 
         # Add final chunk
         if current_chunk:
-            chunk_text = "\n".join(current_chunk)
+            chunk_text = _chunk_text()
             chunks.append(
                 TextChunk(
                     content=chunk_text,
@@ -6,6 +6,10 @@ from typing import List, Optional
 
 from bs4 import BeautifulSoup
 
+# Snippets only come from <pre> and <script> elements; pages with neither
+# need no parse at all
+_CODE_TAG_PATTERN = re.compile(r"<(?:pre|script)\b", re.IGNORECASE)
+
 
 @dataclass
 class CodeSnippet:
@@ -66,6 +70,9 @@ class CodeExtractor:
         Returns:
             List of CodeSnippet objects
         """
+        if not _CODE_TAG_PATTERN.search(html_content):
+            return []
+
         soup = BeautifulSoup(html_content, "html.parser")
         snippets = []
 
@@ -3,9 +3,9 @@
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import Optional
+from typing import Iterator, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
 
 from docvector.core import get_logger
 from docvector.utils import clean_text
@@ -17,6 +17,9 @@ logger = get_logger(__name__)
 # Shared thread pool for CPU-intensive parsing operations
 _thread_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="html-parser")
 
+# String node types that count as text, matching BeautifulSoup's get_text()
+_TEXT_TYPES = (NavigableString, CData)
+
 
 class HTMLParser(BaseParser):
     """Parse HTML documents."""
@@ -66,14 +69,12 @@ class HTMLParser(BaseParser):
             # Fallback to html.parser if lxml not available
             soup = BeautifulSoup(content, "html.parser")
 
-        # Extract metadata first (before removing elements)
         title = self._extract_title(soup)
         language = self._extract_language(soup)
         metadata = self._extract_metadata(soup, url)
 
-        # Remove unwanted elements
-        for tag in soup.find_all(self.REMOVE_TAGS):
-            tag.decompose()
+        # Unwanted elements (REMOVE_TAGS) are skipped during text extraction
+        # rather than decomposed out of the tree first
 
         # Try to find main content area
         main_content = self._find_main_content(soup)
@@ -86,7 +87,7 @@ class HTMLParser(BaseParser):
             if body:
                 text = self._extract_text_from_element(body)
             else:
-                text = soup.get_text(separator="\n", strip=True)
+                text = self._extract_text_from_element(soup)
 
         return ParsedDocument(
             content=clean_text(text),
@@ -113,10 +114,15 @@ class HTMLParser(BaseParser):
         ]
 
         for tag, attrs in selectors:
-            element = soup.find(tag, attrs) if attrs else soup.find(tag)
+            # REMOVE_TAGS are still in the tree, so skip matches inside them
+            # to get the first match that would have survived removing them
+            element = next(
+                (match for match in soup.find_all(tag, attrs) if not self._is_removed(match)),
+                None,
+            )
             if element:
                 # Verify it has substantial content
-                text_length = len(element.get_text(strip=True))
+                text_length = sum(len(text) for text in self._iter_text(element))
                 if text_length > 200:  # Minimum content threshold
                     return element
 
@@ -124,8 +130,29 @@ class HTMLParser(BaseParser):
 
     def _extract_text_from_element(self, element) -> str:
         """Extract text from an element, preserving structure."""
-        # Use get_text with newline separator - much faster than iterating descendants
-        return element.get_text(separator="\n", strip=True)
+        return "\n".join(self._iter_text(element))
+
+    def _iter_text(self, element) -> Iterator[str]:
+        """Yield stripped text under an element, skipping REMOVE_TAGS subtrees."""
+        stack = [iter(element.children)]
+        while stack:
+            for node in stack[-1]:
+                if isinstance(node, Tag):
+                    if node.name not in self.REMOVE_TAGS:
+                        stack.append(iter(node.children))
+                        break
+                elif type(node) in _TEXT_TYPES:
+                    text = node.strip()
+                    if text:
+                        yield text
+            else:
+                stack.pop()
+
+    def _is_removed(self, element) -> bool:
+        """Check whether an element sits inside one of the REMOVE_TAGS."""
+        return element.name in self.REMOVE_TAGS or any(
+            parent.name in self.REMOVE_TAGS for parent in element.parents
+        )
 
     def can_parse(self, mime_type: str, file_extension: Optional[str] = None) -> bool:
         """Check if can parse HTML."""
@@ -4,6 +4,26 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+# Pre-compiled regex patterns, applied to every candidate during reranking
+_WORD_PATTERN = re.compile(r'\w+')
+_CODE_BLOCK_PATTERN = re.compile(r'```|<code>|<pre>')
+_IMPORT_PATTERN = re.compile(
+    r'(?:^|\n)(?:import|from|require|include|using)\s+', re.MULTILINE | re.IGNORECASE
+)
+_DEFINITION_PATTERN = re.compile(r'(?:^|\n)(?:def|function|fn|func|class|public|private)\s+')
+_COMMENT_PATTERN = re.compile(r'(?://|#|/\*|\"\"\"|\'\'\')')
+_CODE_STRUCTURE_PATTERN = re.compile(r'[{}\[\]()\;]')
+_HEADING_PATTERN = re.compile(r'^#{1,6}\s+\w+', re.MULTILINE)
+_MAIN_GUARD_PATTERN = re.compile(r'if\s+__name__\s*==\s*[\'"]__main__[\'"]')
+_INSTANTIATION_PATTERN = re.compile(r'new\s+\w+|=\s*\w+\(')
+_GETTING_STARTED_IMPORT_PATTERN = re.compile(r'(?:^|\n)(?:import|from|require)\s+', re.MULTILINE)
+_CODE_INDICATOR_PATTERNS = (
+    re.compile(r'[{}\[\]();]'),  # Brackets and parens
+    re.compile(r'(?:def|function|class|var|let|const)\s+\w+'),  # Declarations
+    re.compile(r'(?:if|for|while|return|import)\s+'),  # Keywords
+    re.compile(r'[=<>!+\-*/]+'),  # Operators
+)
+
 
 @dataclass
 class RankedResult:
@@ -158,8 +178,8 @@ class MultiStageReranker:
             score += 0.4
 
         # Word overlap
-        query_words = set(re.findall(r'\w+', query_lower))
-        content_words = set(re.findall(r'\w+', content_lower))
+        query_words = set(_WORD_PATTERN.findall(query_lower))
+        content_words = set(_WORD_PATTERN.findall(content_lower))
 
         if query_words:
             overlap = len(query_words & content_words) / len(query_words)
@@ -188,26 +208,22 @@ class MultiStageReranker:
             Code quality score (0-1)
         """
         # Check if content contains code
-        has_code_block = bool(re.search(r'```|<code>|<pre>', content))
+        has_code_block = bool(_CODE_BLOCK_PATTERN.search(content))
         if not has_code_block and not self._looks_like_code(content):
             return 0.0
 
         score = 0.0
 
         # Has imports/requires
-        if re.search(
-            r'(?:^|\n)(?:import|from|require|include|using)\s+',
-            content,
-            re.MULTILINE | re.IGNORECASE,
-        ):
+        if _IMPORT_PATTERN.search(content):
             score += 0.2
 
         # Has function definitions
-        if re.search(r'(?:^|\n)(?:def|function|fn|func|class|public|private)\s+', content):
+        if _DEFINITION_PATTERN.search(content):
             score += 0.2
 
         # Has comments
-        if re.search(r'(?://|#|/\*|\"\"\"|\'\'\')', content):
+        if _COMMENT_PATTERN.search(content):
             score += 0.2
 
         # Reasonable length
@@ -218,7 +234,7 @@ class MultiStageReranker:
             score += 0.1
 
         # Has typical code structure
-        if re.search(r'[{}\[\]()\;]', content):
+        if _CODE_STRUCTURE_PATTERN.search(content):
             score += 0.2
 
         return min(score, 1.0)
@@ -242,7 +258,7 @@ class MultiStageReranker:
             score += 0.3
 
         # Has headings/structure
-        if re.search(r'^#{1,6}\s+\w+', content, re.MULTILINE):
+        if _HEADING_PATTERN.search(content):
             score += 0.2
 
         # Proper spacing (not wall of text)
@@ -342,15 +358,15 @@ class MultiStageReranker:
                 break
 
         # Has main/entry point
-        if re.search(r'if\s+__name__\s*==\s*[\'"]__main__[\'"]', content):
+        if _MAIN_GUARD_PATTERN.search(content):
             score += 0.2
 
         # Has basic instantiation
-        if re.search(r'new\s+\w+|=\s*\w+\(', content):
+        if _INSTANTIATION_PATTERN.search(content):
             score += 0.2
 
         # Has import statements (common in getting started)
-        if re.search(r'(?:^|\n)(?:import|from|require)\s+', content, re.MULTILINE):
+        if _GETTING_STARTED_IMPORT_PATTERN.search(content):
             score += 0.2
 
         return min(score, 1.0)
@@ -366,16 +382,9 @@ class MultiStageReranker:
             True if content looks like code
         """
         # Has typical code patterns
-        code_indicators = [
-            r'[{}\[\]();]',  # Brackets and parens
-            r'(?:def|function|class|var|let|const)\s+\w+',  # Declarations
-            r'(?:if|for|while|return|import)\s+',  # Keywords
-            r'[=<>!+\-*/]+',  # Operators
-        ]
-
         indicator_count = 0
-        for pattern in code_indicators:
-            if re.search(pattern, content):
+        for pattern in _CODE_INDICATOR_PATTERNS:
+            if pattern.search(content):
                 indicator_count += 1
 
         return indicator_count >= 2
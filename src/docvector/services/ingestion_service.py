@@ -1,21 +1,40 @@
 """Ingestion service - orchestrates document ingestion."""
 
+import asyncio
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Sequence, Tuple, cast
+from uuid import UUID, uuid4
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from docvector.core import DocVectorException, get_logger, settings
 from docvector.db.repositories import ChunkRepository, DocumentRepository
 from docvector.embeddings import BaseEmbedder, EmbeddingCache, LocalEmbedder, OpenAIEmbedder
-from docvector.ingestion import Crawl4AICrawler
+from docvector.ingestion import Crawl4AICrawler, FetchedDocument
 from docvector.models import Chunk, Document, Source
 from docvector.processing import ProcessingPipeline
-from docvector.utils import compute_text_hash
-from docvector.vectordb import QdrantVectorDB
+from docvector.processing.chunkers import TextChunk
+from docvector.processing.parsers import ParsedDocument
+from docvector.utils import bulk_uuid4, compute_content_hash, compute_fast_digest
+from docvector.vectordb import BaseVectorDB, QdrantVectorDB
 
 logger = get_logger(__name__)
 
+# Chunks buffered across pages during ingest_source before they are embedded
+# and sent to the vector DB together
+_VECTOR_FLUSH_SIZE = 1000
+
+# New pages parsed in the background ahead of the one being stored; enough to
+# keep the HTML parser thread pool busy without holding every parse in memory
+_PARSE_AHEAD = 8
+
+# Minimum seconds between ingest_source progress log lines; pages are
+# reported in aggregate rather than with a log line each
+_PROGRESS_INTERVAL = 2.0
+
 
 class IngestionService:
     """
@@ -39,7 +58,16 @@ class IngestionService:
         self.pipeline: Optional[ProcessingPipeline] = None
         self.embedder: Optional[BaseEmbedder] = None
         self.embedding_cache: Optional[EmbeddingCache] = None
-        self.vectordb: Optional[QdrantVectorDB] = None
+        self.vectordb: Optional[BaseVectorDB] = None
+
+        # Set while a freshly created collection has indexing deferred
+        self._bulk_loading = False
+
+        # (id, text, payload) points awaiting embedding; None when unbuffered
+        self._vector_buffer: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None
+
+        # Documents with chunks in the vector buffer
+        self._buffered_documents: List[Document] = []
 
     async def initialize(self) -> None:
         """Initialize components."""
@@ -68,17 +96,21 @@ class IngestionService:
             await self.embedding_cache.initialize()
 
         # Initialize vector DB
-        self.vectordb = QdrantVectorDB()
+        self.vectordb = BaseVectorDB(QdrantVectorDB())
         await self.vectordb.initialize()
 
         # Ensure collection exists
         collection_exists = await self.vectordb.collection_exists(settings.qdrant_collection)
         if not collection_exists:
             logger.info("Creating Qdrant collection", collection=settings.qdrant_collection)
+            # A new collection is filled by the first ingest, so build its
+            # HNSW graph once afterwards instead of on every upsert
             await self.vectordb.create_collection(
                 collection_name=settings.qdrant_collection,
                 vector_size=self.embedder.get_dimension(),
+                bulk_load=True,
             )
+            self._bulk_loading = True
 
         logger.info("Ingestion service initialized")
 
@@ -111,9 +143,13 @@ class IngestionService:
             "fetched": 0,
             "processed": 0,
             "chunks_created": 0,
+            "duplicates": 0,
             "errors": 0,
         }
 
+        # Background parses by position in the deduplicated document list
+        parsing: Dict[int, "asyncio.Task[Tuple[ParsedDocument, List[TextChunk]]]"] = {}
+
         try:
             # Fetch documents based on source type
             if source.type == "web":
@@ -131,23 +167,98 @@ class IngestionService:
 
             stats["fetched"] = len(fetched_docs)
 
-            # Process each document
+            # Buffer chunks across documents so they are embedded in a few
+            # large batches and stored in a few large upserts, rather than
+            # one small model call and request per page
+            self._vector_buffer = []
+
+            # Sites often serve one page under several URLs; drop repeated
+            # bodies before they are hashed, looked up, parsed and embedded
+            seen_digests = set()
+            unique_docs = []
             for fetched_doc in fetched_docs:
+                digest = compute_fast_digest(fetched_doc.content)
+                if digest in seen_digests:
+                    logger.debug("Skipping duplicate content", url=fetched_doc.url)
+                    stats["duplicates"] += 1
+                    continue
+                seen_digests.add(digest)
+                unique_docs.append(fetched_doc)
+
+            # Look up every page's content hash in one query. Bodies that
+            # differ only in invalid UTF-8 hash alike and are stored once.
+            pages: Dict[str, FetchedDocument] = {}
+            for fetched_doc in unique_docs:
+                pages.setdefault(compute_content_hash(fetched_doc.content), fetched_doc)
+            content_hashes = list(pages)
+            pending_docs: List[Optional[FetchedDocument]] = list(pages.values())
+            # Raw bodies are needed only until their page is processed; keep
+            # pending_docs as their last reference so each is released as the
+            # loop below passes it, not at the end of a large crawl
+            del fetched_docs, unique_docs, pages
+            existing_docs = await self.document_repo.get_many_by_content_hash(
+                cast(UUID, source.id), content_hashes
+            )
+
+            # Database writes share one session and so run page by page;
+            # parsing new pages ahead of them overlaps the two
+            to_parse = deque(
+                index
+                for index, content_hash in enumerate(content_hashes)
+                if not self._is_completed(existing_docs.get(content_hash))
+            )
+
+            # Process each document
+            last_progress = time.monotonic()
+            for index, content_hash in enumerate(content_hashes):
+                while to_parse and len(parsing) < _PARSE_AHEAD:
+                    ahead = to_parse.popleft()
+                    parsing[ahead] = asyncio.ensure_future(
+                        self._parse_document(source, pending_docs[ahead], access_level)
+                    )
+
+                page = pending_docs[index]
+                pending_docs[index] = None
+                assert page is not None
                 try:
                     await self._process_document(
                         source=source,
-                        fetched_doc=fetched_doc,
+                        fetched_doc=page,
                         access_level=access_level,
+                        content_hash=content_hash,
+                        existing=existing_docs.get(content_hash),
+                        parsing=parsing.pop(index, None),
                     )
                     stats["processed"] += 1
                 except Exception as e:
                     logger.error(
                         "Failed to process document",
-                        url=fetched_doc.url,
+                        url=page.url,
                         error=str(e),
                     )
                     stats["errors"] += 1
 
+                if len(self._vector_buffer) >= _VECTOR_FLUSH_SIZE:
+                    failed = await self._flush_vectors()
+                    stats["processed"] -= failed
+                    stats["errors"] += failed
+
+                now = time.monotonic()
+                if now - last_progress >= _PROGRESS_INTERVAL:
+                    logger.info(
+                        "Ingestion progress",
+                        processed=stats["processed"],
+                        errors=stats["errors"],
+                        total=len(content_hashes),
+                    )
+                    last_progress = now
+
+            failed = await self._flush_vectors()
+            stats["processed"] -= failed
+            stats["errors"] += failed
+            await self._finalize_bulk_load()
+            await self._flush_vector_store()
+
             # Update source sync time
             source.last_synced_at = datetime.utcnow()
             await self.session.commit()
@@ -160,6 +271,12 @@ class IngestionService:
             logger.error("Source ingestion failed", error=str(e))
             raise
 
+        finally:
+            self._vector_buffer = None
+            self._buffered_documents.clear()
+            for task in parsing.values():
+                task.cancel()
+
     async def ingest_url(
         self,
         source: Source,
@@ -200,6 +317,8 @@ class IngestionService:
             fetched_doc=fetched_doc,
             access_level=access_level,
         )
+        await self._finalize_bulk_load()
+        await self._flush_vector_store()
 
         # Update source sync time
         source.last_synced_at = datetime.utcnow()
@@ -214,47 +333,48 @@ class IngestionService:
         source: Source,
         fetched_doc,
         access_level: str,
+        content_hash: Optional[str] = None,
+        existing: Optional[Document] = None,
+        parsing: Optional[Awaitable[Tuple[ParsedDocument, List[TextChunk]]]] = None,
     ) -> Document:
-        """Process a fetched document through the pipeline."""
+        """
+        Process a fetched document through the pipeline.
+
+        ingest_source passes the content hash and existing document it looked
+        up in bulk, and a parse it already started; otherwise both happen here.
+        """
         # Check if document already exists
-        content_hash = compute_text_hash(fetched_doc.content.decode("utf-8", errors="ignore"))
-        existing = await self.document_repo.get_by_content_hash(source.id, content_hash)
+        if content_hash is None:
+            content_hash = compute_content_hash(fetched_doc.content)
+            existing = await self.document_repo.get_by_content_hash(source.id, content_hash)
 
-        if existing and existing.status == "completed":
+        if existing is not None and self._is_completed(existing):
             logger.debug("Document already exists", url=fetched_doc.url)
             return existing
 
-        # Create or update document record
+        # Create or update document record. A new document is only staged:
+        # the flush in _process_chunks inserts it with its parsed fields
+        # and chunks, instead of an INSERT now and UPDATEs once parsed.
         if existing:
             document = existing
+            self._set_status([document], "processing")
         else:
-            document = Document(
-                source_id=source.id,
-                url=fetched_doc.url,
-                content_hash=content_hash,
-                status="processing",
-                fetched_at=datetime.utcnow(),
+            document = self.document_repo.add(
+                Document(
+                    id=uuid4(),
+                    source_id=source.id,
+                    url=fetched_doc.url,
+                    content_hash=content_hash,
+                    status="processing",
+                    fetched_at=datetime.utcnow(),
+                )
             )
-            document = await self.document_repo.create(document)
-            await self.session.flush()
 
         try:
             # Process document (parse and chunk)
-            if self.pipeline is None:
-                raise DocVectorException(
-                    code="SERVICE_NOT_INITIALIZED",
-                    message="Pipeline not initialized",
-                )
-            parsed, chunks = await self.pipeline.process(
-                content=fetched_doc.content,
-                mime_type=fetched_doc.mime_type,
-                url=fetched_doc.url,
-                metadata={
-                    "access_level": access_level,  # Add access level to metadata
-                    "source_id": str(source.id),
-                    "source_name": source.name,
-                },
-            )
+            if parsing is None:
+                parsing = self._parse_document(source, fetched_doc, access_level)
+            parsed, chunks = await parsing
 
             # Update document with parsed info
             document.title = parsed.title or fetched_doc.title
@@ -265,16 +385,11 @@ class IngestionService:
             document.chunk_count = len(chunks)
             document.processed_at = datetime.utcnow()
 
-            await self.session.flush()
-
-            # Generate embeddings and store chunks
+            # Store chunks; the document stays "processing" until its vectors
+            # are stored, which for buffered chunks is the next flush
             await self._process_chunks(document, chunks, access_level)
 
-            # Update document status
-            document.status = "completed"
-            await self.session.flush()
-
-            logger.info(
+            logger.debug(
                 "Document processed",
                 document_id=str(document.id),
                 chunks=len(chunks),
@@ -283,69 +398,69 @@ class IngestionService:
             return document
 
         except Exception as e:
-            document.status = "failed"
-            document.error_message = str(e)
+            self._set_status([document], "failed", str(e))
             await self.session.flush()
             raise
 
+    async def _parse_document(
+        self,
+        source: Source,
+        fetched_doc,
+        access_level: str,
+    ) -> Tuple[ParsedDocument, List[TextChunk]]:
+        """Parse and chunk a fetched document."""
+        if self.pipeline is None:
+            raise DocVectorException(
+                code="SERVICE_NOT_INITIALIZED",
+                message="Pipeline not initialized",
+            )
+        return await self.pipeline.process(
+            content=fetched_doc.content,
+            mime_type=fetched_doc.mime_type,
+            url=fetched_doc.url,
+            metadata={
+                "access_level": access_level,  # Add access level to metadata
+                "source_id": str(source.id),
+                "source_name": source.name,
+            },
+        )
+
+    @staticmethod
+    def _is_completed(document: Optional[Document]) -> bool:
+        """Check whether a document has already been fully ingested."""
+        return bool(document is not None and document.status == "completed")
+
+    @staticmethod
+    def _set_status(
+        documents: Sequence[Document],
+        status: str,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """Set the status of documents, replacing any earlier error message."""
+        for document in documents:
+            document.status = status
+            document.error_message = error_message
+
     async def _process_chunks(
         self,
         document: Document,
         text_chunks,
         access_level: str,
     ) -> None:
-        """Generate embeddings and store chunks."""
+        """Store chunks and queue them for embedding."""
         if not text_chunks:
+            self._set_status([document], "completed")
             return
 
-        # Prepare chunk texts for embedding
-        chunk_texts = [chunk.content for chunk in text_chunks]
-
-        # Check cache for embeddings
-        cached_embeddings = {}
-        if self.embedding_cache:
-            cached_embeddings = await self.embedding_cache.get_many(
-                texts=chunk_texts,
-                model=settings.embedding_model,
-            )
-
-        # Generate embeddings for uncached chunks
-        texts_to_embed = [text for text in chunk_texts if text not in cached_embeddings]
-
-        if texts_to_embed:
-            logger.debug("Generating embeddings", count=len(texts_to_embed))
-            if self.embedder is None:
-                raise DocVectorException(
-                    code="SERVICE_NOT_INITIALIZED",
-                    message="Embedder not initialized",
-                )
-            new_embeddings_list = await self.embedder.embed(texts_to_embed)
-
-            # Create embedding map
-            new_embeddings = dict(zip(texts_to_embed, new_embeddings_list))
-
-            # Cache new embeddings
-            if self.embedding_cache:
-                await self.embedding_cache.set_many(
-                    texts=texts_to_embed,
-                    model=settings.embedding_model,
-                    embeddings=new_embeddings_list,
-                )
-        else:
-            new_embeddings = {}
-
-        # Combine cached and new embeddings
-        all_embeddings = {**cached_embeddings, **new_embeddings}
-
-        # Create chunk records and store in vector DB
+        # Create chunk records and their vector DB points, with ids drawn in
+        # one batch rather than a uuid4() call per chunk
         chunk_models = []
-        vector_ids = []
-        vectors = []
-        payloads = []
+        points: List[Tuple[str, str, Dict[str, Any]]] = []
 
-        for _i, text_chunk in enumerate(text_chunks):
+        for chunk_id, text_chunk in zip(bulk_uuid4(len(text_chunks)), text_chunks):
             # Create chunk record
             chunk = Chunk(
+                id=chunk_id,
                 document_id=document.id,
                 index=text_chunk.index,
                 content=text_chunk.content,
@@ -353,62 +468,225 @@ class IngestionService:
                 start_char=text_chunk.start_char,
                 end_char=text_chunk.end_char,
                 metadata=text_chunk.metadata,
+                # Point ids are the chunk ids, known before insert;
+                # embedded_at is set once the vectors are stored
+                embedding_id=str(chunk_id),
                 embedding_model=settings.embedding_model,
-                embedded_at=datetime.utcnow(),
             )
             chunk_models.append(chunk)
+            points.append(
+                (
+                    str(chunk_id),
+                    text_chunk.content,
+                    {
+                        "chunk_id": str(chunk_id),
+                        "document_id": str(document.id),
+                        "source_id": str(document.source_id),
+                        "content": text_chunk.content,
+                        "title": document.title,
+                        "url": document.url,
+                        "access_level": access_level,  # Store access level for filtering
+                        "metadata": text_chunk.metadata,
+                    },
+                )
+            )
 
         # Save chunks to database
-        chunks = await self.chunk_repo.create_many(chunk_models)
-        await self.session.flush()
-
-        # Prepare vector DB data
-        for chunk in chunks:
-            embedding = all_embeddings.get(chunk.content)
-            if not embedding:
-                logger.warning("Missing embedding for chunk", chunk_id=str(chunk.id))
-                continue
+        await self.chunk_repo.create_many(chunk_models)
+
+        # Embed and store now, or leave for the next buffered flush
+        if self._vector_buffer is not None:
+            self._vector_buffer.extend(points)
+            self._buffered_documents.append(document)
+            return
+
+        stored = await self._embed_and_upsert(points)
+        await self._mark_embedded([document])
+
+        logger.debug(
+            "Chunks stored in vector DB",
+            count=stored,
+            document_id=str(document.id),
+        )
 
-            # Store embedding ID in chunk
-            chunk.embedding_id = str(chunk.id)
-
-            vector_ids.append(str(chunk.id))
-            vectors.append(embedding)
-            payloads.append(
-                {
-                    "chunk_id": str(chunk.id),
-                    "document_id": str(document.id),
-                    "source_id": str(document.source_id),
-                    "content": chunk.content,
-                    "title": document.title,
-                    "url": document.url,
-                    "access_level": access_level,  # Store access level for filtering
-                    "metadata": chunk.metadata,
-                }
+    async def _flush_vectors(self) -> int:
+        """
+        Embed and upsert all buffered chunks.
+
+        A failed flush marks the documents whose chunks were buffered as
+        failed instead of raising, so the rest of the source is still ingested.
+
+        Returns:
+            Number of documents marked failed
+        """
+        if not self._vector_buffer:
+            return 0
+
+        points = list(self._vector_buffer)
+        self._vector_buffer.clear()
+        documents = list(self._buffered_documents)
+        self._buffered_documents.clear()
+
+        try:
+            stored = await self._embed_and_upsert(points)
+        except Exception as e:
+            logger.error(
+                "Failed to store buffered chunks",
+                documents=len(documents),
+                chunks=len(points),
+                error=str(e),
             )
+            self._set_status(documents, "failed", str(e))
+            await self.session.flush()
+            return len(documents)
 
-        # Store in vector database
-        if vector_ids:
-            if self.vectordb is None:
-                raise DocVectorException(
-                    code="SERVICE_NOT_INITIALIZED",
-                    message="Vector DB not initialized",
-                )
-            await self.vectordb.upsert(
-                collection_name=settings.qdrant_collection,
-                ids=vector_ids,
-                vectors=vectors,
-                payloads=payloads,
+        await self._mark_embedded(documents)
+
+        logger.debug("Buffered chunks stored in vector DB", count=stored)
+        return 0
+
+    async def _mark_embedded(self, documents: List[Document]) -> None:
+        """Mark documents completed once the vectors of their chunks are stored."""
+        self._set_status(documents, "completed")
+        await self.chunk_repo.mark_embedded(documents, datetime.utcnow())
+
+    async def _embed_texts(self, texts: List[str]) -> Mapping[str, Sequence[float]]:
+        """
+        Get embeddings for texts, from the cache where possible.
+
+        Repeated texts (navigation, footers and other boilerplate shared by
+        many pages) are looked up and embedded once. Uncached texts are
+        embedded in one call, ordered by length so that each model batch
+        holds texts of similar size and pads little.
+
+        Args:
+            texts: Texts to embed, possibly with repeats
+
+        Returns:
+            Mapping from text to its embedding, either a cached list or a row
+            of the float32 array produced by the embedder
+        """
+        texts = list(dict.fromkeys(texts))
+
+        # Check cache for embeddings
+        cached_embeddings = {}
+        if self.embedding_cache:
+            cached_embeddings = await self.embedding_cache.get_many(
+                texts=texts,
+                model=settings.embedding_model,
             )
 
-            logger.debug(
-                "Chunks stored in vector DB",
-                count=len(vector_ids),
-                document_id=str(document.id),
+        # Generate embeddings for uncached chunks
+        texts_to_embed = sorted(
+            (text for text in texts if text not in cached_embeddings),
+            key=len,
+        )
+
+        if not texts_to_embed:
+            return cached_embeddings
+
+        logger.debug("Generating embeddings", count=len(texts_to_embed))
+        if self.embedder is None:
+            raise DocVectorException(
+                code="SERVICE_NOT_INITIALIZED",
+                message="Embedder not initialized",
+            )
+        new_embeddings = await self.embedder.embed_array(texts_to_embed)
+
+        # Cache new embeddings
+        if self.embedding_cache:
+            await self.embedding_cache.set_many(
+                texts=texts_to_embed,
+                model=settings.embedding_model,
+                embeddings=new_embeddings,
+            )
+
+        # Combine cached and new embeddings
+        return {**cached_embeddings, **dict(zip(texts_to_embed, new_embeddings))}
+
+    async def _embed_and_upsert(self, points: List[Tuple[str, str, Dict[str, Any]]]) -> int:
+        """
+        Embed (id, text, payload) points and store them in the vector DB.
+
+        Args:
+            points: Chunk points, possibly spanning many documents
+
+        Returns:
+            Number of points stored
+        """
+        if not points:
+            return 0
+
+        embeddings = await self._embed_texts([text for _, text, _ in points])
+
+        ids = []
+        rows = []
+        payloads = []
+        for point_id, text, payload in points:
+            embedding = embeddings.get(text)
+            if embedding is None or len(embedding) == 0:
+                logger.warning("Missing embedding for chunk", chunk_id=point_id)
+                continue
+
+            ids.append(point_id)
+            rows.append(embedding)
+            payloads.append(payload)
+
+        if ids:
+            # One contiguous float32 block, sliced per request by the store,
+            # instead of a Python list of floats per vector
+            vectors = np.asarray(rows, dtype=np.float32)
+            # rows are views into the embedder's array; drop them so only the
+            # stacked copy stays alive while the upsert is in flight
+            del embeddings, rows
+            await self._upsert_vectors(ids, vectors, payloads)
+
+        return len(ids)
+
+    async def _upsert_vectors(
+        self,
+        ids: List[str],
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]],
+    ) -> None:
+        """Store vector points in the configured collection."""
+        if self.vectordb is None:
+            raise DocVectorException(
+                code="SERVICE_NOT_INITIALIZED",
+                message="Vector DB not initialized",
             )
+        await self.vectordb.upsert_array(
+            collection_name=settings.qdrant_collection,
+            ids=ids,
+            vectors=vectors,
+            payloads=payloads,
+        )
+
+    async def _flush_vector_store(self) -> None:
+        """Wait until the upserts sent so far are applied.
+
+        Upserts are only acknowledged, so this runs before documents are
+        committed as completed to make their chunks searchable by then.
+        """
+        if self.vectordb is None:
+            return
+
+        await self.vectordb.flush(settings.qdrant_collection)
+
+    async def _finalize_bulk_load(self) -> None:
+        """Enable indexing on a collection created for bulk loading."""
+        if not self._bulk_loading or self.vectordb is None:
+            return
+
+        await self.vectordb.finalize_index(settings.qdrant_collection)
+        self._bulk_loading = False
 
     async def close(self) -> None:
         """Close connections."""
+        # A failed first ingest must not leave the collection unindexed
+        await self._finalize_bulk_load()
+        if self.crawler:
+            await self.crawler.close()
         if self.embedder:
             await self.embedder.close()
         if self.embedding_cache:
@@ -17,6 +17,9 @@ from docvector.models import Issue, Solution, Vote
 
 logger = get_logger(__name__)
 
+# Mapped classes of the targets votes can be cast on
+_VOTE_TARGETS = {"issue": Issue, "solution": Solution}
+
 
 class IssueService:
     """Service for Issue operations."""
@@ -72,10 +75,9 @@ class IssueService:
 
         # Handle tags
         if tags:
-            for tag_name in tags:
-                tag = await self.tag_repo.get_or_create(tag_name)
-                issue.tags.append(tag)
-                await self.tag_repo.increment_usage(tag.id)
+            tag_models = await self.tag_repo.get_or_create_many(tags)
+            issue.tags.extend(tag_models)
+            await self.tag_repo.increment_usage_many([tag.id for tag in tag_models])
 
         issue = await self.issue_repo.create(issue)
         await self.session.commit()
@@ -171,10 +173,9 @@ class IssueService:
 
             # Clear and add new tags
             issue.tags.clear()
-            for tag_name in tags:
-                tag = await self.tag_repo.get_or_create(tag_name)
-                issue.tags.append(tag)
-                await self.tag_repo.increment_usage(tag.id)
+            tag_models = await self.tag_repo.get_or_create_many(tags)
+            issue.tags.extend(tag_models)
+            await self.tag_repo.increment_usage_many([tag.id for tag in tag_models])
 
         issue.updated_at = datetime.now(timezone.utc)
         issue = await self.issue_repo.update(issue)
@@ -425,17 +426,9 @@ class IssueService:
         vote = await self.vote_repo.upsert(vote)
 
         # Update vote score on target
-        new_score = await self.vote_repo.get_vote_score(target_type, target_id)
-        if target_type == "issue":
-            issue = await self.issue_repo.get_by_id(target_id)
-            if issue:
-                issue.vote_score = new_score
-                await self.issue_repo.update(issue)
-        elif target_type == "solution":
-            solution = await self.solution_repo.get_by_id(target_id)
-            if solution:
-                solution.vote_score = new_score
-                await self.solution_repo.update(solution)
+        new_score = await self.vote_repo.refresh_score(
+            _VOTE_TARGETS[target_type], target_type, target_id
+        )
 
         await self.session.commit()
 
@@ -453,17 +446,10 @@ class IssueService:
 
         if success:
             # Update vote score on target
-            new_score = await self.vote_repo.get_vote_score(target_type, target_id)
-            if target_type == "issue":
-                issue = await self.issue_repo.get_by_id(target_id)
-                if issue:
-                    issue.vote_score = new_score
-                    await self.issue_repo.update(issue)
-            elif target_type == "solution":
-                solution = await self.solution_repo.get_by_id(target_id)
-                if solution:
-                    solution.vote_score = new_score
-                    await self.solution_repo.update(solution)
+            if target_type in _VOTE_TARGETS:
+                await self.vote_repo.refresh_score(
+                    _VOTE_TARGETS[target_type], target_type, target_id
+                )
 
             await self.session.commit()
             logger.info("Vote removed", target_type=target_type, target_id=str(target_id))
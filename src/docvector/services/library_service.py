@@ -3,7 +3,7 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from docvector.core import get_logger
@@ -189,6 +189,16 @@ class LibraryService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def count_libraries(self) -> int:
+        """
+        Count all libraries.
+
+        Returns:
+            Number of libraries
+        """
+        result = await self.db.execute(select(func.count(Library.id)))
+        return result.scalar_one()
+
     async def search_libraries(self, query: str, limit: int = 10) -> List[Library]:
         """
         Search libraries by name or description.
@@ -18,6 +18,9 @@ from docvector.models import Answer, Comment, Question, Tag, Vote
 
 logger = get_logger(__name__)
 
+# Mapped classes of the targets votes can be cast on
+_VOTE_TARGETS = {"question": Question, "answer": Answer, "comment": Comment}
+
 
 class QAService:
     """Service for Q&A operations."""
@@ -127,10 +130,9 @@ class QAService:
 
         # Handle tags
         if tags:
-            for tag_name in tags:
-                tag = await self.tag_repo.get_or_create(tag_name)
-                question.tags.append(tag)
-                await self.tag_repo.increment_usage(tag.id)
+            tag_models = await self.tag_repo.get_or_create_many(tags)
+            question.tags.extend(tag_models)
+            await self.tag_repo.increment_usage_many([tag.id for tag in tag_models])
 
         question = await self.question_repo.create(question)
         await self.session.commit()
@@ -202,10 +204,9 @@ class QAService:
 
             # Clear and add new tags
             question.tags.clear()
-            for tag_name in tags:
-                tag = await self.tag_repo.get_or_create(tag_name)
-                question.tags.append(tag)
-                await self.tag_repo.increment_usage(tag.id)
+            tag_models = await self.tag_repo.get_or_create_many(tags)
+            question.tags.extend(tag_models)
+            await self.tag_repo.increment_usage_many([tag.id for tag in tag_models])
 
         question.updated_at = datetime.now(timezone.utc)
         question = await self.question_repo.update(question)
@@ -442,17 +443,9 @@ class QAService:
         vote = await self.vote_repo.upsert(vote)
 
         # Update vote score on target
-        new_score = await self.vote_repo.get_vote_score(target_type, target_id)
-        if target_type == "question":
-            question = await self.question_repo.get_by_id(target_id)
-            if question:
-                question.vote_score = new_score
-                await self.question_repo.update(question)
-        elif target_type == "answer":
-            answer = await self.answer_repo.get_by_id(target_id)
-            if answer:
-                answer.vote_score = new_score
-                await self.answer_repo.update(answer)
+        new_score = await self.vote_repo.refresh_score(
+            _VOTE_TARGETS[target_type], target_type, target_id
+        )
 
         await self.session.commit()
 
@@ -470,19 +463,10 @@ class QAService:
 
         if success:
             # Update vote score on target
-            new_score = await self.vote_repo.get_vote_score(target_type, target_id)
-            if target_type == "question":
-                question = await self.question_repo.get_by_id(target_id)
-                if question:
-                    question.vote_score = new_score
-                    await self.question_repo.update(question)
-            elif target_type == "answer":
-                answer = await self.answer_repo.get_by_id(target_id)
-                if answer:
-                    answer.vote_score = new_score
-                    await self.answer_repo.update(answer)
-            elif target_type == "comment":
-                await self.comment_repo.update_vote_score(target_id, new_score)
+            if target_type in _VOTE_TARGETS:
+                await self.vote_repo.refresh_score(
+                    _VOTE_TARGETS[target_type], target_type, target_id
+                )
 
             await self.session.commit()
             logger.info("Vote removed", target_type=target_type, target_id=str(target_id))
@@ -34,7 +34,7 @@ class SearchService:
         logger.info("Initializing search service")
 
         # Initialize vector database
-        self.vectordb = QdrantVectorDB()
+        self.vectordb = BaseVectorDB(QdrantVectorDB())
         await self.vectordb.initialize()
 
         # Initialize embedder
@@ -87,6 +87,10 @@ class SourceService:
         """List all sources."""
         return await self.repo.list_all(limit=limit, offset=offset)
 
+    async def count_sources(self) -> int:
+        """Count all sources."""
+        return await self.repo.count()
+
     async def update_source(
         self,
         source_id: UUID,
@@ -1,6 +1,7 @@
 """Utility functions and helpers."""
 
-from .hash_utils import compute_hash, compute_text_hash
+from .hash_utils import compute_content_hash, compute_fast_digest, compute_hash, compute_text_hash
+from .id_utils import bulk_uuid4
 from .text_utils import (
     clean_text,
     count_tokens_approximate,
@@ -8,8 +9,12 @@ from .text_utils import (
     remove_html_tags,
     truncate_text,
 )
+from .url_utils import is_crawlable_url, normalize_url, parse_url
 
 __all__ = [
+    "bulk_uuid4",
+    "compute_content_hash",
+    "compute_fast_digest",
     "compute_hash",
     "compute_text_hash",
     "clean_text",
@@ -17,4 +22,7 @@ __all__ = [
     "remove_html_tags",
     "truncate_text",
     "count_tokens_approximate",
+    "is_crawlable_url",
+    "normalize_url",
+    "parse_url",
 ]
@@ -3,6 +3,11 @@
 import hashlib
 from typing import Union
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 
 def compute_hash(data: Union[str, bytes], algorithm: str = "sha256") -> str:
     """
@@ -37,3 +42,51 @@ def compute_text_hash(text: str) -> str:
         SHA256 hex digest
     """
     return compute_hash(text, algorithm="sha256")
+
+
+def compute_content_hash(content: bytes) -> str:
+    """
+    Compute the SHA256 text hash of raw UTF-8 content.
+
+    Gives the same digest as
+    ``compute_text_hash(content.decode("utf-8", errors="ignore"))`` but hashes
+    the bytes as they are whenever they are valid UTF-8, so most pages are not
+    decoded into a string and encoded back just to be hashed.
+
+    Args:
+        content: Raw document bytes
+
+    Returns:
+        SHA256 hex digest
+    """
+    if not content.isascii():
+        try:
+            content.decode("utf-8")
+        except UnicodeDecodeError:
+            # Invalid sequences are dropped before hashing, as the text hash does
+            content = content.decode("utf-8", errors="ignore").encode("utf-8")
+
+    return hashlib.sha256(content).hexdigest()
+
+
+def compute_fast_digest(data: Union[str, bytes]) -> int:
+    """
+    Compute a fast non-cryptographic 64-bit digest of data.
+
+    Meant for spotting duplicates in memory, not for persisted hashes. Uses
+    xxh3 when xxhash is installed and BLAKE2b otherwise, so digests are only
+    comparable within one process.
+
+    Args:
+        data: Data to hash (string or bytes)
+
+    Returns:
+        Digest as an unsigned 64-bit integer
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
@@ -0,0 +1,26 @@
+"""Identifier utilities."""
+
+import os
+from typing import List
+from uuid import UUID
+
+
+def bulk_uuid4(count: int) -> List[UUID]:
+    """
+    Generate random (version 4) UUIDs from a single os.urandom call.
+
+    Equivalent to calling uuid4() ``count`` times, but reads all the
+    randomness in one system call, which matters when assigning ids to
+    thousands of chunks at once.
+
+    Args:
+        count: Number of UUIDs to generate
+
+    Returns:
+        List of random UUIDs
+    """
+    if count <= 0:
+        return []
+
+    raw = os.urandom(16 * count)
+    return [UUID(bytes=raw[start:start + 16], version=4) for start in range(0, len(raw), 16)]
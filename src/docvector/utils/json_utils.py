@@ -0,0 +1,54 @@
+"""JSON encoding and decoding, with orjson when it is installed.
+
+orjson is several times faster than the stdlib json module. Both paths
+accept the same values: non-string dict keys are written as strings, as the
+stdlib does, and NumPy arrays and scalars are written as lists and numbers.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _default(value: Any) -> Any:
+    """Convert values the stdlib encoder does not handle itself."""
+    if np is not None and isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    loads = orjson.loads
+
+    def dumps(value: Any, indent: bool = False) -> str:
+        """Serialize a value to a JSON string, indented by two spaces if requested."""
+        option = _OPTIONS | orjson.OPT_INDENT_2 if indent else _OPTIONS
+        return orjson.dumps(value, option=option).decode()
+
+    def dumps_bytes(value: Any) -> bytes:
+        """Serialize a value to compact UTF-8 encoded JSON."""
+        return orjson.dumps(value, option=_OPTIONS)
+
+else:
+    loads = json.loads
+
+    def dumps(value: Any, indent: bool = False) -> str:
+        """Serialize a value to a JSON string, indented by two spaces if requested."""
+        return json.dumps(value, indent=2 if indent else None, default=_default)
+
+    def dumps_bytes(value: Any) -> bytes:
+        """Serialize a value to compact UTF-8 encoded JSON."""
+        return json.dumps(
+            value, separators=(",", ":"), ensure_ascii=False, default=_default
+        ).encode()
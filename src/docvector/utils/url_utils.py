@@ -0,0 +1,127 @@
+"""URL utilities."""
+
+from functools import lru_cache
+from typing import Tuple
+from urllib.parse import ParseResult, urlparse
+
+# Crawls see the same URLs many times (sitemap, link discovery, robots.txt
+# checks), so parsed and normalized forms are memoized
+_URL_CACHE_SIZE = 200_000
+
+# File extensions (without the dot) that never hold crawlable page content
+SKIP_EXTENSIONS = frozenset(
+    {"pdf", "png", "jpg", "jpeg", "gif", "svg", "css", "js", "ico", "woff", "woff2", "ttf", "eot"}
+)
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def parse_url(url: str) -> ParseResult:
+    """
+    Parse a URL, caching the result.
+
+    Args:
+        url: URL to parse
+
+    Returns:
+        Parsed URL components
+    """
+    return urlparse(url)
+
+
+# Characters that make urlparse do more than split the string (params,
+# userinfo, IPv6 hosts, and the whitespace it strips), so URLs containing them
+# take the urlparse path in normalize_url
+_SLOW_PATH_CHARS = frozenset(";@[]\t\r\n ")
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def normalize_url(url: str) -> str:
+    """
+    Normalize URL by removing fragments and trailing slashes.
+
+    The query string is kept, since it often carries pagination. Plain
+    http(s) URLs are normalized with string operations alone; anything else
+    goes through urlparse.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Normalized URL, or an empty string for an empty input
+    """
+    if not url:
+        return ""
+
+    if url.startswith("https://"):
+        host_start = 8
+    elif url.startswith("http://"):
+        host_start = 7
+    else:
+        return _normalize_parsed(url)
+
+    if not _SLOW_PATH_CHARS.isdisjoint(url):
+        return _normalize_parsed(url)
+
+    base, _, query = url.partition("#")[0].partition("?")
+
+    # Remove trailing slash (except for root)
+    path_start = base.find("/", host_start)
+    if path_start != -1 and path_start < len(base) - 1 and base.endswith("/"):
+        base = base[:-1]
+
+    return f"{base}?{query}" if query else base
+
+
+def _normalize_parsed(url: str) -> str:
+    """Normalize a URL via urlparse; the general case of normalize_url."""
+    parsed = parse_url(url)
+
+    # Remove fragment
+    normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+    # Remove trailing slash (except for root)
+    if normalized.endswith("/") and parsed.path != "/":
+        normalized = normalized[:-1]
+
+    if parsed.query:
+        normalized = f"{normalized}?{parsed.query}"
+
+    return normalized
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def is_crawlable_url(url: str, allowed_domains: Tuple[str, ...] = ()) -> bool:
+    """
+    Check whether a URL is worth crawling, ignoring robots.txt.
+
+    Only http(s) URLs are accepted, files with non-content extensions are
+    rejected, and if ``allowed_domains`` is non-empty the host must end with
+    one of them. This is a pure function of its arguments, so results are
+    cached per (url, allowed_domains) pair.
+
+    Args:
+        url: URL to check
+        allowed_domains: Host suffixes to accept; empty accepts any host
+
+    Returns:
+        True if the URL passes every check
+    """
+    if not url:
+        return False
+
+    parsed = parse_url(url)
+
+    # Skip non-http(s) URLs
+    if parsed.scheme not in ("http", "https"):
+        return False
+
+    # Skip common non-content extensions
+    if parsed.path.rpartition(".")[2].lower() in SKIP_EXTENSIONS:
+        return False
+
+    # Check allowed domains
+    if allowed_domains:
+        if not any(parsed.netloc.endswith(domain) for domain in allowed_domains):
+            return False
+
+    return True
@@ -14,8 +14,11 @@ from docvector.core import get_logger, settings
 
 from .base import (
     BaseVectorDB,
+    Distance,
     IVectorStore,
+    PayloadRef,
     SearchResult,
+    StoredVector,
     VectorRecord,
     VectorSearchResult,
 )
@@ -259,6 +262,9 @@ def get_vector_db(mode: Optional[str] = None) -> IVectorStore:
 __all__ = [
     # New interface (DOC-8)
     "IVectorStore",
+    "Distance",
+    "PayloadRef",
+    "StoredVector",
     "VectorRecord",
     "VectorSearchResult",
     "get_vector_db",
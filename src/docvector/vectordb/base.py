@@ -1,8 +1,13 @@
 """Base interface for vector databases."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass
@@ -10,31 +15,139 @@ class VectorSearchResult:
     """Result from vector similarity search.
 
     Attributes:
-        id: Unique identifier for the vector
+        id: Unique identifier for the vector, in the store's native type. Qdrant
+            returns integer point ids as int and UUID ids as their string form;
+            ChromaDB always returns strings.
         score: Similarity score (0-1 range for cosine similarity, higher is more similar)
         payload: Metadata dictionary stored with the vector
         vector: Optional actual vector embedding (not always returned for performance)
     """
 
-    id: str
+    id: Union[str, int]
     score: float
     payload: Dict[str, Any]
     vector: Optional[List[float]] = None
 
 
+# Backend-specific metric names accepted by Distance (Qdrant "Euclid",
+# ChromaDB "l2"/"ip")
+_DISTANCE_ALIASES = {
+    "euclid": "euclidean",
+    "l2": "euclidean",
+    "ip": "dot",
+}
+
+
+class Distance(str, Enum):
+    """Distance metric for a vector collection.
+
+    Lookups are case-insensitive and accept backend names, so
+    ``Distance("Cosine")`` and ``Distance("l2")`` resolve to
+    ``Distance.COSINE`` and ``Distance.EUCLIDEAN``. Unknown names raise
+    ValueError.
+    """
+
+    COSINE = "cosine"
+    EUCLIDEAN = "euclidean"
+    DOT = "dot"
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["Distance"]:
+        if isinstance(value, str):
+            lowered = value.lower()
+            lowered = _DISTANCE_ALIASES.get(lowered, lowered)
+            for member in cls:
+                if member.value == lowered:
+                    return member
+        return None
+
+
+class PayloadRef:
+    """Payload shared by many vector records.
+
+    Chunks of the same document usually carry identical metadata (source,
+    version, title). Wrapping that metadata in a single PayloadRef lets every
+    record point at the same dict instead of holding its own copy.
+
+    Attributes:
+        data: Metadata dictionary (treat as read-only once shared)
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"<PayloadRef(keys={sorted(self.data)})>"
+
+
+class StoredVector(Mapping):
+    """Vector and payload fetched back from a store by ``get()``.
+
+    A ``__slots__`` record is cheaper to build and smaller than a dict per
+    result. It is also a read-only Mapping over ``id``, ``vector`` and
+    ``payload``, so ``point["id"]`` and comparisons with plain dicts keep
+    working for callers written against the dict results.
+
+    Attributes:
+        id: Vector ID, in the store's native type
+        vector: Stored embedding, or None if the store did not return it
+        payload: Metadata dictionary
+    """
+
+    __slots__ = ("id", "vector", "payload")
+
+    _KEYS = ("id", "vector", "payload")
+
+    def __init__(
+        self,
+        id: Union[str, int],
+        vector: Optional[Union[List[float], "np.ndarray"]],
+        payload: Dict[str, Any],
+    ):
+        self.id = id
+        self.vector = vector
+        self.payload = payload
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return f"<StoredVector(id={self.id!r})>"
+
+
+def resolve_payload(payload: Union[Dict[str, Any], PayloadRef]) -> Dict[str, Any]:
+    """Return the plain metadata dict behind a payload or PayloadRef."""
+    if isinstance(payload, PayloadRef):
+        return payload.data
+    return payload
+
+
 @dataclass
 class VectorRecord:
     """Record to store in vector database.
 
     Attributes:
-        id: Unique identifier for the vector
-        vector: Vector embedding (list of floats)
-        payload: Metadata dictionary to store with the vector
+        id: Unique identifier for the vector. Integer ids are passed through to
+            stores that key on them natively (Qdrant point ids), which keeps
+            index keys compact; stores that only accept strings (ChromaDB)
+            convert them with str() and return string ids from search.
+        vector: Vector embedding, as a list of floats or a 1-D NumPy array
+        payload: Metadata dictionary, or a PayloadRef shared across records
     """
 
-    id: str
-    vector: List[float]
-    payload: Dict[str, Any]
+    id: Union[str, int]
+    vector: Union[List[float], "np.ndarray"]
+    payload: Union[Dict[str, Any], PayloadRef]
 
 
 class IVectorStore(ABC):
@@ -78,14 +191,19 @@ class IVectorStore(ABC):
         self,
         name: str,
         dimension: int,
-        distance_metric: str = "cosine",
+        distance_metric: Union[Distance, str] = Distance.COSINE,
+        bulk_load: bool = False,
     ) -> None:
         """Create a new collection/index.
 
         Args:
             name: Collection name (must be unique)
             dimension: Vector dimension (must match embedding model output)
-            distance_metric: Distance function - "cosine", "euclidean", or "dot"
+            distance_metric: Distance function - a Distance member or one of
+                "cosine", "euclidean", "dot"
+            bulk_load: Hint that the collection is about to be filled in bulk,
+                so index building may be deferred until finalize_index().
+                Stores that always index on write ignore it.
 
         Raises:
             ValueError: If collection already exists or invalid parameters
@@ -98,6 +216,15 @@ class IVectorStore(ABC):
         """
         pass
 
+    async def finalize_index(self, collection: str) -> None:  # noqa: B027
+        """Build the index of a collection created with bulk_load=True.
+
+        The default does nothing, for stores that index on write.
+
+        Args:
+            collection: Collection name
+        """
+
     @abstractmethod
     async def delete_collection(self, name: str) -> None:
         """Delete a collection and all its vectors.
@@ -165,7 +292,7 @@ class IVectorStore(ABC):
             records: List of VectorRecord objects to upsert
 
         Returns:
-            Count of records successfully upserted
+            Count of records accepted by the store
 
         Raises:
             ValueError: If collection doesn't exist or invalid data
@@ -174,9 +301,117 @@ class IVectorStore(ABC):
         Note:
             - All vectors in a batch must have the same dimension
             - Large batches may be split internally for performance
+            - A store may acknowledge records before they are readable (Qdrant
+              does by default). Call ``flush`` before reading them back.
         """
         pass
 
+    async def upsert_from_numpy(
+        self,
+        collection: str,
+        ids: List[str],
+        vectors: "np.ndarray",
+        payloads: List[Dict[str, Any]],
+        batch_size: int = 512,
+    ) -> int:
+        """Insert or update vectors stored in a single 2D NumPy array.
+
+        Embedding models usually return an ``(N, D)`` float32 array. Building
+        a ``VectorRecord`` per row would convert every row into a Python list
+        of floats; this method instead slices the array into ``batch_size``
+        views and hands each slice to the backend as-is.
+
+        Args:
+            collection: Collection name
+            ids: Vector IDs, one per row of ``vectors``
+            vectors: 2D array of shape ``(len(ids), dimension)``
+            payloads: Metadata dictionaries, one per row of ``vectors``
+            batch_size: Maximum number of rows sent to the backend per call
+
+        Returns:
+            Count of records accepted by the store
+
+        Raises:
+            ValueError: If input lengths don't match or collection doesn't exist
+            RuntimeError: If upsert operation fails
+
+        Note:
+            As with ``upsert``, call ``flush`` before reading the records back.
+        """
+        if not (len(ids) == len(vectors) == len(payloads)):
+            raise ValueError("ids, vectors and payloads must have the same length")
+
+        total = 0
+        for start in range(0, len(ids), batch_size):
+            batch = slice(start, start + batch_size)
+            total += await self._upsert_batch_np(
+                collection, ids[batch], vectors[batch], payloads[batch]
+            )
+        return total
+
+    async def upsert_bulk_binary(
+        self,
+        collection: str,
+        ids: Sequence[str],
+        vectors: "np.ndarray",
+        payloads: Sequence[Dict[str, Any]],
+    ) -> int:
+        """Append vectors using the backend's bulk-load path.
+
+        Intended for initial indexing of an empty or append-only collection.
+        Unlike ``upsert``, this is NOT guaranteed to update existing records:
+        backends may skip conflict detection, ignore IDs that already exist,
+        or return before the data is searchable. Use ``upsert`` when records
+        may already be present or read-after-write consistency matters.
+
+        Args:
+            collection: Collection name
+            ids: Vector IDs, one per row of ``vectors``
+            vectors: 2D array of shape ``(len(ids), dimension)``
+            payloads: Metadata dictionaries, one per row of ``vectors``
+
+        Returns:
+            Count of records submitted
+
+        Raises:
+            ValueError: If input lengths don't match or collection doesn't exist
+            RuntimeError: If the bulk load fails
+
+        Note:
+            The default implementation delegates to ``upsert_from_numpy``.
+        """
+        return await self.upsert_from_numpy(collection, list(ids), vectors, list(payloads))
+
+    async def flush(self, collection: Optional[str] = None) -> None:  # noqa: B027
+        """Wait until previously accepted writes have been applied.
+
+        Stores that acknowledge upserts before applying them override this;
+        the default does nothing, for stores whose writes are applied by the
+        time upsert returns.
+
+        Args:
+            collection: Collection to wait on; if None, only client-side
+                queues are drained
+        """
+
+    async def _upsert_batch_np(
+        self,
+        collection: str,
+        ids: List[str],
+        vectors: "np.ndarray",
+        payloads: List[Dict[str, Any]],
+    ) -> int:
+        """Upsert one contiguous slice of a NumPy batch.
+
+        The default implementation falls back to ``upsert``. Backends that can
+        consume arrays directly should override this.
+        """
+        records = [
+            VectorRecord(id=id_, vector=vector.tolist(), payload=payload)
+            for id_, vector, payload in zip(ids, vectors, payloads)
+        ]
+        return await self.upsert(collection, records)
+
     @abstractmethod
     async def search(
         self,
@@ -185,6 +420,7 @@ class IVectorStore(ABC):
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
         score_threshold: Optional[float] = None,
+        with_payload: Union[bool, Sequence[str]] = True,
     ) -> List[VectorSearchResult]:
         """Search for similar vectors.
 
@@ -194,6 +430,9 @@ class IVectorStore(ABC):
             limit: Maximum number of results to return (default: 10)
             filters: Optional metadata filters (e.g., {"source": "react", "type": "docs"})
             score_threshold: Minimum similarity score (0-1 range for cosine)
+            with_payload: True for the full payload, False for none, or the
+                payload keys to return. Payloads often dominate response size,
+                so callers ranking on id and score alone should pass False.
 
         Returns:
             List of VectorSearchResult ordered by similarity (highest first)
@@ -219,6 +458,7 @@ class IVectorStore(ABC):
         collection: str,
         ids: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
+        exact_count: bool = False,
     ) -> int:
         """Delete vectors by ID or filter.
 
@@ -228,9 +468,15 @@ class IVectorStore(ABC):
             collection: Collection name
             ids: Optional list of vector IDs to delete
             filters: Optional metadata filters for deletion
+            exact_count: Count the matching vectors so the exact number
+                removed can be returned. This costs extra requests, so it is
+                off by default.
 
         Returns:
-            Count of vectors deleted
+            Count of vectors deleted when exact_count is True. Otherwise an
+            estimate: len(ids) when the ids bound the delete (an upper bound,
+            since missing ids are ignored), or -1 when the count is unknown
+            because a filter is involved.
 
         Raises:
             ValueError: If neither ids nor filters provided, or collection doesn't exist
@@ -251,15 +497,42 @@ class IVectorStore(ABC):
         """
         pass
 
+    async def get(
+        self,
+        collection: str,
+        ids: List[str],
+    ) -> List[StoredVector]:
+        """Fetch stored vectors and payloads by ID.
+
+        Args:
+            collection: Collection name
+            ids: Vector IDs to fetch
+
+        Returns:
+            List of StoredVector records, which also support dict-style
+            access to "id", "vector" and "payload". IDs that don't exist are
+            omitted.
+
+        Raises:
+            ValueError: If collection doesn't exist
+            NotImplementedError: If the backend doesn't support lookups by ID
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support get()")
+
     @abstractmethod
-    async def count(self, collection: str) -> int:
+    async def count(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
         """Count vectors in collection.
 
         Args:
             collection: Collection name
+            filters: Optional metadata filters; only matching vectors are counted
 
         Returns:
-            Total number of vectors in the collection
+            Number of vectors in the collection (matching filters, if given)
 
         Raises:
             ValueError: If collection doesn't exist
@@ -273,7 +546,7 @@ class SearchResult:
 
     def __init__(
         self,
-        id: str,
+        id: Union[str, int],
         score: float,
         payload: Dict,
         vector: Optional[List[float]] = None,
@@ -287,44 +560,84 @@ class SearchResult:
         return f"<SearchResult(id={self.id}, score={self.score:.4f})>"
 
 
-class BaseVectorDB(ABC):
-    """Abstract base class for vector database implementations (legacy class)."""
+class BaseVectorDB:
+    """Legacy vector database API backed by an IVectorStore.
+
+    Older services call the vector store with parallel ``ids``/``vectors``/
+    ``payloads`` lists and ``collection_name``/``filter`` keyword names. This
+    adapter keeps that calling convention and forwards every call to a single
+    IVectorStore implementation, so each backend only implements one interface.
+
+    Example:
+        vectordb = BaseVectorDB(QdrantVectorDB())
+        await vectordb.initialize()
+    """
+
+    def __init__(self, store: IVectorStore):
+        """
+        Initialize the adapter.
+
+        Args:
+            store: Vector store that handles all operations
+        """
+        self._store = store
+
+    @property
+    def store(self) -> IVectorStore:
+        """Underlying IVectorStore implementation."""
+        return self._store
 
-    @abstractmethod
     async def initialize(self) -> None:
-        """Initialize the vector database connection and create collections if needed."""
-        pass
+        """Initialize the vector database connection."""
+        await self._store.initialize()
 
-    @abstractmethod
     async def create_collection(
         self,
         collection_name: str,
         vector_size: int,
-        distance: str = "Cosine",
+        distance: Union[Distance, str] = Distance.COSINE,
+        bulk_load: bool = False,
     ) -> None:
         """
         Create a new collection.
 
+        Unlike IVectorStore.create_collection, an existing collection is not
+        treated as an error.
+
         Args:
             collection_name: Name of the collection
             vector_size: Dimension of vectors
-            distance: Distance metric (Cosine, Euclidean, Dot)
+            distance: Distance metric (cosine, euclidean, dot)
+            bulk_load: Defer index building until finalize_index(), on stores
+                that support it
         """
-        pass
+        try:
+            await self._store.create_collection(
+                collection_name, vector_size, distance, bulk_load=bulk_load
+            )
+        except ValueError as e:
+            if "already exists" not in str(e):
+                raise
+
+    async def finalize_index(self, collection_name: str) -> None:
+        """Build the index of a collection created with bulk_load=True."""
+        await self._store.finalize_index(collection_name)
+
+    async def flush(self, collection_name: Optional[str] = None) -> None:
+        """Wait until previously accepted writes have been applied."""
+        await self._store.flush(collection_name)
 
-    @abstractmethod
     async def collection_exists(self, collection_name: str) -> bool:
         """Check if a collection exists."""
-        pass
+        return await self._store.collection_exists(collection_name)
 
-    @abstractmethod
     async def upsert(
         self,
         collection_name: str,
         ids: List[str],
         vectors: List[List[float]],
         payloads: List[Dict],
-    ) -> None:
+    ) -> int:
         """
         Insert or update vectors.
 
@@ -333,10 +646,47 @@ class BaseVectorDB(ABC):
             ids: List of point IDs
             vectors: List of vector embeddings
             payloads: List of metadata payloads
+
+        Returns:
+            Count of records accepted by the store
+
+        Note:
+            The records may not be readable yet when this returns; call
+            ``flush`` first if they must be visible to a following search.
         """
-        pass
+        if not (len(ids) == len(vectors) == len(payloads)):
+            raise ValueError("ids, vectors and payloads must have the same length")
+
+        records = [
+            VectorRecord(id=id_, vector=vector, payload=payload)
+            for id_, vector, payload in zip(ids, vectors, payloads)
+        ]
+        return await self._store.upsert(collection_name, records)
+
+    async def upsert_array(
+        self,
+        collection_name: str,
+        ids: List[str],
+        vectors: "np.ndarray",
+        payloads: List[Dict],
+    ) -> int:
+        """
+        Insert or update vectors held in one 2D NumPy array.
+
+        Args:
+            collection_name: Name of the collection
+            ids: List of point IDs
+            vectors: Array of shape (len(ids), dimension)
+            payloads: List of metadata payloads
+
+        Returns:
+            Count of records accepted by the store
+
+        Note:
+            As with ``upsert``, call ``flush`` before reading the records back.
+        """
+        return await self._store.upsert_from_numpy(collection_name, ids, vectors, payloads)
 
-    @abstractmethod
     async def search(
         self,
         collection_name: str,
@@ -358,9 +708,18 @@ class BaseVectorDB(ABC):
         Returns:
             List of search results
         """
-        pass
+        results = await self._store.search(
+            collection_name,
+            query_vector,
+            limit=limit,
+            filters=filter,
+            score_threshold=score_threshold,
+        )
+        return [
+            SearchResult(id=r.id, score=r.score, payload=r.payload, vector=r.vector)
+            for r in results
+        ]
 
-    @abstractmethod
     async def delete(
         self,
         collection_name: str,
@@ -373,9 +732,10 @@ class BaseVectorDB(ABC):
             collection_name: Name of the collection
             ids: List of point IDs to delete
         """
-        pass
+        if not ids:
+            return
+        await self._store.delete(collection_name, ids=ids)
 
-    @abstractmethod
     async def delete_by_filter(
         self,
         collection_name: str,
@@ -388,14 +748,13 @@ class BaseVectorDB(ABC):
             collection_name: Name of the collection
             filter: Filter conditions
         """
-        pass
+        await self._store.delete(collection_name, filters=filter)
 
-    @abstractmethod
     async def get(
         self,
         collection_name: str,
         ids: List[str],
-    ) -> List[Dict]:
+    ) -> List[StoredVector]:
         """
         Get vectors by IDs.
 
@@ -406,9 +765,8 @@ class BaseVectorDB(ABC):
         Returns:
             List of points with vectors and payloads
         """
-        pass
+        return await self._store.get(collection_name, ids)
 
-    @abstractmethod
     async def count(
         self,
         collection_name: str,
@@ -424,9 +782,8 @@ class BaseVectorDB(ABC):
         Returns:
             Number of vectors
         """
-        pass
+        return await self._store.count(collection_name, filters=filter)
 
-    @abstractmethod
     async def close(self) -> None:
         """Close the database connection."""
-        pass
+        await self._store.close()
@@ -1,19 +1,101 @@
 """ChromaDB vector database implementation for local mode."""
 
 import asyncio
+import functools
+import logging
 import os
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import chromadb
+import numpy as np
 from chromadb.api import ClientAPI
+from chromadb.api.models.Collection import Collection
 from chromadb.config import Settings as ChromaSettings
 
+try:
+    from chromadb.errors import NotFoundError as _ChromaNotFoundError
+except ImportError:  # ChromaDB < 0.6 reports missing collections as ValueError
+    _ChromaNotFoundError = None
+
 from docvector.core import get_logger, settings
 
-from .base import IVectorStore, VectorRecord, VectorSearchResult
+from .base import (
+    Distance,
+    IVectorStore,
+    StoredVector,
+    VectorRecord,
+    VectorSearchResult,
+    resolve_payload,
+)
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Distance-to-score conversions keyed by ChromaDB HNSW space. Unknown spaces
+# fall back to a cosine-like 1 - distance mapping.
+_SCORE_FNS: Dict[str, Callable[[float], float]] = {
+    # Cosine distance is 1 - cosine_similarity, in [0, 2] for normalized vectors
+    "cosine": lambda d: max(0.0, min(1.0, 1.0 - d * 0.5)),
+    # L2 distance can be arbitrarily large; 1/(1+d) maps it to (0, 1]
+    "l2": lambda d: 1.0 / (1.0 + d),
+    # ChromaDB's inner product space returns the negative dot product
+    "ip": lambda d: max(0.0, min(1.0, -d)),
+}
+
+
+def _default_score(d: float) -> float:
+    return max(0.0, min(1.0, 1.0 - d))
+
+
+_ARRAY_SCORE_FNS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "cosine": lambda d: np.clip(1.0 - d * 0.5, 0.0, 1.0),
+    "l2": lambda d: np.reciprocal(1.0 + d),
+    "ip": lambda d: np.clip(-d, 0.0, 1.0),
+}
+
+
+def _default_array_score(d: np.ndarray) -> np.ndarray:
+    return np.clip(1.0 - d, 0.0, 1.0)
+
+
+def _is_missing_collection(error: Exception) -> bool:
+    """Return True if a ChromaDB error reports that a collection does not exist."""
+    if _ChromaNotFoundError is not None and isinstance(error, _ChromaNotFoundError):
+        return True
+    return isinstance(error, ValueError) and "does not exist" in str(error)
+
+
+# Fields requested from coll.query in search(). Embeddings, documents and uris
+# are left out so ChromaDB never loads or serializes them for search hits.
+_SEARCH_INCLUDE = ("metadatas", "distances")
+
+# Maximum number of collection handles kept by ChromaVectorDB
+_COLLECTION_CACHE_SIZE = 128
+
+# Map our standard metric names to ChromaDB's HNSW space names
+_METRIC_TO_CHROMA = {
+    Distance.COSINE: "cosine",
+    Distance.EUCLIDEAN: "l2",
+    Distance.DOT: "ip",
+}
+
+# Map ChromaDB's HNSW space names back to our standard metric names
+_CHROMA_TO_METRIC = {space: metric.value for metric, space in _METRIC_TO_CHROMA.items()}
+
 
 class ChromaVectorDB(IVectorStore):
     """ChromaDB implementation of IVectorStore for local mode.
@@ -46,7 +128,86 @@ class ChromaVectorDB(IVectorStore):
         """
         self.persist_directory = persist_directory or settings.chroma_persist_directory
         self._client: Optional[ClientAPI] = None
-        
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Large upserts are split into sub-batches with bounded concurrency
+        self._upsert_batch_size = max(1, settings.chroma_upsert_batch_size)
+        self._upsert_concurrency = max(1, settings.chroma_upsert_concurrency)
+        # Upserts that arrive while a collection is being written are merged
+        # into a single write by a per-collection flusher task. The lock
+        # serializes writes to a collection so overlapping ids land in order;
+        # all of this state belongs to the loop in _upsert_loop.
+        self._upsert_coalesce_s = max(0.0, settings.chroma_upsert_coalesce_ms) / 1000.0
+        self._upsert_max_coalesced = max(1, settings.chroma_upsert_max_coalesced)
+        self._upsert_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._upsert_queues: Dict[str, asyncio.Queue] = {}
+        self._upsert_flushers: Dict[str, asyncio.Task] = {}
+        self._upsert_locks: Dict[str, asyncio.Lock] = {}
+        # (collection handle, HNSW space) by name, least recently used first
+        self._collections: "OrderedDict[str, Tuple[Collection, str]]" = OrderedDict()
+        self._collections_lock = asyncio.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the dedicated executor for blocking ChromaDB calls, creating it if needed."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4),
+                thread_name_prefix="chroma",
+            )
+        return self._executor
+
+    def _run_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "asyncio.Future[T]":
+        """Run a blocking ChromaDB call on the dedicated executor.
+
+        Returns the executor future directly rather than wrapping it in a
+        coroutine, so each call skips an extra coroutine frame. Public methods
+        group their sequential ChromaDB calls into a single function so each
+        request crosses the thread boundary once.
+        """
+        return asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), functools.partial(fn, *args, **kwargs)
+        )
+
+    async def _get_collection_entry(self, name: str) -> Tuple[Collection, str]:
+        """Return a cached (collection handle, HNSW space) pair, resolving it on first access.
+
+        Resolving a handle costs SQLite round-trips inside ChromaDB, so handles
+        are kept in a bounded LRU cache and invalidated when the collection is
+        deleted or an operation reports it missing. The distance space is read
+        from the collection metadata once, when the handle is cached.
+
+        Raises:
+            ValueError: (or ChromaDB's not-found error) if the collection doesn't exist
+        """
+        entry = self._collections.get(name)
+        if entry is not None:
+            self._collections.move_to_end(name)
+            return entry
+
+        async with self._collections_lock:
+            entry = self._collections.get(name)
+            if entry is None:
+                coll = await self._run_sync(self._client.get_collection, name=name)
+                entry = self._cache_collection(name, coll)
+            return entry
+
+    async def _get_collection(self, name: str) -> Collection:
+        """Return a cached collection handle, resolving it on first access."""
+        coll, _ = await self._get_collection_entry(name)
+        return coll
+
+    def _cache_collection(self, name: str, coll: Collection) -> Tuple[Collection, str]:
+        """Store a collection handle, evicting the least recently used one if full."""
+        entry = (coll, (coll.metadata or {}).get("hnsw:space", "cosine"))
+        self._collections[name] = entry
+        self._collections.move_to_end(name)
+        if len(self._collections) > _COLLECTION_CACHE_SIZE:
+            self._collections.popitem(last=False)
+        return entry
+
+    def _invalidate_collection(self, name: str) -> None:
+        """Drop a cached collection handle."""
+        self._collections.pop(name, None)
+
     async def initialize(self) -> None:
         """Initialize ChromaDB client connection and setup.
 
@@ -61,14 +222,14 @@ class ChromaVectorDB(IVectorStore):
             Telemetry is disabled for privacy.
         """
         try:
-            await asyncio.to_thread(self._init_sync)
+            await self._run_sync(self._init_sync)
             logger.info(
                 "ChromaDB initialized successfully",
                 persist_directory=self.persist_directory,
             )
         except Exception as e:
             logger.error("Failed to initialize ChromaDB", error=str(e))
-            raise ConnectionError(f"Failed to initialize ChromaDB: {e}")
+            raise ConnectionError(f"Failed to initialize ChromaDB: {e}") from e
 
     def _init_sync(self) -> None:
         """Synchronous initialization helper.
@@ -77,7 +238,7 @@ class ChromaVectorDB(IVectorStore):
         client with privacy-preserving settings.
 
         Note:
-            This is an internal method called by initialize() via asyncio.to_thread().
+            This is an internal method called by initialize() on the executor.
         """
         os.makedirs(self.persist_directory, exist_ok=True)
         self._client = chromadb.PersistentClient(
@@ -98,26 +259,83 @@ class ChromaVectorDB(IVectorStore):
             This method is idempotent (safe to call multiple times).
             ChromaDB PersistentClient doesn't have an explicit close method,
             so we simply clear the reference to allow garbage collection.
+            The executor is shut down and recreated on next use.
         """
+        if self._upsert_loop is asyncio.get_running_loop():
+            await self.flush()
+        self._reset_upsert_state()
+
         if self._client:
             logger.info("Closing ChromaDB connection")
         self._client = None
-        
+        self._collections.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def flush(self, collection: Optional[str] = None) -> None:
+        """Wait until every queued or in-flight upsert has been written.
+
+        Upserts are already awaited by their callers; this is for shutdown paths
+        that need pending writes from other tasks to land first. ChromaDB
+        applies a write before acknowledging it, so ``collection`` needs no
+        separate barrier and every queue is drained.
+        """
+        queues = [
+            queue
+            for name, queue in self._upsert_queues.items()
+            if not self._upsert_flushers[name].done()
+        ]
+        if queues:
+            await asyncio.gather(*(queue.join() for queue in queues))
+        # Direct writes from upsert and the NumPy paths hold their
+        # collection's lock until ChromaDB has applied them
+        for lock in list(self._upsert_locks.values()):
+            async with lock:
+                pass
+
+    def _reset_upsert_state(self) -> None:
+        """Cancel the flusher tasks and drop the upsert queues and locks.
+
+        Must be called from a running event loop.
+        """
+        for task in self._upsert_flushers.values():
+            task_loop = task.get_loop()
+            # A task on a closed loop never runs again and needs no cancel
+            if task.done() or task_loop.is_closed():
+                continue
+            if task_loop is asyncio.get_running_loop():
+                task.cancel()
+            else:
+                task_loop.call_soon_threadsafe(task.cancel)
+        self._upsert_flushers.clear()
+        self._upsert_queues.clear()
+        self._upsert_locks.clear()
+        self._upsert_loop = None
+
     async def create_collection(
         self,
         name: str,
         dimension: int,
-        distance_metric: str = "cosine",
+        distance_metric: Union[Distance, str] = Distance.COSINE,
+        bulk_load: bool = False,
+        *,
+        idempotent: bool = False,
     ) -> None:
         """Create a new ChromaDB collection.
 
         Args:
-            name: Collection name (must be unique)
+            name: Collection name (must be unique unless idempotent)
             dimension: Vector dimension (stored in metadata for reference)
             distance_metric: Distance function - "cosine", "euclidean", or "dot"
+            bulk_load: Ignored; ChromaDB maintains its index on every write
+            idempotent: If True, reuse an existing collection with this name via
+                ChromaDB's atomic get_or_create_collection instead of raising.
+                An existing collection keeps its original metadata.
 
         Raises:
-            ValueError: If collection already exists
+            ValueError: If collection already exists (and not idempotent) or the
+                metric is unknown
             RuntimeError: If collection creation fails
 
         Note:
@@ -129,26 +347,26 @@ class ChromaVectorDB(IVectorStore):
         if not self._client:
             await self.initialize()
 
-        try:
-            # Map our standard metric names to ChromaDB's HNSW space names
-            metric_map = {
-                "cosine": "cosine",
-                "euclidean": "l2",
-                "dot": "ip",
-            }
-            mapped_metric = metric_map.get(distance_metric.lower(), "cosine")
+        distance = Distance(distance_metric)
+        mapped_metric = _METRIC_TO_CHROMA[distance]
 
+        try:
             logger.info(
                 "Creating ChromaDB collection",
                 collection=name,
                 dimension=dimension,
-                distance_metric=distance_metric,
+                distance_metric=distance.value,
                 chroma_space=mapped_metric,
             )
 
             # Store dimension in metadata for get_collection_info
-            await asyncio.to_thread(
-                self._client.create_collection,
+            create = (
+                self._client.get_or_create_collection
+                if idempotent
+                else self._client.create_collection
+            )
+            coll = await self._run_sync(
+                create,
                 name=name,
                 metadata={
                     "hnsw:space": mapped_metric,
@@ -156,17 +374,19 @@ class ChromaVectorDB(IVectorStore):
                 },
             )
 
+            self._cache_collection(name, coll)
+
             logger.info("ChromaDB collection created successfully", collection=name)
 
         except ValueError as e:
             # ChromaDB raises ValueError if collection exists
             if "Collection" in str(e) and "already exists" in str(e):
                 logger.warning("Collection already exists", collection=name)
-                raise ValueError(f"Collection {name} already exists")
-            raise RuntimeError(f"Failed to create collection {name}: {e}")
+                raise ValueError(f"Collection {name} already exists") from e
+            raise RuntimeError(f"Failed to create collection {name}: {e}") from e
         except Exception as e:
             logger.error("Failed to create collection", collection=name, error=str(e))
-            raise RuntimeError(f"Failed to create collection {name}: {e}")
+            raise RuntimeError(f"Failed to create collection {name}: {e}") from e
 
     async def delete_collection(self, name: str) -> None:
         """Delete a collection and all its vectors.
@@ -186,13 +406,14 @@ class ChromaVectorDB(IVectorStore):
 
         try:
             logger.info("Deleting ChromaDB collection", collection=name)
-            await asyncio.to_thread(self._client.delete_collection, name=name)
+            self._invalidate_collection(name)
+            await self._run_sync(self._client.delete_collection, name=name)
             logger.info("Collection deleted successfully", collection=name)
-        except ValueError:
-            raise ValueError(f"Collection {name} does not exist")
+        except ValueError as e:
+            raise ValueError(f"Collection {name} does not exist") from e
         except Exception as e:
             logger.error("Failed to delete collection", collection=name, error=str(e))
-            raise RuntimeError(f"Failed to delete collection {name}: {e}")
+            raise RuntimeError(f"Failed to delete collection {name}: {e}") from e
 
     async def collection_exists(self, name: str) -> bool:
         """Check if a collection exists.
@@ -207,10 +428,10 @@ class ChromaVectorDB(IVectorStore):
             await self.initialize()
 
         try:
-            # ChromaDB doesn't have explicit exists method, use list_collections
-            collections = await asyncio.to_thread(self._client.list_collections)
-            # list_collections returns list of Collection objects in newer versions
-            return any(c.name == name for c in collections)
+            # ChromaDB has no explicit exists method; a direct lookup (served from
+            # the handle cache when warm) avoids listing every collection
+            await self._get_collection(name)
+            return True
         except Exception:
             return False
 
@@ -227,29 +448,24 @@ class ChromaVectorDB(IVectorStore):
             await self.initialize()
 
         try:
-            collection = await asyncio.to_thread(self._client.get_collection, name=name)
-            if not collection:
-                return None
-
-            count = await asyncio.to_thread(collection.count)
-
-            # Try to get dimension from metadata (set during create_collection)
+            collection, chroma_space = await self._get_collection_entry(name)
             dimension = collection.metadata.get("dimension")
 
-            # If not in metadata, peek at first vector
-            if dimension is None and count > 0:
-                result = await asyncio.to_thread(collection.peek, limit=1)
-                if result and result.get("embeddings") and len(result["embeddings"]) > 0:
-                    dimension = len(result["embeddings"][0])
+            if dimension is None:
+                # Not in metadata (set during create_collection), so peek at the
+                # first vector while counting instead of after it
+                count, peek_result = await asyncio.gather(
+                    self._run_sync(collection.count),
+                    self._run_sync(collection.peek, limit=1),
+                )
+                embeddings = peek_result.get("embeddings") if peek_result else None
+                if count > 0 and embeddings is not None and len(embeddings) > 0:
+                    dimension = len(embeddings[0])
+            else:
+                count = await self._run_sync(collection.count)
 
             # Map ChromaDB space back to standard metric names
-            chroma_space = collection.metadata.get("hnsw:space", "cosine")
-            metric_reverse_map = {
-                "cosine": "cosine",
-                "l2": "euclidean",
-                "ip": "dot",
-            }
-            distance_metric = metric_reverse_map.get(chroma_space, chroma_space)
+            distance_metric = _CHROMA_TO_METRIC.get(chroma_space, chroma_space)
 
             return {
                 "name": name,
@@ -258,8 +474,10 @@ class ChromaVectorDB(IVectorStore):
                 "distance_metric": distance_metric,
             }
         except ValueError:
+            self._invalidate_collection(name)
             return None
         except Exception as e:
+            self._invalidate_collection(name)
             logger.error("Error getting collection info", collection=name, error=str(e))
             return None
 
@@ -286,34 +504,273 @@ class ChromaVectorDB(IVectorStore):
 
         Note:
             All vectors in a batch must have the same dimension as the collection.
+            An upsert to an idle collection is written straight away. Upserts
+            that arrive while the collection is being written, or within
+            ``settings.chroma_upsert_coalesce_ms`` of each other after that,
+            are merged into one ChromaDB write. Batches larger than
+            ``settings.chroma_upsert_batch_size`` are split into sub-batches, at
+            most ``settings.chroma_upsert_concurrency`` of which run on the
+            executor at once.
         """
         if not self._client:
             await self.initialize()
 
-        try:
-            coll = await asyncio.to_thread(self._client.get_collection, name=collection)
+        if not records:
+            return 0
+
+        loop = asyncio.get_running_loop()
+        lock = self._upsert_lock(collection)
+        queue = self._upsert_queues.get(collection)
+
+        # Nothing queued or being written: there is nothing to merge with, so
+        # write now rather than wait out the coalescing window
+        if (queue is None or queue.empty()) and not lock.locked():
+            async with lock:
+                return await self._write_records(collection, records)
+
+        flusher = self._upsert_flushers.get(collection)
+        if queue is None or flusher is None or flusher.done():
+            queue = asyncio.Queue()
+            self._upsert_queues[collection] = queue
+            self._upsert_flushers[collection] = loop.create_task(
+                self._flush_upserts(collection, queue, lock)
+            )
 
-            ids = [r.id for r in records]
-            embeddings = [r.vector for r in records]
-            metadatas = [r.payload for r in records]
+        future: "asyncio.Future[int]" = loop.create_future()
+        queue.put_nowait((records, future))
+        return await future
+
+    def _upsert_lock(self, collection: str) -> asyncio.Lock:
+        """Return the lock held while a collection is being written, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._upsert_loop is not loop:
+            # Queues, locks and tasks are bound to the loop that created them
+            self._reset_upsert_state()
+            self._upsert_loop = loop
+
+        lock = self._upsert_locks.get(collection)
+        if lock is None:
+            lock = self._upsert_locks[collection] = asyncio.Lock()
+        return lock
+
+    async def _flush_upserts(
+        self, collection: str, queue: asyncio.Queue, lock: asyncio.Lock
+    ) -> None:
+        """Drain one collection's upsert queue, merging requests into shared writes.
 
-            logger.debug(
-                "Upserting records to ChromaDB",
-                collection=collection,
-                count=len(records),
-            )
+        A write collects every request that arrives within the coalescing window,
+        up to the record cap. A request whose ids overlap the pending write starts
+        the next one, since ChromaDB rejects duplicate ids within a single call.
+        The collection's lock is held from collecting a write until it is done.
+        """
+        loop = asyncio.get_running_loop()
+        carry = None
+        while True:
+            first = carry if carry is not None else await queue.get()
+            carry = None
+            async with lock:
+                batch = [first]
+                batch_ids = {str(r.id) for r in first[0]}
+                total = len(first[0])
+                deadline = loop.time() + self._upsert_coalesce_s
+
+                while total < self._upsert_max_coalesced:
+                    timeout = deadline - loop.time()
+                    try:
+                        if timeout > 0:
+                            item = await asyncio.wait_for(queue.get(), timeout)
+                        else:
+                            item = queue.get_nowait()
+                    except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                        break
+
+                    item_ids = {str(r.id) for r in item[0]}
+                    if not batch_ids.isdisjoint(item_ids):
+                        carry = item
+                        break
+                    batch.append(item)
+                    batch_ids |= item_ids
+                    total += len(item[0])
+
+                await self._write_coalesced(collection, batch)
+            for _ in batch:
+                queue.task_done()
+
+    async def _write_coalesced(self, collection: str, batch: List[Any]) -> None:
+        """Write merged upsert requests and resolve each caller's future."""
+        if len(batch) == 1:
+            records, future = batch[0]
+            try:
+                result = await self._write_records(collection, records)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            return
+
+        merged = [record for records, _ in batch for record in records]
+        try:
+            await self._write_records(collection, merged)
+        except Exception:
+            # Retry requests one by one so each caller sees only its own error
+            for item in batch:
+                await self._write_coalesced(collection, [item])
+            return
+
+        for records, future in batch:
+            if not future.done():
+                future.set_result(len(records))
+
+    async def _write_records(self, collection: str, records: List[VectorRecord]) -> int:
+        """Stage records and upsert them into ChromaDB."""
+        # Stage everything in one pass: vectors go straight into a preallocated
+        # contiguous float32 block so ChromaDB does not have to box and convert
+        # each Python float itself. Ragged input fails here with numpy's
+        # ValueError rather than being reported as a missing collection.
+        n = len(records)
+        embeddings = np.empty((n, len(records[0].vector)), dtype=np.float32)
+        ids: List[Any] = [None] * n
+        metadatas: List[Any] = [None] * n
+        for i, r in enumerate(records):
+            # ChromaDB only accepts string ids
+            ids[i] = r.id if r.id.__class__ is str else str(r.id)
+            metadatas[i] = resolve_payload(r.payload)
+            embeddings[i] = r.vector
 
-            await asyncio.to_thread(
-                coll.upsert, ids=ids, embeddings=embeddings, metadatas=metadatas
-            )
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Upserting records to ChromaDB",
+                    collection=collection,
+                    count=len(records),
+                )
+
+            coll = await self._get_collection(collection)
+            batch_size = self._upsert_batch_size
+            if len(ids) <= batch_size:
+                await self._run_sync(coll.upsert, ids=ids, embeddings=embeddings, metadatas=metadatas)
+            else:
+                semaphore = asyncio.Semaphore(self._upsert_concurrency)
+
+                async def _upsert_chunk(start: int) -> None:
+                    end = start + batch_size
+                    async with semaphore:
+                        await self._run_sync(
+                            coll.upsert,
+                            ids=ids[start:end],
+                            embeddings=embeddings[start:end],
+                            metadatas=metadatas[start:end],
+                        )
+
+                await asyncio.gather(
+                    *(_upsert_chunk(start) for start in range(0, len(ids), batch_size))
+                )
 
-            logger.debug("Upsert completed", collection=collection, count=len(records))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Upsert completed", collection=collection, count=len(records))
             return len(records)
-        except ValueError:
-            raise ValueError(f"Collection {collection} does not exist")
+        except ValueError as e:
+            self._invalidate_collection(collection)
+            raise ValueError(f"Collection {collection} does not exist") from e
         except Exception as e:
+            self._invalidate_collection(collection)
             logger.error("Failed to upsert records", collection=collection, error=str(e))
-            raise RuntimeError(f"Failed to upsert records: {e}")
+            raise RuntimeError(f"Failed to upsert records: {e}") from e
+
+    async def _upsert_batch_np(
+        self,
+        collection: str,
+        ids: List[str],
+        vectors: "np.ndarray",
+        payloads: List[Dict[str, Any]],
+    ) -> int:
+        """Upsert a NumPy slice without converting rows to Python lists.
+
+        ChromaDB accepts ndarrays for embeddings, so the slice is passed through
+        directly as a contiguous float32 buffer.
+        """
+        if not self._client:
+            await self.initialize()
+
+        try:
+            embeddings = np.ascontiguousarray(vectors, dtype=np.float32)
+            metadatas = [resolve_payload(p) for p in payloads]
+
+            coll = await self._get_collection(collection)
+            async with self._upsert_lock(collection):
+                # ChromaDB only accepts string ids
+                await self._run_sync(
+                    coll.upsert,
+                    ids=[str(i) for i in ids],
+                    embeddings=embeddings,
+                    metadatas=metadatas,
+                )
+            return len(ids)
+        except Exception as e:
+            if _is_missing_collection(e):
+                self._invalidate_collection(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            if isinstance(e, ValueError):
+                raise
+            self._invalidate_collection(collection)
+            logger.error("Failed to upsert records", collection=collection, error=str(e))
+            raise RuntimeError(f"Failed to upsert records: {e}") from e
+
+    async def upsert_bulk_binary(
+        self,
+        collection: str,
+        ids: Sequence[str],
+        vectors: "np.ndarray",
+        payloads: Sequence[Dict[str, Any]],
+    ) -> int:
+        """Append vectors with Collection.add instead of upsert.
+
+        ``add`` skips the update path, so records whose IDs already exist are
+        left unchanged. Only use this to load new IDs.
+
+        Args:
+            collection: Collection name
+            ids: Vector IDs, one per row of ``vectors``
+            vectors: 2D array of shape ``(len(ids), dimension)``
+            payloads: Metadata dictionaries, one per row of ``vectors``
+
+        Returns:
+            Count of records submitted
+
+        Raises:
+            ValueError: If input lengths don't match or collection doesn't exist
+            RuntimeError: If the bulk load fails
+        """
+        if not (len(ids) == len(vectors) == len(payloads)):
+            raise ValueError("ids, vectors and payloads must have the same length")
+
+        if not self._client:
+            await self.initialize()
+
+        if len(ids) == 0:
+            return 0
+
+        try:
+            embeddings = np.ascontiguousarray(vectors, dtype=np.float32)
+            metadatas = [resolve_payload(p) for p in payloads]
+
+            coll = await self._get_collection(collection)
+            async with self._upsert_lock(collection):
+                await self._run_sync(
+                    coll.add, ids=[str(i) for i in ids], embeddings=embeddings, metadatas=metadatas
+                )
+            return len(ids)
+        except Exception as e:
+            if _is_missing_collection(e):
+                self._invalidate_collection(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            if isinstance(e, ValueError):
+                raise
+            self._invalidate_collection(collection)
+            logger.error("Bulk load failed", collection=collection, error=str(e))
+            raise RuntimeError(f"Bulk load failed: {e}") from e
 
     def _distance_to_score(self, distance: float, metric: str) -> float:
         """Convert distance to similarity score (0-1 range, higher is better).
@@ -330,24 +787,20 @@ class ChromaVectorDB(IVectorStore):
             - L2: distance is in [0, inf), score = 1 / (1 + distance)
             - IP: distance is negative dot product, score = max(0, min(1, -distance))
         """
-        if metric == "cosine":
-            # Cosine distance is 1 - cosine_similarity
-            # For normalized vectors, distance is in [0, 2]
-            # Score should be 1 when distance is 0, and 0 when distance is 2
-            return max(0.0, min(1.0, 1.0 - (distance / 2.0)))
-        elif metric == "l2":
-            # L2 distance can be arbitrarily large
-            # Use 1/(1+d) to map to [0,1] range
-            return 1.0 / (1.0 + distance)
-        elif metric == "ip":
-            # Inner product space: ChromaDB returns negative dot product
-            # For normalized vectors with positive components, this should be negative
-            # Score = -distance (to get back the dot product)
-            # Clamp to [0, 1] range
-            return max(0.0, min(1.0, -distance))
-        else:
-            # Unknown metric, assume cosine-like behavior
-            return max(0.0, min(1.0, 1.0 - distance))
+        return _SCORE_FNS.get(metric, _default_score)(distance)
+
+    def _distances_to_scores(self, distances: np.ndarray, metric: str) -> np.ndarray:
+        """Vectorized version of _distance_to_score for a whole result set.
+
+        Args:
+            distances: Distances returned by ChromaDB for one query
+            metric: Distance metric used ("cosine", "l2", or "ip")
+
+        Returns:
+            float32 array of similarity scores in 0-1 range
+        """
+        score_fn = _ARRAY_SCORE_FNS.get(metric, _default_array_score)
+        return score_fn(distances).astype(np.float32, copy=False)
 
     async def search(
         self,
@@ -356,6 +809,7 @@ class ChromaVectorDB(IVectorStore):
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
         score_threshold: Optional[float] = None,
+        with_payload: Union[bool, Sequence[str]] = True,
     ) -> List[VectorSearchResult]:
         """Search for similar vectors.
 
@@ -365,6 +819,8 @@ class ChromaVectorDB(IVectorStore):
             limit: Maximum number of results
             filters: Optional metadata filters (ChromaDB where clause)
             score_threshold: Minimum similarity score (0-1 range)
+            with_payload: True for full metadata, False to skip fetching it, or
+                the metadata keys to keep
 
         Returns:
             List of VectorSearchResult ordered by similarity (highest first)
@@ -372,82 +828,177 @@ class ChromaVectorDB(IVectorStore):
         Note:
             ChromaDB returns distances which are converted to similarity scores.
             Filtering is applied after conversion, so score_threshold works
-            correctly regardless of the underlying distance metric.
+            correctly regardless of the underlying distance metric. Results come
+            back nearest first and every score mapping is non-increasing in
+            distance, so the hits passing the threshold are always a prefix of
+            the result list: fetching more than ``limit`` candidates can never
+            surface additional qualifying hits.
         """
         if not self._client:
             await self.initialize()
 
         try:
-            coll = await asyncio.to_thread(self._client.get_collection, name=collection)
-
-            # Get the distance metric for proper distance-to-score conversion
-            chroma_space = coll.metadata.get("hnsw:space", "cosine")
-
             # ChromaDB expects where clause for metadata filtering
             where = filters if filters else None
 
-            logger.debug(
-                "Searching ChromaDB collection",
-                collection=collection,
-                limit=limit,
-                has_filters=filters is not None,
-                metric=chroma_space,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Searching ChromaDB collection",
+                    collection=collection,
+                    limit=limit,
+                    has_filters=filters is not None,
+                )
 
-            results = await asyncio.to_thread(
+            # The cached distance metric drives the distance-to-score conversion
+            coll, chroma_space = await self._get_collection_entry(collection)
+
+            results = await self._run_sync(
                 coll.query,
                 query_embeddings=[query_vector],
                 n_results=limit,
                 where=where,
-                include=["metadatas", "distances"],  # Don't include embeddings by default for performance
+                # ChromaDB validates include as a list
+                include=list(_SEARCH_INCLUDE) if with_payload is not False else ["distances"],
             )
 
-            # ChromaDB returns batch results (list of lists)
-            if not results["ids"] or len(results["ids"]) == 0:
-                return []
-
-            ids = results["ids"][0]
-            distances = results["distances"][0] if results.get("distances") else []
-            metadatas = results["metadatas"][0] if results.get("metadatas") else []
-
-            search_results = []
-            for i, id_ in enumerate(ids):
-                # Convert distance to similarity score
-                distance = distances[i] if i < len(distances) else 0.0
-                score = self._distance_to_score(distance, chroma_space)
-
-                # Apply score threshold
-                if score_threshold is not None and score < score_threshold:
-                    continue
-
-                search_results.append(
-                    VectorSearchResult(
-                        id=id_,
-                        score=score,
-                        payload=metadatas[i] if i < len(metadatas) else {},
-                        vector=None,  # Don't return vectors by default for performance
-                    )
+            search_results = self._to_search_results(results, chroma_space, score_threshold)
+            if not isinstance(with_payload, bool):
+                keys = set(with_payload)
+                for result in search_results:
+                    result.payload = {k: v for k, v in result.payload.items() if k in keys}
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Search completed",
+                    collection=collection,
+                    results=len(search_results),
                 )
 
-            logger.debug(
-                "Search completed",
-                collection=collection,
-                results=len(search_results),
-            )
-
             return search_results
 
-        except ValueError:
-            raise ValueError(f"Collection {collection} does not exist")
+        except ValueError as e:
+            self._invalidate_collection(collection)
+            raise ValueError(f"Collection {collection} does not exist") from e
         except Exception as e:
+            self._invalidate_collection(collection)
             logger.error("Search failed", collection=collection, error=str(e))
-            raise RuntimeError(f"Search failed: {e}")
+            raise RuntimeError(f"Search failed: {e}") from e
+
+    async def search_iter(
+        self,
+        collection: str,
+        query_vector: List[float],
+        limit: int = 1000,
+        page_size: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None,
+    ) -> AsyncGenerator[VectorSearchResult, None]:
+        """Yield search results page by page, nearest first.
+
+        Suited to large ``limit`` values where the caller processes hits as a
+        stream or may stop early. Each round re-queries with a doubled
+        ``n_results`` window and yields only the hits beyond the previous
+        window, so the total number of hits fetched stays under 2 * limit and
+        a consumer that stops early never pays for the remaining pages.
+
+        Args:
+            collection: Collection to search
+            query_vector: Query embedding
+            limit: Maximum number of results to yield
+            page_size: Number of results fetched by the first query
+            filters: Optional metadata filters (ChromaDB where clause)
+            score_threshold: Minimum similarity score (0-1 range)
+
+        Yields:
+            VectorSearchResult objects ordered by similarity (highest first)
+
+        Note:
+            ChromaDB's local query path does not apply id exclusion filters, so
+            pages are taken from growing result windows rather than by excluding
+            already-seen ids.
+        """
+        if not self._client:
+            await self.initialize()
+
+        where = filters if filters else None
+        yielded = 0
+        n_results = min(page_size, limit)
+
+        while yielded < limit:
+            try:
+                coll, chroma_space = await self._get_collection_entry(collection)
+                results = await self._run_sync(
+                    coll.query,
+                    query_embeddings=[query_vector],
+                    n_results=n_results,
+                    where=where,
+                    include=list(_SEARCH_INCLUDE),
+                )
+            except ValueError as e:
+                self._invalidate_collection(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            except Exception as e:
+                self._invalidate_collection(collection)
+                logger.error("Search failed", collection=collection, error=str(e))
+                raise RuntimeError(f"Search failed: {e}") from e
+
+            page = self._to_search_results(results, chroma_space, score_threshold)
+            for result in page[yielded:]:
+                yield result
+
+            returned = len(results["ids"][0]) if results["ids"] else 0
+            # Stop once the collection is exhausted or the threshold cut off the page
+            if returned < n_results or len(page) < returned:
+                break
+            yielded = len(page)
+            n_results = min(n_results * 2, limit)
+
+    def _to_search_results(
+        self,
+        results: Dict[str, Any],
+        chroma_space: str,
+        score_threshold: Optional[float],
+    ) -> List[VectorSearchResult]:
+        """Convert a single-query ChromaDB result into VectorSearchResult objects."""
+        # ChromaDB returns batch results (list of lists)
+        if not results["ids"] or len(results["ids"]) == 0:
+            return []
+
+        ids = results["ids"][0]
+        metadatas = results["metadatas"][0] if results.get("metadatas") else []
+        if len(metadatas) < len(ids):
+            metadatas = list(metadatas) + [{} for _ in range(len(ids) - len(metadatas))]
+
+        # Convert all distances to similarity scores in one pass
+        scores = self._distances_to_scores(
+            np.asarray(results["distances"][0], dtype=np.float32)
+            if results.get("distances")
+            else np.zeros(len(ids), dtype=np.float32),
+            chroma_space,
+        )
+        score_list = scores.tolist()
+
+        # Apply score threshold: scores are sorted best first, so find the
+        # cutoff with a binary search and let zip stop there
+        if score_threshold is not None:
+            score_list = score_list[: int(np.searchsorted(-scores, -score_threshold, side="right"))]
+
+        return [
+            VectorSearchResult(
+                id=id_,
+                score=score,
+                payload=payload,
+                vector=None,  # Don't return vectors by default for performance
+            )
+            for id_, score, payload in zip(ids, score_list, metadatas)
+        ]
 
     async def delete(
         self,
         collection: str,
         ids: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
+        exact_count: bool = False,
     ) -> int:
         """Delete vectors by ID or filter.
 
@@ -457,9 +1008,14 @@ class ChromaVectorDB(IVectorStore):
             collection: Collection name
             ids: Optional list of vector IDs to delete
             filters: Optional metadata filters for deletion (ChromaDB where clause)
+            exact_count: Count the collection before and after the delete to
+                report exactly how many vectors were removed. Each count is a
+                full scan on large collections, so this is off by default.
 
         Returns:
-            Count of vectors deleted
+            Count of vectors deleted when exact_count is True. Otherwise
+            len(ids) when ids are given (ChromaDB ignores missing ids, so this
+            is an upper bound), or -1 for filter-only deletes.
 
         Raises:
             ValueError: If neither ids nor filters provided, or collection doesn't exist
@@ -486,11 +1042,6 @@ class ChromaVectorDB(IVectorStore):
             raise ValueError("Either ids or filters must be provided")
 
         try:
-            coll = await asyncio.to_thread(self._client.get_collection, name=collection)
-
-            # ChromaDB delete doesn't return count, so we calculate it manually
-            pre_count = await asyncio.to_thread(coll.count)
-
             logger.debug(
                 "Deleting vectors from ChromaDB",
                 collection=collection,
@@ -498,28 +1049,91 @@ class ChromaVectorDB(IVectorStore):
                 has_filters=filters is not None,
             )
 
-            await asyncio.to_thread(coll.delete, ids=ids, where=filters)
+            coll = await self._get_collection(collection)
+
+            if exact_count:
 
-            post_count = await asyncio.to_thread(coll.count)
-            deleted_count = pre_count - post_count
+                def _delete() -> int:
+                    # ChromaDB delete doesn't return count, so we calculate it manually
+                    pre_count = coll.count()
+                    coll.delete(ids=ids, where=filters)
+                    return pre_count - coll.count()
+
+                deleted_count = await self._run_sync(_delete)
+            else:
+                await self._run_sync(coll.delete, ids=ids, where=filters)
+                deleted_count = len(ids) if ids is not None else -1
 
             logger.debug("Delete completed", collection=collection, deleted=deleted_count)
             return deleted_count
 
-        except ValueError:
-            raise ValueError(f"Collection {collection} does not exist")
+        except ValueError as e:
+            self._invalidate_collection(collection)
+            raise ValueError(f"Collection {collection} does not exist") from e
         except Exception as e:
+            self._invalidate_collection(collection)
             logger.error("Failed to delete", collection=collection, error=str(e))
-            raise RuntimeError(f"Failed to delete: {e}")
+            raise RuntimeError(f"Failed to delete: {e}") from e
+
+    async def get(
+        self,
+        collection: str,
+        ids: List[str],
+    ) -> List[StoredVector]:
+        """Fetch stored vectors and payloads by ID.
+
+        Args:
+            collection: Collection name
+            ids: Vector IDs to fetch
+
+        Returns:
+            List of StoredVector records
 
-    async def count(self, collection: str) -> int:
+        Raises:
+            ValueError: If collection doesn't exist
+            RuntimeError: If the lookup fails
+        """
+        if not self._client:
+            await self.initialize()
+
+        if not ids:
+            return []
+
+        try:
+            coll = await self._get_collection(collection)
+            result = await self._run_sync(coll.get, ids=ids, include=["embeddings", "metadatas"])
+
+            embeddings = result.get("embeddings")
+            metadatas = result.get("metadatas") or []
+            return [
+                StoredVector(
+                    id_,
+                    list(embeddings[i]) if embeddings is not None else None,
+                    metadatas[i] if i < len(metadatas) else {},
+                )
+                for i, id_ in enumerate(result["ids"])
+            ]
+        except ValueError as e:
+            self._invalidate_collection(collection)
+            raise ValueError(f"Collection {collection} does not exist") from e
+        except Exception as e:
+            self._invalidate_collection(collection)
+            logger.error("Failed to get vectors", collection=collection, error=str(e))
+            raise RuntimeError(f"Failed to get vectors: {e}") from e
+
+    async def count(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
         """Count vectors in collection.
 
         Args:
             collection: Collection name
+            filters: Optional metadata filters (ChromaDB where clause)
 
         Returns:
-            Total number of vectors in the collection
+            Number of vectors in the collection (matching filters, if given)
 
         Raises:
             ValueError: If collection doesn't exist
@@ -529,11 +1143,19 @@ class ChromaVectorDB(IVectorStore):
             await self.initialize()
 
         try:
-            coll = await asyncio.to_thread(self._client.get_collection, name=collection)
-            count = await asyncio.to_thread(coll.count)
-            return count
-        except ValueError:
-            raise ValueError(f"Collection {collection} does not exist")
+            coll = await self._get_collection(collection)
+
+            def _count() -> int:
+                if filters:
+                    # Collection.count() has no where clause; fetch matching ids only
+                    return len(coll.get(where=filters, include=[])["ids"])
+                return coll.count()
+
+            return await self._run_sync(_count)
+        except ValueError as e:
+            self._invalidate_collection(collection)
+            raise ValueError(f"Collection {collection} does not exist") from e
         except Exception as e:
+            self._invalidate_collection(collection)
             logger.error("Failed to count", collection=collection, error=str(e))
-            raise RuntimeError(f"Failed to count: {e}")
+            raise RuntimeError(f"Failed to count: {e}") from e
@@ -1,22 +1,283 @@
 """Qdrant vector database implementation."""
 
-from typing import Dict, List, Optional, Any, cast
+import asyncio
+import weakref
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
 
+import grpc
+import numpy as np
 from qdrant_client import AsyncQdrantClient, models
 from qdrant_client.http.exceptions import UnexpectedResponse
 
 from docvector.core import get_logger, settings
 
-from .base import IVectorStore, VectorRecord, VectorSearchResult
+from .base import (
+    Distance,
+    IVectorStore,
+    StoredVector,
+    VectorRecord,
+    VectorSearchResult,
+    resolve_payload,
+)
 
 logger = get_logger(__name__)
 
+_QDRANT_DISTANCE = {
+    Distance.COSINE: models.Distance.COSINE,
+    Distance.EUCLIDEAN: models.Distance.EUCLID,
+    Distance.DOT: models.Distance.DOT,
+}
+
+# HTTP connection pool size used when settings.qdrant_pool_size is unset, so
+# concurrent requests are not serialized behind a handful of connections
+_DEFAULT_HTTP_POOL_SIZE = 100
+
+# Upper bound on points per upsert request, keeping requests of typical
+# embedding dimensions under gRPC's default 4 MiB message limit
+_MAX_UPSERT_POINTS = 1024
+
+# Maximum number of compiled payload filters kept by QdrantVectorDB
+_FILTER_CACHE_SIZE = 256
+
+# get()/aget() split id lists into retrieve requests of this size, with at most
+# _GET_MAX_CONCURRENCY requests in flight
+_GET_CHUNK_SIZE = 256
+_GET_MAX_CONCURRENCY = 8
+
+# Literal types keyed directly for single-field filters; bool is listed apart
+# from int because the key compares the exact class
+_SCALAR_FILTER_TYPES = frozenset((str, int, float, bool))
+
+# Optimizer indexing threshold for new collections; low so HNSW is built even
+# for small collections. Bulk-loaded collections start with indexing disabled
+# (0) and are switched to this value by finalize_index().
+_INDEXING_THRESHOLD = 100
+
+# Quantized vector copies kept in RAM for faster HNSW traversal; the original
+# float vectors stay available for rescoring
+_QUANTIZATION_CONFIGS: Dict[str, Optional[models.QuantizationConfig]] = {
+    "none": None,
+    "scalar": models.ScalarQuantization(
+        scalar=models.ScalarQuantizationConfig(
+            type=models.ScalarType.INT8,
+            # Clip outliers so the int8 range covers the bulk of the values
+            quantile=0.99,
+            always_ram=True,
+        )
+    ),
+    "product": models.ProductQuantization(
+        product=models.ProductQuantizationConfig(
+            compression=models.CompressionRatio.X16, always_ram=True
+        )
+    ),
+    "binary": models.BinaryQuantization(
+        binary=models.BinaryQuantizationConfig(always_ram=True)
+    ),
+}
+
+# Upsert requests in flight during upsert_bulk_binary
+_BULK_UPLOAD_CONCURRENCY = 16
+
+
+class _SharedClient:
+    """A cached client and the number of QdrantVectorDB instances using it."""
+
+    __slots__ = ("key", "client", "refs")
+
+    def __init__(self, key: Tuple[Any, ...], client: AsyncQdrantClient):
+        self.key = key
+        self.client = client
+        self.refs = 0
+
+
+# Clients shared by every QdrantVectorDB with the same connection settings, so
+# short-lived instances reuse one connection pool. Client transports are bound
+# to the loop they were created on, so clients are grouped per event loop; the
+# loop is held weakly so a finished loop's entries go away with it.
+_LoopClients = Dict[Tuple[Any, ...], _SharedClient]
+_client_cache: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def shutdown_all() -> None:
+    """Close every shared Qdrant client, even ones still in use.
+
+    QdrantVectorDB.close() already closes a client once its last user is
+    closed; call this at process shutdown to release the rest.
+    """
+    clients = [
+        shared.client
+        for loop_clients in _client_cache.values()
+        for shared in loop_clients.values()
+    ]
+    _client_cache.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning("Failed to close Qdrant client", error=str(e))
+    if clients:
+        logger.info("Qdrant clients closed", count=len(clients))
+
+
+def _grpc_status(error: Exception) -> Optional[grpc.StatusCode]:
+    """Return the status code of a gRPC call error, if it carries one."""
+    code = getattr(error, "code", None)
+    return code() if callable(code) else None
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Whether a REST or gRPC error from Qdrant reports a missing collection."""
+    if isinstance(error, grpc.RpcError):
+        return _grpc_status(error) == grpc.StatusCode.NOT_FOUND
+    return getattr(error, "status_code", None) == 404 or "not found" in str(error).lower()
+
+
+def _is_already_exists(error: Exception) -> bool:
+    """Whether a REST or gRPC error from Qdrant reports an existing collection."""
+    if isinstance(error, grpc.RpcError):
+        details = getattr(error, "details", None)
+        message = details() if callable(details) else str(error)
+        return (
+            _grpc_status(error) == grpc.StatusCode.ALREADY_EXISTS
+            or "already exists" in (message or "").lower()
+        )
+    return getattr(error, "status_code", None) == 409 or "already exists" in str(error).lower()
+
+
+def _freeze_filter(value: Any) -> Any:
+    """Return a hashable, order-insensitive key for a filter dict.
+
+    Scalars keep their type so that, e.g., ``True`` and ``1`` (which compare
+    and hash equal) do not share a compiled filter.
+    """
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((k, _freeze_filter(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return ("list", tuple(_freeze_filter(v) for v in value))
+    return (type(value).__name__, value)
+
+
+class _BatchQueue:
+    """Coalesces small upserts into shared per-collection Qdrant requests.
+
+    A background task waits for the first queued point, then flushes once
+    ``max_batch_size`` points are pending or ``batch_timeout_ms`` has passed,
+    whichever comes first. Each caller's future resolves with its own count.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, models.Batch, bool], Awaitable[int]],
+        max_batch_size: int,
+        batch_timeout_ms: float,
+    ):
+        self._send = send
+        self.max_batch_size = max(1, max_batch_size)
+        self._timeout = max(0.0, batch_timeout_ms) / 1000.0
+        # Keyed by (collection, wait) so acknowledged and durable writes never share a request
+        self._pending: Dict[Tuple[str, bool], List[Tuple[models.Batch, "asyncio.Future[int]"]]] = {}
+        self._pending_points = 0
+        self._not_empty = asyncio.Event()
+        self._full = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    @property
+    def usable(self) -> bool:
+        """Whether the flusher task is alive on the running event loop."""
+        return not self._task.done() and self._task.get_loop() is asyncio.get_running_loop()
+
+    def submit(self, collection: str, batch: models.Batch, wait: bool) -> "asyncio.Future[int]":
+        """Queue a batch of points for the next flush of their collection."""
+        future: "asyncio.Future[int]" = asyncio.get_running_loop().create_future()
+        self._pending.setdefault((collection, wait), []).append((batch, future))
+        self._pending_points += len(batch.ids)
+        self._idle.clear()
+        self._not_empty.set()
+        if self._pending_points >= self.max_batch_size:
+            self._full.set()
+        return future
+
+    async def drain(self) -> None:
+        """Flush queued points immediately and wait until they are written."""
+        if not self._idle.is_set():
+            self._full.set()
+            await self._idle.wait()
+
+    def close(self) -> None:
+        """Stop the flusher task."""
+        self._task.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            await self._not_empty.wait()
+            try:
+                await asyncio.wait_for(self._full.wait(), self._timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            pending, self._pending = self._pending, {}
+            self._pending_points = 0
+            self._not_empty.clear()
+            self._full.clear()
+
+            await asyncio.gather(
+                *(self._flush(collection, wait, items) for (collection, wait), items in pending.items())
+            )
+            if not self._pending:
+                self._idle.set()
+
+    async def _flush(
+        self,
+        collection: str,
+        wait: bool,
+        items: List[Tuple[models.Batch, "asyncio.Future[int]"]],
+    ) -> None:
+        if len(items) == 1:
+            merged = items[0][0]
+        else:
+            # Parts were validated when submitted, so concatenate them unchecked
+            merged = models.Batch.model_construct(
+                ids=[id_ for batch, _ in items for id_ in batch.ids],
+                vectors=[vector for batch, _ in items for vector in batch.vectors],
+                payloads=[payload for batch, _ in items for payload in batch.payloads],
+            )
+        try:
+            count = await self._send(collection, merged, wait)
+        except Exception as e:
+            if len(items) == 1:
+                future = items[0][1]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            # Retry requests one by one so each caller sees only its own error
+            for item in items:
+                await self._flush(collection, wait, [item])
+            return
+
+        completed = count == len(merged.ids)
+        for batch, future in items:
+            if not future.done():
+                future.set_result(len(batch.ids) if completed else 0)
+
 
 class QdrantVectorDB(IVectorStore):
     """Qdrant implementation of vector database.
     
     Qdrant is a high-performance vector database used for cloud and hybrid
     deployments of DocVector. It supports both HTTP and gRPC protocols.
+
+    For a large initial ingest, create the collection with ``bulk_load=True``
+    so Qdrant does not rebuild HNSW segments while points stream in, upsert
+    everything, then call ``finalize_index()`` to build the index once::
+
+        await db.create_collection("docs", dimension=384, bulk_load=True)
+        await db.upsert_many("docs", records)
+        await db.finalize_index("docs")
     """
 
     def __init__(
@@ -27,6 +288,7 @@ class QdrantVectorDB(IVectorStore):
         use_grpc: Optional[bool] = None,
         url: Optional[str] = None,
         api_key: Optional[str] = None,
+        pool_size: Optional[int] = None,
     ):
         """
         Initialize Qdrant client.
@@ -35,9 +297,14 @@ class QdrantVectorDB(IVectorStore):
             host: Qdrant host (for local/docker deployment)
             port: Qdrant HTTP port
             grpc_port: Qdrant gRPC port
-            use_grpc: Whether to use gRPC
+            use_grpc: Whether to use gRPC for local deployments (default: True
+                via settings.qdrant_use_grpc; falls back to HTTP if the gRPC
+                port is unreachable)
             url: Qdrant Cloud URL (takes precedence over host/port)
             api_key: Qdrant Cloud API key
+            pool_size: HTTP connection pool size, or number of gRPC channels.
+                Defaults to settings.qdrant_pool_size; when that is unset, HTTP
+                uses 100 connections and gRPC keeps the client's default.
         """
         self.url = url or settings.qdrant_url
         self.api_key = api_key or settings.qdrant_api_key
@@ -45,23 +312,71 @@ class QdrantVectorDB(IVectorStore):
         self.port = port or settings.qdrant_port
         self.grpc_port = grpc_port or settings.qdrant_grpc_port
         self.use_grpc = use_grpc if use_grpc is not None else settings.qdrant_use_grpc
+        self.pool_size = pool_size or settings.qdrant_pool_size
 
         self.client: Optional[AsyncQdrantClient] = None
+        # Cache entry of the shared client, released by close()
+        self._shared: Optional[_SharedClient] = None
+        self._init_lock = asyncio.Lock()
+        # Compiled payload filters by frozen filter dict, least recently used first
+        self._filter_cache: "OrderedDict[Any, models.Filter]" = OrderedDict()
+        # Collections confirmed to exist, so collection_exists skips the RPC
+        self._known_collections: Set[str] = set()
+        # Small upserts are coalesced into shared requests by a background task
+        self._batch_queue: Optional[_BatchQueue] = None
 
     async def initialize(self) -> None:
-        """Initialize Qdrant client connection."""
+        """Initialize Qdrant client connection.
+
+        Callers check ``self.client is None`` inline before awaiting this, so
+        the steady-state cost is one attribute test; the lock only serializes
+        concurrent first-time initialization.
+        """
         if self.client is not None:
             return
 
+        async with self._init_lock:
+            if self.client is not None:
+                return
+
+            key = self._client_key()
+            loop_clients = _client_cache.setdefault(asyncio.get_running_loop(), {})
+            shared = loop_clients.get(key)
+            if shared is None:
+                client = await self._connect()
+                # Another instance may have connected while we were probing
+                shared = loop_clients.setdefault(key, _SharedClient(key, client))
+                if shared.client is not client:
+                    await client.close()
+                logger.info("Qdrant client initialized successfully")
+            shared.refs += 1
+            self._shared = shared
+            self.client = shared.client
+
+    def _client_key(self) -> Tuple[Any, ...]:
+        """Key identifying the shared client for this instance's settings."""
+        return (
+            self.url,
+            self.api_key,
+            self.host,
+            self.port,
+            self.grpc_port,
+            self.use_grpc,
+            self.pool_size,
+        )
+
+    async def _connect(self) -> AsyncQdrantClient:
+        """Create the client for the configured deployment."""
         # Use URL + API key for cloud, otherwise use host/port for local
         if self.url and self.api_key:
             logger.info(
                 "Initializing Qdrant Cloud client",
                 url=self.url[:50] + "..." if len(self.url) > 50 else self.url,
             )
-            self.client = AsyncQdrantClient(
+            return AsyncQdrantClient(
                 url=self.url,
                 api_key=self.api_key,
+                pool_size=self.pool_size or _DEFAULT_HTTP_POOL_SIZE,
             )
         elif self.use_grpc:
             logger.info(
@@ -69,57 +384,124 @@ class QdrantVectorDB(IVectorStore):
                 host=self.host,
                 grpc_port=self.grpc_port,
             )
-            self.client = AsyncQdrantClient(
+            client = AsyncQdrantClient(
                 host=self.host,
                 grpc_port=self.grpc_port,
                 prefer_grpc=True,
+                pool_size=self.pool_size,
             )
+            try:
+                # gRPC channels connect lazily, so probe once to catch an
+                # unreachable gRPC port before the first real request
+                await client.get_collections()
+            except Exception as e:
+                logger.warning(
+                    "Qdrant gRPC endpoint unreachable, falling back to HTTP",
+                    host=self.host,
+                    grpc_port=self.grpc_port,
+                    error=str(e),
+                )
+                await client.close()
+                client = self._create_http_client()
+            return client
         else:
-            logger.info(
-                "Initializing Qdrant client (HTTP)",
-                host=self.host,
-                port=self.port,
-            )
-            self.client = AsyncQdrantClient(
-                host=self.host,
-                port=self.port,
-            )
+            return self._create_http_client()
 
-        logger.info("Qdrant client initialized successfully")
+    def _create_http_client(self) -> AsyncQdrantClient:
+        """Create a local Qdrant client using the HTTP (REST) transport."""
+        logger.info(
+            "Initializing Qdrant client (HTTP)",
+            host=self.host,
+            port=self.port,
+        )
+        return AsyncQdrantClient(
+            host=self.host,
+            port=self.port,
+            pool_size=self.pool_size or _DEFAULT_HTTP_POOL_SIZE,
+        )
 
     async def close(self) -> None:
-        """Close Qdrant client."""
-        if self.client:
-            await self.client.close()
-            self.client = None
-            logger.info("Qdrant client closed")
+        """Flush pending upserts and release the shared Qdrant client.
+
+        The client is closed when no other instance is using it.
+        """
+        if self._batch_queue is not None:
+            if self._batch_queue.usable:
+                await self._batch_queue.drain()
+            self._batch_queue.close()
+            self._batch_queue = None
+
+        shared, self._shared = self._shared, None
+        self.client = None
+        if shared is None:
+            return
+        # The client is shared with other instances; the last one closes it,
+        # unless shutdown_all() already has
+        shared.refs -= 1
+        if shared.refs > 0:
+            return
+        for loop_clients in _client_cache.values():
+            if loop_clients.get(shared.key) is shared:
+                del loop_clients[shared.key]
+                break
+        else:
+            return
+        try:
+            await shared.client.close()
+        except Exception as e:
+            logger.warning("Failed to close Qdrant client", error=str(e))
 
     async def create_collection(
         self,
         name: str,
         dimension: int,
-        distance_metric: str = "cosine",
+        distance_metric: Union[Distance, str] = Distance.COSINE,
+        bulk_load: bool = False,
+        *,
+        quantization: Optional[str] = None,
+        on_disk: Optional[bool] = None,
     ) -> None:
-        """Create a new Qdrant collection."""
-        if not self.client:
+        """Create a new Qdrant collection.
+
+        Args:
+            name: Collection name
+            dimension: Vector dimension
+            distance_metric: Distance metric for similarity
+            bulk_load: Create with indexing disabled for a bulk ingest; call
+                finalize_index() once loading is done
+            quantization: "none", "scalar" (int8), "product" or "binary".
+                Defaults to settings.qdrant_quantization. Quantized copies
+                cut vector memory and speed up search; pass search_params
+                to search() to rescore the top hits in full precision.
+            on_disk: Keep the full-precision vectors on disk instead of in RAM.
+                Defaults to settings.qdrant_vectors_on_disk. Saves memory
+                with quantization, but rescored searches then read from disk.
+        """
+        if self.client is None:
             await self.initialize()
             
         assert self.client is not None
 
-        # Map distance names
-        distance_map = {
-            "cosine": models.Distance.COSINE,
-            "euclidean": models.Distance.EUCLID,
-            "dot": models.Distance.DOT,
-        }
+        distance = Distance(distance_metric)
+        distance_metric_val = _QDRANT_DISTANCE[distance]
 
-        distance_metric_val = distance_map.get(distance_metric.lower(), models.Distance.COSINE)
+        quantization = (quantization or settings.qdrant_quantization).lower()
+        if quantization not in _QUANTIZATION_CONFIGS:
+            raise ValueError(
+                f"Unknown quantization '{quantization}'. "
+                f"Must be one of: {', '.join(_QUANTIZATION_CONFIGS)}"
+            )
+
+        if on_disk is None:
+            on_disk = settings.qdrant_vectors_on_disk
 
         logger.info(
             "Creating Qdrant collection",
             collection=name,
             vector_size=dimension,
-            distance=distance_metric,
+            distance=distance.value,
+            quantization=quantization,
+            on_disk=on_disk,
         )
 
         try:
@@ -128,66 +510,96 @@ class QdrantVectorDB(IVectorStore):
                 vectors_config=models.VectorParams(
                     size=dimension,
                     distance=distance_metric_val,
+                    on_disk=on_disk,
                 ),
-                # Enable on-disk storage for large collections
-                # Lower indexing threshold to enable HNSW for smaller collections
+                # Lower indexing threshold to enable HNSW for smaller collections,
+                # or defer indexing entirely until finalize_index() for bulk loads
                 optimizers_config=models.OptimizersConfigDiff(
-                    indexing_threshold=100,  # Build HNSW index after 100 vectors
+                    indexing_threshold=0 if bulk_load else _INDEXING_THRESHOLD,
                 ),
                 # HNSW index configuration
                 hnsw_config=models.HnswConfigDiff(
                     m=16,  # Number of edges per node
                     ef_construct=100,  # Construction time/accuracy trade-off
                 ),
+                quantization_config=_QUANTIZATION_CONFIGS[quantization],
             )
+            self._known_collections.add(name)
             logger.info("Collection created successfully", collection=name)
-        except UnexpectedResponse as e:
-            # Handle collection already exists (409 Conflict)
-            status_code = getattr(e, 'status_code', None)
-            if status_code is None and hasattr(e, 'response'):
-                status_code = getattr(e.response, 'status_code', None)
-
-            if status_code == 409 or "already exists" in str(e).lower():
+        except (UnexpectedResponse, grpc.RpcError) as e:
+            # 409 Conflict over REST, ALREADY_EXISTS over gRPC
+            if _is_already_exists(e):
                 logger.warning("Collection already exists", collection=name)
-                raise ValueError(f"Collection {name} already exists")
-            raise RuntimeError(f"Failed to create collection {name}: {e}")
+                raise ValueError(f"Collection {name} already exists") from e
+            raise RuntimeError(f"Failed to create collection {name}: {e}") from e
+
+    async def finalize_index(self, collection: str) -> None:
+        """Enable HNSW indexing on a collection created with bulk_load=True.
+
+        Qdrant builds the index in the background; searches work meanwhile
+        but may be slower until it finishes.
+        """
+        if self.client is None:
+            await self.initialize()
+        assert self.client is not None
+
+        try:
+            await self.client.update_collection(
+                collection_name=collection,
+                optimizers_config=models.OptimizersConfigDiff(
+                    indexing_threshold=_INDEXING_THRESHOLD,
+                ),
+            )
+        except (UnexpectedResponse, grpc.RpcError) as e:
+            if _is_not_found(e):
+                self._known_collections.discard(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            raise RuntimeError(f"Failed to finalize index for {collection}: {e}") from e
+        logger.info("Collection indexing enabled", collection=collection)
 
     async def delete_collection(self, name: str) -> None:
-        if not self.client:
+        if self.client is None:
             await self.initialize()
         assert self.client is not None
 
+        self._known_collections.discard(name)
         try:
             await self.client.delete_collection(collection_name=name)
-        except UnexpectedResponse as e:
-            # Check for not found error (404)
-            status_code = getattr(e, 'status_code', None)
-            if status_code is None and hasattr(e, 'response'):
-                status_code = getattr(e.response, 'status_code', None)
-
-            if status_code == 404 or "not found" in str(e).lower():
+        except (UnexpectedResponse, grpc.RpcError) as e:
+            # 404 over REST, NOT_FOUND over gRPC
+            if _is_not_found(e):
                 raise ValueError(f"Collection {name} does not exist") from e
             raise RuntimeError(f"Failed to delete collection {name}: {e}") from e
     
     async def collection_exists(self, name: str) -> bool:
-        if not self.client:
+        """Check if a collection exists.
+
+        Positive answers are remembered until the collection is deleted through
+        this store or an operation reports it missing.
+        """
+        if name in self._known_collections:
+            return True
+
+        if self.client is None:
             await self.initialize()
         assert self.client is not None
 
         try:
             await self.client.get_collection(name)
-            return True
         except Exception:
             return False
+        self._known_collections.add(name)
+        return True
 
     async def get_collection_info(self, name: str) -> Optional[Dict[str, Any]]:
-        if not self.client:
+        if self.client is None:
             await self.initialize()
         assert self.client is not None
 
         try:
             info = await self.client.get_collection(name)
-            
+            self._known_collections.add(name)
+
             # Extract dimension from vector params if single vector
             dimension = 0
             distance_metric = "cosine"
@@ -206,43 +618,234 @@ class QdrantVectorDB(IVectorStore):
                 "distance_metric": distance_metric
             }
         except Exception:
+            self._known_collections.discard(name)
             return None
 
     async def upsert(
         self,
         collection: str,
         records: List[VectorRecord],
+        wait: bool = False,
     ) -> int:
-        if not self.client:
+        """Insert or update points.
+
+        Args:
+            collection: Collection name
+            records: Records to upsert
+            wait: Wait until Qdrant has applied the write before returning. By
+                default the write is only acknowledged, so concurrent upserts
+                can pipeline; call flush() when read-after-write is needed.
+
+        Returns:
+            Number of points accepted
+        """
+        if self.client is None:
             await self.initialize()
         assert self.client is not None
 
         if not records:
             return 0
 
-        # Create points
-        points = [
-            models.PointStruct(
-                id=r.id,
-                vector=r.vector,
-                payload=r.payload,
+        # Batches that already fill a request go out directly, split so no
+        # request exceeds _MAX_UPSERT_POINTS; smaller ones are coalesced with
+        # concurrent upserts to amortize the per-request cost
+        if self._batch_queue is None or not self._batch_queue.usable:
+            self._batch_queue = _BatchQueue(
+                self._upsert_points,
+                max_batch_size=settings.qdrant_upsert_batch_size,
+                batch_timeout_ms=settings.qdrant_upsert_batch_timeout_ms,
             )
-            for r in records
-        ]
+        if len(records) > _MAX_UPSERT_POINTS:
+            return await self.upsert_many(
+                collection, records, chunk_size=_MAX_UPSERT_POINTS, wait=wait
+            )
+
+        batch = self._records_to_batch(records)
+        if len(records) >= self._batch_queue.max_batch_size:
+            return await self._upsert_points(collection, batch, wait)
+        return await self._batch_queue.submit(collection, batch, wait)
+
+    async def upsert_many(
+        self,
+        collection: str,
+        records: List[VectorRecord],
+        chunk_size: int = 512,
+        max_concurrency: int = 16,
+        wait: bool = False,
+    ) -> int:
+        """Upsert a large record list as concurrent chunked requests.
+
+        Chunks bypass the coalescing queue and are sent directly, with at most
+        ``max_concurrency`` requests in flight so the connection pool stays busy
+        without being oversubscribed.
+
+        Args:
+            collection: Collection name
+            records: Records to upsert
+            chunk_size: Records per request, capped at 1024
+            max_concurrency: Maximum number of requests in flight
+            wait: Wait until Qdrant has applied each chunk before it counts
+
+        Returns:
+            Number of points accepted
+        """
+        if self.client is None:
+            await self.initialize()
+        assert self.client is not None
+
+        if not records:
+            return 0
+
+        chunk_size = min(max(1, chunk_size), _MAX_UPSERT_POINTS)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _upsert_chunk(start: int) -> int:
+            async with semaphore:
+                batch = self._records_to_batch(records[start:start + chunk_size])
+                return await self._upsert_points(collection, batch, wait)
+
+        counts = await asyncio.gather(
+            *(_upsert_chunk(start) for start in range(0, len(records), chunk_size))
+        )
+        return sum(counts)
+
+    def _records_to_batch(self, records: List[VectorRecord]) -> models.Batch:
+        """Convert records into one columnar Batch instead of a PointStruct per record.
+
+        NumPy vectors are stacked into one float32 block and converted in a
+        single tolist() call rather than element by element during validation.
+        """
+        vectors: Any = [r.vector for r in records]
+        if isinstance(vectors[0], np.ndarray):
+            vectors = np.asarray(vectors, dtype=np.float32).tolist()
+        return models.Batch(
+            ids=[r.id for r in records],
+            vectors=vectors,
+            payloads=[resolve_payload(r.payload) for r in records],
+        )
+
+    async def flush(self, collection: Optional[str] = None) -> None:
+        """Send queued upserts and, for a collection, wait until writes are applied.
+
+        Qdrant applies updates to a collection in order, so a waited empty
+        upsert acts as a barrier for every earlier acknowledged write.
+
+        Args:
+            collection: Collection to wait on; if None, only the local queue is drained
+        """
+        if self._batch_queue is not None and self._batch_queue.usable:
+            await self._batch_queue.drain()
+        if collection is not None:
+            if self.client is None:
+                await self.initialize()
+            await self._upsert_points(collection, models.Batch(ids=[], vectors=[]), wait=True)
+
+    async def _upsert_points(self, collection: str, batch: models.Batch, wait: bool) -> int:
+        """Send one upsert request, returning the number of points accepted."""
+        assert self.client is not None
 
         try:
             res = await self.client.upsert(
                 collection_name=collection,
-                points=points,
-                wait=True,
+                points=batch,
+                wait=wait,
             )
-            if res.status == models.UpdateStatus.COMPLETED:
-                return len(records)
+            if res.status in (models.UpdateStatus.COMPLETED, models.UpdateStatus.ACKNOWLEDGED):
+                return len(batch.ids)
             return 0
-        except UnexpectedResponse as e:
-            if "not found" in str(e).lower():
-                raise ValueError(f"Collection {collection} does not exist")
-            raise RuntimeError(f"Failed to upsert: {e}")
+        except (UnexpectedResponse, grpc.RpcError) as e:
+            if _is_not_found(e):
+                self._known_collections.discard(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            raise RuntimeError(f"Failed to upsert: {e}") from e
+
+    async def upsert_from_numpy(
+        self,
+        collection: str,
+        ids: List[str],
+        vectors: "np.ndarray",
+        payloads: List[Dict[str, Any]],
+        batch_size: int = 512,
+        max_concurrency: int = 16,
+        wait: bool = False,
+    ) -> int:
+        """Upsert a 2D NumPy array as concurrent slice requests.
+
+        Like upsert_many, slices are sent directly with at most
+        ``max_concurrency`` requests in flight, so network round trips and
+        server-side ingestion overlap instead of running back to back.
+
+        Args:
+            collection: Collection name
+            ids: Vector IDs, one per row of ``vectors``
+            vectors: 2D array of shape ``(len(ids), dimension)``
+            payloads: Metadata dictionaries, one per row of ``vectors``
+            batch_size: Rows per request, capped at 1024
+            max_concurrency: Maximum number of requests in flight
+            wait: Wait until Qdrant has applied each slice before it counts
+
+        Returns:
+            Number of points accepted
+        """
+        if not (len(ids) == len(vectors) == len(payloads)):
+            raise ValueError("ids, vectors and payloads must have the same length")
+
+        if self.client is None:
+            await self.initialize()
+        assert self.client is not None
+
+        if len(ids) == 0:
+            return 0
+
+        batch_size = min(max(1, batch_size), _MAX_UPSERT_POINTS)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _upsert_slice(start: int) -> int:
+            async with semaphore:
+                end = start + batch_size
+                batch = self._array_to_batch(ids[start:end], vectors[start:end], payloads[start:end])
+                return await self._upsert_points(collection, batch, wait)
+
+        counts = await asyncio.gather(
+            *(_upsert_slice(start) for start in range(0, len(ids), batch_size))
+        )
+        return sum(counts)
+
+    @staticmethod
+    def _array_to_batch(
+        ids: Sequence[str],
+        vectors: "np.ndarray",
+        payloads: Sequence[Dict[str, Any]],
+    ) -> models.Batch:
+        """Convert a NumPy slice into a Batch, converting each row only once at the wire boundary."""
+        return models.Batch(
+            ids=list(ids),
+            vectors=vectors.tolist(),
+            payloads=[resolve_payload(payload) for payload in payloads],
+        )
+
+    async def upsert_bulk_binary(
+        self,
+        collection: str,
+        ids: Sequence[str],
+        vectors: "np.ndarray",
+        payloads: Sequence[Dict[str, Any]],
+    ) -> int:
+        """Append vectors as concurrent batched upserts on the async client.
+
+        Batches of up to 1024 points are sent with a bounded number of
+        requests in flight and are only acknowledged, so the vectors may not
+        be searchable as soon as this returns; call flush() to wait for them.
+        """
+        return await self.upsert_from_numpy(
+            collection,
+            list(ids),
+            vectors,
+            list(payloads),
+            batch_size=_MAX_UPSERT_POINTS,
+            max_concurrency=_BULK_UPLOAD_CONCURRENCY,
+            wait=False,
+        )
 
     async def search(
         self,
@@ -251,8 +854,17 @@ class QdrantVectorDB(IVectorStore):
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
         score_threshold: Optional[float] = None,
+        with_payload: Union[bool, Sequence[str]] = True,
+        search_params: Optional[models.SearchParams] = None,
     ) -> List[VectorSearchResult]:
-        if not self.client:
+        """Search for similar vectors.
+
+        ``search_params`` is passed through to Qdrant, e.g.
+        ``models.SearchParams(quantization=models.QuantizationSearchParams(
+        rescore=True, oversampling=2.0))`` to rescore oversampled quantized
+        hits with the original vectors.
+        """
+        if self.client is None:
             await self.initialize()
         assert self.client is not None
 
@@ -266,31 +878,117 @@ class QdrantVectorDB(IVectorStore):
                 limit=limit,
                 query_filter=qdrant_filter,
                 score_threshold=score_threshold,
-                with_payload=True,
+                with_payload=self._payload_selector(with_payload),
                 with_vectors=False,
+                search_params=search_params,
             )
 
-            return [
-                VectorSearchResult(
-                    id=str(result.id),
-                    score=result.score,
-                    payload=result.payload or {},
-                    vector=None
-                )
-                for result in results.points
-            ]
-        except UnexpectedResponse as e:
-            if "not found" in str(e).lower():
-                 raise ValueError(f"Collection {collection} does not exist")
-            raise RuntimeError(f"Search failed: {e}")
+            return self._to_search_results(results.points)
+        except (UnexpectedResponse, grpc.RpcError) as e:
+            if _is_not_found(e):
+                self._known_collections.discard(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            raise RuntimeError(f"Search failed: {e}") from e
+
+    async def search_batch(
+        self,
+        collection: str,
+        query_vectors: Sequence[List[float]],
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None,
+        with_payload: Union[bool, Sequence[str]] = True,
+        search_params: Optional[models.SearchParams] = None,
+    ) -> List[List[VectorSearchResult]]:
+        """Run several similarity searches in a single round trip.
+
+        All queries share the same limit, filter, score threshold, payload
+        selection and search params. Results are returned in the same order as ``query_vectors``.
+        """
+        if not query_vectors:
+            return []
+
+        if self.client is None:
+            await self.initialize()
+        assert self.client is not None
+
+        qdrant_filter = self._build_filter(filters) if filters else None
+        payload_selector = self._payload_selector(with_payload)
+        requests = [
+            models.QueryRequest(
+                query=list(query_vector),
+                limit=limit,
+                filter=qdrant_filter,
+                score_threshold=score_threshold,
+                with_payload=payload_selector,
+                with_vector=False,
+                params=search_params,
+            )
+            for query_vector in query_vectors
+        ]
+
+        try:
+            responses = await self.client.query_batch_points(
+                collection_name=collection,
+                requests=requests,
+            )
+        except (UnexpectedResponse, grpc.RpcError) as e:
+            if _is_not_found(e):
+                self._known_collections.discard(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            raise RuntimeError(f"Batch search failed: {e}") from e
+
+        return [self._to_search_results(response.points) for response in responses]
+
+    @staticmethod
+    def _payload_selector(with_payload: Union[bool, Sequence[str]]) -> Union[bool, List[str]]:
+        """Normalize a with_payload argument into what qdrant-client accepts."""
+        if isinstance(with_payload, bool):
+            return with_payload
+        return list(with_payload)
+
+    @staticmethod
+    def _to_search_results(points: Sequence[Any]) -> List[VectorSearchResult]:
+        return [
+            VectorSearchResult(
+                id=point.id,
+                score=point.score,
+                payload=point.payload or {},
+                vector=None
+            )
+            for point in points
+        ]
 
     async def delete(
         self,
         collection: str,
         ids: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
+        exact_count: bool = False,
     ) -> int:
-        if not self.client:
+        """Delete points by ID and/or filter.
+
+        Points matching either the ids or the filter are deleted.
+
+        Args:
+            collection: Collection name
+            ids: Optional list of point IDs to delete
+            filters: Optional payload filters for deletion
+            exact_count: Count the matching points before deleting to report
+                exactly how many were removed, at the cost of one extra request
+
+        Returns:
+            Count of points deleted when exact_count is True. Otherwise the
+            estimate described on IVectorStore.delete: len(ids) for id-only
+            deletes (an upper bound, since missing ids are ignored), or -1
+            when a filter is involved, since the filter can match points
+            beyond the ids.
+
+        Raises:
+            ValueError: If neither ids nor filters provided, or collection doesn't exist
+            RuntimeError: If deletion fails
+        """
+        if self.client is None:
             await self.initialize()
         assert self.client is not None
 
@@ -298,71 +996,259 @@ class QdrantVectorDB(IVectorStore):
             raise ValueError("Either ids or filters must be provided")
 
         try:
-            # Get pre-count
-            pre_info = await self.client.get_collection(collection)
-            pre_count = pre_info.points_count or 0
-            
+            qdrant_filter = self._build_filter(filters) if filters else None
+
+            deleted = len(ids) if ids and not filters else -1
+            if exact_count:
+                conditions: List[Any] = []
+                if ids:
+                    conditions.append(models.HasIdCondition(has_id=ids))
+                if qdrant_filter is not None:
+                    conditions.append(qdrant_filter)
+                result = await self.client.count(
+                    collection_name=collection,
+                    count_filter=models.Filter(should=conditions),
+                    exact=True,
+                )
+                deleted = result.count
+
             if ids:
                 await self.client.delete(
                     collection_name=collection,
                     points_selector=models.PointIdsList(points=ids),
                     wait=True,
                 )
-            
-            if filters:
-                 qdrant_filter = self._build_filter(filters)
-                 await self.client.delete(
+
+            if qdrant_filter is not None:
+                await self.client.delete(
                     collection_name=collection,
                     points_selector=models.FilterSelector(filter=qdrant_filter),
                     wait=True,
                 )
 
-            # Get post-count
-            post_info = await self.client.get_collection(collection)
-            post_count = post_info.points_count or 0
-            
-            return max(0, pre_count - post_count)
-            
-        except UnexpectedResponse:
-             raise ValueError(f"Collection {collection} does not exist")
+            return deleted
+
+        except (UnexpectedResponse, grpc.RpcError) as e:
+            if _is_not_found(e):
+                self._known_collections.discard(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            raise RuntimeError(f"Failed to delete: {e}") from e
         except Exception as e:
-            raise RuntimeError(f"Failed to delete: {e}")
+            raise RuntimeError(f"Failed to delete: {e}") from e
 
+    async def get(
+        self,
+        collection: str,
+        ids: List[str],
+        with_payload: Union[bool, Sequence[str]] = True,
+    ) -> List[StoredVector]:
+        """Fetch points by ID.
 
-    async def count(self, collection: str) -> int:
-        if not self.client:
+        Long id lists are fetched as concurrent chunked requests, so no single
+        response has to carry every vector. Use aget() to process points as
+        chunks arrive instead of waiting for all of them.
+
+        Args:
+            collection: Collection name
+            ids: Point IDs to fetch
+            with_payload: True for the full payload, False for none, or the
+                payload keys to return
+        """
+        if self.client is None:
+            await self.initialize()
+        assert self.client is not None
+
+        if not ids:
+            return []
+
+        payload_selector = self._payload_selector(with_payload)
+        if len(ids) <= _GET_CHUNK_SIZE:
+            return await self._retrieve(collection, ids, payload_selector)
+
+        semaphore = asyncio.Semaphore(_GET_MAX_CONCURRENCY)
+
+        async def _retrieve_chunk(start: int) -> List[StoredVector]:
+            async with semaphore:
+                return await self._retrieve(
+                    collection, ids[start:start + _GET_CHUNK_SIZE], payload_selector
+                )
+
+        chunks = await asyncio.gather(
+            *(_retrieve_chunk(start) for start in range(0, len(ids), _GET_CHUNK_SIZE))
+        )
+        return [point for chunk in chunks for point in chunk]
+
+    async def aget(
+        self,
+        collection: str,
+        ids: List[str],
+        with_payload: Union[bool, Sequence[str]] = True,
+    ) -> AsyncGenerator[StoredVector, None]:
+        """Yield points by ID as their retrieve requests complete.
+
+        Ids are fetched in concurrent chunks like get(), but each chunk is
+        yielded as soon as it arrives, so downstream work overlaps with the
+        remaining requests. Points arrive in chunk completion order, not in
+        the order of ``ids``. Closing the generator early cancels the
+        outstanding requests.
+
+        Args:
+            collection: Collection name
+            ids: Point IDs to fetch
+            with_payload: True for the full payload, False for none, or the
+                payload keys to return
+
+        Yields:
+            StoredVector records
+        """
+        if self.client is None:
+            await self.initialize()
+        assert self.client is not None
+
+        if not ids:
+            return
+
+        payload_selector = self._payload_selector(with_payload)
+        semaphore = asyncio.Semaphore(_GET_MAX_CONCURRENCY)
+
+        async def _retrieve_chunk(start: int) -> List[StoredVector]:
+            async with semaphore:
+                return await self._retrieve(
+                    collection, ids[start:start + _GET_CHUNK_SIZE], payload_selector
+                )
+
+        tasks = [
+            asyncio.ensure_future(_retrieve_chunk(start))
+            for start in range(0, len(ids), _GET_CHUNK_SIZE)
+        ]
+        try:
+            for next_chunk in asyncio.as_completed(tasks):
+                for point in await next_chunk:
+                    yield point
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _retrieve(
+        self,
+        collection: str,
+        ids: List[str],
+        payload_selector: Union[bool, List[str]],
+    ) -> List[StoredVector]:
+        """Fetch one chunk of points with their vectors."""
+        assert self.client is not None
+        try:
+            points = await self.client.retrieve(
+                collection_name=collection,
+                ids=ids,
+                with_payload=payload_selector,
+                with_vectors=True,
+            )
+        except (UnexpectedResponse, grpc.RpcError) as e:
+            if _is_not_found(e):
+                self._known_collections.discard(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            raise RuntimeError(f"Failed to retrieve points: {e}") from e
+        return [StoredVector(point.id, point.vector, point.payload or {}) for point in points]
+
+    async def count(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        if self.client is None:
             await self.initialize()
         assert self.client is not None
         
         try:
-            res = await self.client.count(collection_name=collection)
+            res = await self.client.count(
+                collection_name=collection,
+                count_filter=self._build_filter(filters) if filters else None,
+            )
             return res.count
-        except UnexpectedResponse:
-             raise ValueError(f"Collection {collection} does not exist")
+        except (UnexpectedResponse, grpc.RpcError) as e:
+            if _is_not_found(e):
+                self._known_collections.discard(collection)
+                raise ValueError(f"Collection {collection} does not exist") from e
+            raise RuntimeError(f"Failed to count points: {e}") from e
 
 
     def _build_filter(self, filter_dict: Dict) -> models.Filter:
         """
         Build Qdrant filter from dictionary.
+
+        Compiled filters are cached by the filter's contents, since search
+        workloads tend to repeat the same filters. The returned Filter is
+        shared and must not be mutated.
         """
+        key: Any
+        try:
+            if len(filter_dict) == 1:
+                # Most filters are a single exact match such as {"library": ...};
+                # key those directly instead of freezing the dict recursively
+                ((field, value),) = filter_dict.items()
+                if value.__class__ in _SCALAR_FILTER_TYPES:
+                    key = (field, value.__class__, value)
+                else:
+                    key = _freeze_filter(filter_dict)
+            else:
+                key = _freeze_filter(filter_dict)
+            cached = self._filter_cache.get(key)
+        except TypeError:
+            # Unhashable literal somewhere in the filter; build it uncached
+            return self._compile_filter(filter_dict)
+
+        if cached is not None:
+            self._filter_cache.move_to_end(key)
+            return cached
+
+        compiled = self._compile_filter(filter_dict)
+        self._filter_cache[key] = compiled
+        if len(self._filter_cache) > _FILTER_CACHE_SIZE:
+            self._filter_cache.popitem(last=False)
+        return compiled
+
+    def _compile_filter(self, filter_dict: Dict) -> models.Filter:
+        """Translate a filter dictionary into Qdrant filter models."""
+        if len(filter_dict) == 1:
+            # Fast path for the common single-field shapes: {"field": literal}
+            # and {"field": {"$in": [...]}}
+            ((field, value),) = filter_dict.items()
+            if not field.startswith("$"):
+                if not isinstance(value, dict):
+                    return models.Filter(
+                        must=[models.FieldCondition(key=field, match=models.MatchValue(value=value))]
+                    )
+                if len(value) == 1 and "$in" in value:
+                    return models.Filter(
+                        must=[models.FieldCondition(key=field, match=models.MatchAny(any=value["$in"]))]
+                    )
+
         conditions = []
 
         for key, value in filter_dict.items():
             if key == "$and":
-                sub_filters = [self._build_filter(f) for f in cast(List, value)]
-                # Extract 'must' list from sub-filter if possible, or wrap it
-                # Qdrant python client constructs are a bit nested.
-                # A simple approximation:
-                nested_musts = []
-                for sub in sub_filters:
-                     if sub.must: nested_musts.extend(sub.must)
-                conditions.extend(nested_musts)
+                for sub in (self._compile_filter(f) for f in cast(List, value)):
+                    # Plain conjunctions merge into this level; anything else
+                    # (e.g. an $or branch) is kept as a nested filter
+                    if sub.must and not sub.should and not sub.must_not:
+                        conditions.extend(sub.must)
+                    else:
+                        conditions.append(sub)
 
             elif key == "$or":
-                # OR is top level 'should' typically, but here we are in a loop adding to 'must' (conditions)
-                # If we have mixed AND/OR need detailed recursion logic
-                # For simplified implementation, we assume basic structure
-                pass
+                branches: List[Any] = []
+                for sub in (self._compile_filter(f) for f in cast(List, value)):
+                    # A single-condition branch is used as-is rather than
+                    # wrapped in its own Filter
+                    if sub.must and len(sub.must) == 1 and not sub.should and not sub.must_not:
+                        branches.append(sub.must[0])
+                    else:
+                        branches.append(sub)
+                if len(filter_dict) == 1:
+                    return models.Filter(should=branches)
+                # Combined with other keys: AND the disjunction with them
+                conditions.append(models.Filter(should=branches))
 
             elif isinstance(value, dict):
                 # Operators
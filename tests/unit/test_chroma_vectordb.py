@@ -10,7 +10,13 @@ import pytest
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from docvector.vectordb import ChromaVectorDB, VectorRecord, VectorSearchResult
+from docvector.vectordb import (
+    ChromaVectorDB,
+    PayloadRef,
+    StoredVector,
+    VectorRecord,
+    VectorSearchResult,
+)
 
 
 # Module-level fixtures
@@ -44,6 +50,20 @@ class TestChromaVectorDB:
 
         await db.close()
 
+    @pytest.mark.asyncio
+    async def test_executor_lifecycle(self, temp_chroma_dir):
+        """Test ChromaDB calls share one executor that close() shuts down."""
+        db = ChromaVectorDB(persist_directory=temp_chroma_dir)
+        await db.initialize()
+        executor = db._executor
+        assert executor is not None
+
+        await db.create_collection("test_executor", dimension=3)
+        assert db._executor is executor
+
+        await db.close()
+        assert db._executor is None
+
     @pytest.mark.asyncio
     async def test_initialize_idempotent(self, vectordb):
         """Test that initialize is idempotent."""
@@ -102,6 +122,28 @@ class TestChromaVectorDB:
         with pytest.raises(ValueError, match="already exists"):
             await vectordb.create_collection("test_dup", dimension=384)
 
+    @pytest.mark.asyncio
+    async def test_create_collection_idempotent(self, vectordb):
+        """Test idempotent creation reuses an existing collection."""
+        await vectordb.create_collection("test_idempotent", dimension=3)
+        records = [VectorRecord(id="vec1", vector=[0.1, 0.2, 0.3], payload={"k": 1})]
+        await vectordb.upsert("test_idempotent", records)
+
+        await vectordb.create_collection("test_idempotent", dimension=3, idempotent=True)
+
+        assert await vectordb.count("test_idempotent") == 1
+
+    @pytest.mark.asyncio
+    async def test_create_collection_bulk_load(self, vectordb):
+        """Test the bulk-load hint is accepted through the legacy adapter."""
+        from docvector.vectordb import BaseVectorDB
+
+        adapter = BaseVectorDB(vectordb)
+        await adapter.create_collection("test_bulk", 3, bulk_load=True)
+        await adapter.finalize_index("test_bulk")
+
+        assert await vectordb.collection_exists("test_bulk")
+
     @pytest.mark.asyncio
     async def test_delete_collection(self, vectordb):
         """Test deleting a collection."""
@@ -136,6 +178,18 @@ class TestChromaVectorDB:
         info = await vectordb.get_collection_info("nonexistent")
         assert info is None
 
+    @pytest.mark.asyncio
+    async def test_get_collection_info_dimension_from_peek(self, vectordb):
+        """Test dimension is read from stored vectors when not in metadata."""
+        coll = vectordb._client.create_collection(
+            name="test_peek", metadata={"hnsw:space": "cosine"}
+        )
+        coll.add(ids=["vec1"], embeddings=[[0.1, 0.2, 0.3, 0.4]], metadatas=[{"k": 1}])
+
+        info = await vectordb.get_collection_info("test_peek")
+        assert info["dimension"] == 4
+        assert info["vector_count"] == 1
+
     @pytest.mark.asyncio
     async def test_upsert_single_record(self, vectordb):
         """Test upserting a single record."""
@@ -188,6 +242,42 @@ class TestChromaVectorDB:
         total = await vectordb.count("test_update")
         assert total == 1
 
+    @pytest.mark.asyncio
+    async def test_upsert_integer_ids(self, vectordb):
+        """Test integer ids are accepted and stored as strings."""
+        await vectordb.create_collection("test_int_ids", dimension=3)
+
+        records = [
+            VectorRecord(id=i, vector=[1.0, i * 0.1, 0.0], payload={"index": i})
+            for i in range(3)
+        ]
+        count = await vectordb.upsert("test_int_ids", records)
+        assert count == 3
+
+        stored = await vectordb.get("test_int_ids", ["0", "1", "2"])
+        assert sorted(r["id"] for r in stored) == ["0", "1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_empty_records(self, vectordb):
+        """Test upserting an empty batch is a no-op."""
+        await vectordb.create_collection("test_empty_upsert", dimension=3)
+
+        count = await vectordb.upsert("test_empty_upsert", [])
+        assert count == 0
+
+    @pytest.mark.asyncio
+    async def test_upsert_ragged_vectors(self, vectordb):
+        """Test upserting vectors of mixed dimension fails before reaching ChromaDB."""
+        await vectordb.create_collection("test_ragged", dimension=3)
+
+        records = [
+            VectorRecord(id="vec1", vector=[0.1, 0.2, 0.3], payload={"k": 1}),
+            VectorRecord(id="vec2", vector=[0.1, 0.2], payload={"k": 2}),
+        ]
+
+        with pytest.raises(ValueError):
+            await vectordb.upsert("test_ragged", records)
+
     @pytest.mark.asyncio
     async def test_upsert_nonexistent_collection(self, vectordb):
         """Test upserting to nonexistent collection."""
@@ -196,6 +286,269 @@ class TestChromaVectorDB:
         with pytest.raises(ValueError, match="does not exist"):
             await vectordb.upsert("nonexistent", records)
 
+    @pytest.mark.asyncio
+    async def test_upsert_split_into_sub_batches(self, vectordb):
+        """Test large upserts are split into concurrent sub-batches."""
+        await vectordb.create_collection("test_chunked", dimension=3)
+        vectordb._upsert_batch_size = 4
+        vectordb._upsert_concurrency = 2
+
+        records = [
+            VectorRecord(id=f"vec{i}", vector=[float(i), 0.0, 1.0], payload={"index": i})
+            for i in range(10)
+        ]
+
+        count = await vectordb.upsert("test_chunked", records)
+        assert count == 10
+
+        total = await vectordb.count("test_chunked")
+        assert total == 10
+
+    @pytest.mark.asyncio
+    async def test_concurrent_upserts_coalesced(self, vectordb, mocker):
+        """Test concurrent upserts to one collection share a single write."""
+        import asyncio
+
+        await vectordb.create_collection("test_coalesce", dimension=3)
+        spy = mocker.spy(vectordb, "_write_records")
+
+        counts = await asyncio.gather(*(
+            vectordb.upsert(
+                "test_coalesce",
+                [VectorRecord(id=f"vec{i}", vector=[float(i), 0.0, 1.0], payload={"index": i})],
+            )
+            for i in range(5)
+        ))
+
+        # The first upsert finds the collection idle and is written at once;
+        # the rest arrive during that write and share the next one
+        assert counts == [1] * 5
+        assert spy.call_count == 2
+        assert await vectordb.count("test_coalesce") == 5
+
+    @pytest.mark.asyncio
+    async def test_sequential_upserts_bypass_queue(self, vectordb, mocker):
+        """Test an upsert to an idle collection does not wait for the coalescing window."""
+        await vectordb.create_collection("test_direct", dimension=3)
+        spy = mocker.spy(vectordb, "_write_records")
+
+        for i in range(3):
+            await vectordb.upsert(
+                "test_direct",
+                [VectorRecord(id=f"vec{i}", vector=[float(i), 0.0, 1.0], payload={"index": i})],
+            )
+
+        assert spy.call_count == 3
+        assert "test_direct" not in vectordb._upsert_flushers
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_bulk_load(self, vectordb):
+        """Test flush waits for a NumPy bulk load that is being written."""
+        import asyncio
+
+        import numpy as np
+
+        await vectordb.create_collection("test_flush_bulk", dimension=3)
+        task = asyncio.create_task(
+            vectordb.upsert_bulk_binary(
+                "test_flush_bulk",
+                [f"vec{i}" for i in range(4)],
+                np.random.rand(4, 3).astype(np.float32),
+                [{"index": i} for i in range(4)],
+            )
+        )
+        for _ in range(100):
+            lock = vectordb._upsert_locks.get("test_flush_bulk")
+            if lock is not None and lock.locked():
+                break
+            await asyncio.sleep(0)
+        assert vectordb._upsert_locks["test_flush_bulk"].locked()
+
+        await vectordb.flush()
+
+        assert task.done()
+        assert await task == 4
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_flushers(self, vectordb):
+        """Test close stops the per-collection flusher tasks."""
+        import asyncio
+
+        await vectordb.create_collection("test_flusher", dimension=3)
+        await asyncio.gather(*(
+            vectordb.upsert(
+                "test_flusher",
+                [VectorRecord(id=f"vec{i}", vector=[float(i), 0.0, 1.0], payload={"index": i})],
+            )
+            for i in range(2)
+        ))
+        flusher = vectordb._upsert_flushers["test_flusher"]
+
+        await vectordb.close()
+        await asyncio.sleep(0)
+
+        assert flusher.cancelled()
+        assert not vectordb._upsert_flushers
+
+    @pytest.mark.asyncio
+    async def test_concurrent_upserts_same_id_not_merged(self, vectordb):
+        """Test overlapping ids are written in order instead of merged."""
+        import asyncio
+
+        await vectordb.create_collection("test_coalesce_dup", dimension=3)
+
+        await asyncio.gather(*(
+            vectordb.upsert(
+                "test_coalesce_dup",
+                [VectorRecord(id="vec1", vector=[1.0, 0.0, 0.0], payload={"version": v})],
+            )
+            for v in (1, 2)
+        ))
+
+        stored = await vectordb.get("test_coalesce_dup", ["vec1"])
+        assert stored[0]["payload"] == {"version": 2}
+
+    @pytest.mark.asyncio
+    async def test_get_returns_stored_vectors(self, vectordb):
+        """Test get() returns slotted records that still read like dicts."""
+        await vectordb.create_collection("test_get_records", dimension=3)
+        await vectordb.upsert(
+            "test_get_records",
+            [VectorRecord(id="vec1", vector=[1.0, 0.0, 0.0], payload={"name": "x"})],
+        )
+
+        (stored,) = await vectordb.get("test_get_records", ["vec1"])
+        assert isinstance(stored, StoredVector)
+        assert stored.id == stored["id"] == "vec1"
+        assert stored == {"id": "vec1", "vector": [1.0, 0.0, 0.0], "payload": {"name": "x"}}
+        assert not hasattr(stored, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_coalesced_upsert_errors_isolated(self, vectordb):
+        """Test a bad request does not fail the requests merged with it."""
+        import asyncio
+
+        await vectordb.create_collection("test_coalesce_err", dimension=3)
+
+        good, bad = await asyncio.gather(
+            vectordb.upsert(
+                "test_coalesce_err",
+                [VectorRecord(id="vec1", vector=[1.0, 0.0, 0.0], payload={"k": 1})],
+            ),
+            vectordb.upsert(
+                "test_coalesce_err",
+                [VectorRecord(id="vec2", vector=[1.0, 0.0], payload={"k": 2})],
+            ),
+            return_exceptions=True,
+        )
+
+        assert good == 1
+        assert isinstance(bad, Exception)
+        assert await vectordb.count("test_coalesce_err") == 1
+
+    @pytest.mark.asyncio
+    async def test_upsert_from_numpy(self, vectordb):
+        """Test upserting vectors from a 2D NumPy array in batches."""
+        import numpy as np
+
+        await vectordb.create_collection("test_numpy", dimension=3)
+
+        vectors = np.random.rand(25, 3).astype(np.float32)
+        ids = [f"vec{i}" for i in range(25)]
+        payloads = [{"index": i} for i in range(25)]
+
+        count = await vectordb.upsert_from_numpy(
+            "test_numpy", ids, vectors, payloads, batch_size=10
+        )
+        assert count == 25
+
+        total = await vectordb.count("test_numpy")
+        assert total == 25
+
+    @pytest.mark.asyncio
+    async def test_upsert_from_numpy_length_mismatch(self, vectordb):
+        """Test upsert_from_numpy rejects mismatched input lengths."""
+        import numpy as np
+
+        with pytest.raises(ValueError, match="same length"):
+            await vectordb.upsert_from_numpy(
+                "test_numpy", ["vec1"], np.zeros((2, 3), dtype=np.float32), [{}]
+            )
+
+    @pytest.mark.asyncio
+    async def test_upsert_from_numpy_int_ids(self, vectordb):
+        """Test the NumPy paths store integer ids as strings."""
+        import numpy as np
+
+        await vectordb.create_collection("test_numpy_int", dimension=3)
+
+        vectors = np.random.rand(2, 3).astype(np.float32)
+        count = await vectordb.upsert_from_numpy(
+            "test_numpy_int", [2, 3], vectors, [{"index": 2}, {"index": 3}]
+        )
+        assert count == 2
+
+        count = await vectordb.upsert_bulk_binary(
+            "test_numpy_int", [4], vectors[:1], [{"index": 4}]
+        )
+        assert count == 1
+
+        stored = await vectordb.get("test_numpy_int", ["2", "3", "4"])
+        assert sorted(v.id for v in stored) == ["2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_bulk_binary(self, vectordb):
+        """Test append-only bulk load of new IDs."""
+        import numpy as np
+
+        await vectordb.create_collection("test_bulk", dimension=3)
+
+        vectors = np.random.rand(20, 3).astype(np.float32)
+        count = await vectordb.upsert_bulk_binary(
+            "test_bulk",
+            [f"vec{i}" for i in range(20)],
+            vectors,
+            [{"index": i} for i in range(20)],
+        )
+        assert count == 20
+        assert await vectordb.count("test_bulk") == 20
+
+    @pytest.mark.asyncio
+    async def test_upsert_shared_payload_ref(self, vectordb):
+        """Test records can share one PayloadRef."""
+        await vectordb.create_collection("test_payload_ref", dimension=3)
+
+        shared = PayloadRef({"source": "react", "version": "18"})
+        records = [
+            VectorRecord(id=f"vec{i}", vector=[0.1 * i, 0.2, 0.3], payload=shared)
+            for i in range(3)
+        ]
+        count = await vectordb.upsert("test_payload_ref", records)
+        assert count == 3
+
+        results = await vectordb.search(
+            collection="test_payload_ref",
+            query_vector=[0.1, 0.2, 0.3],
+            limit=3,
+        )
+        assert all(r.payload == {"source": "react", "version": "18"} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_collection_handle_cached(self, vectordb, mocker):
+        """Test collection handles are resolved once and dropped on delete."""
+        await vectordb.create_collection("test_cache", dimension=3)
+        vectordb._collections.clear()
+        spy = mocker.spy(vectordb._client, "get_collection")
+
+        records = [VectorRecord(id="vec1", vector=[0.1, 0.2, 0.3], payload={"k": 1})]
+        await vectordb.upsert("test_cache", records)
+        await vectordb.search("test_cache", query_vector=[0.1, 0.2, 0.3])
+        await vectordb.count("test_cache")
+        assert spy.call_count == 1
+
+        await vectordb.delete_collection("test_cache")
+        assert "test_cache" not in vectordb._collections
+
     @pytest.mark.asyncio
     async def test_search_basic(self, vectordb):
         """Test basic vector search."""
@@ -221,6 +574,22 @@ class TestChromaVectorDB:
         assert results[0].id == "vec1"  # Closest to x-axis
         assert results[0].score > results[1].score  # Best match first
 
+    @pytest.mark.asyncio
+    async def test_search_with_payload_selection(self, vectordb):
+        """Test with_payload can skip metadata or keep selected keys."""
+        await vectordb.create_collection("test_payload", dimension=3)
+        records = [
+            VectorRecord(id="vec1", vector=[1.0, 0.0, 0.0], payload={"name": "x", "body": "long"}),
+        ]
+        await vectordb.upsert("test_payload", records)
+
+        bare = await vectordb.search("test_payload", [1.0, 0.0, 0.0], with_payload=False)
+        assert bare[0].id == "vec1"
+        assert bare[0].payload == {}
+
+        selected = await vectordb.search("test_payload", [1.0, 0.0, 0.0], with_payload=["name"])
+        assert selected[0].payload == {"name": "x"}
+
     @pytest.mark.asyncio
     async def test_search_with_limit(self, vectordb):
         """Test search respects limit parameter."""
@@ -266,6 +635,86 @@ class TestChromaVectorDB:
         assert results[0].id == "vec1"
         assert results[0].score >= 0.8
 
+    @pytest.mark.asyncio
+    async def test_search_skips_documents(self, vectordb, mocker):
+        """Test search only asks ChromaDB for metadatas and distances."""
+        await vectordb.create_collection("test_include", dimension=3)
+        records = [VectorRecord(id="vec1", vector=[1.0, 0.0, 0.0], payload={"k": 1})]
+        await vectordb.upsert("test_include", records)
+
+        coll = await vectordb._get_collection("test_include")
+        spy = mocker.spy(coll, "query")
+        await vectordb.search(collection="test_include", query_vector=[1.0, 0.0, 0.0])
+
+        assert spy.call_args.kwargs["include"] == ["metadatas", "distances"]
+
+    @pytest.mark.asyncio
+    async def test_search_iter_matches_search(self, vectordb):
+        """Test paged iteration yields the same hits as a one-shot search."""
+        await vectordb.create_collection("test_search_iter", dimension=3)
+        records = [
+            VectorRecord(id=f"vec{i}", vector=[1.0, i * 0.1, 0.0], payload={"index": i})
+            for i in range(12)
+        ]
+        await vectordb.upsert("test_search_iter", records)
+
+        expected = await vectordb.search(
+            collection="test_search_iter", query_vector=[1.0, 0.0, 0.0], limit=10
+        )
+        streamed = [
+            r
+            async for r in vectordb.search_iter(
+                "test_search_iter", query_vector=[1.0, 0.0, 0.0], limit=10, page_size=3
+            )
+        ]
+
+        assert [r.id for r in streamed] == [r.id for r in expected]
+
+    @pytest.mark.asyncio
+    async def test_search_iter_stops_at_collection_size(self, vectordb):
+        """Test paged iteration ends when the collection runs out of hits."""
+        await vectordb.create_collection("test_search_iter_small", dimension=3)
+        records = [
+            VectorRecord(id=f"vec{i}", vector=[1.0, i * 0.1, 0.0], payload={"index": i})
+            for i in range(5)
+        ]
+        await vectordb.upsert("test_search_iter_small", records)
+
+        streamed = [
+            r
+            async for r in vectordb.search_iter(
+                "test_search_iter_small", query_vector=[1.0, 0.0, 0.0], limit=100, page_size=2
+            )
+        ]
+
+        assert len(streamed) == 5
+        assert len({r.id for r in streamed}) == 5
+
+    @pytest.mark.asyncio
+    async def test_search_score_threshold_is_prefix(self, vectordb):
+        """Test thresholded results are the leading hits of an unthresholded search."""
+        await vectordb.create_collection("test_threshold_prefix", dimension=3)
+
+        records = [
+            VectorRecord(id=f"vec{i}", vector=[1.0, i * 0.3, 0.0], payload={"index": i})
+            for i in range(8)
+        ]
+        await vectordb.upsert("test_threshold_prefix", records)
+
+        all_results = await vectordb.search(
+            collection="test_threshold_prefix", query_vector=[1.0, 0.0, 0.0], limit=8
+        )
+        threshold = all_results[3].score
+        results = await vectordb.search(
+            collection="test_threshold_prefix",
+            query_vector=[1.0, 0.0, 0.0],
+            limit=8,
+            score_threshold=threshold,
+        )
+
+        expected = [r.id for r in all_results if r.score >= threshold]
+        assert [r.id for r in results] == expected
+
     @pytest.mark.asyncio
     async def test_search_with_filters(self, vectordb):
         """Test search with metadata filters."""
@@ -345,12 +794,31 @@ class TestChromaVectorDB:
         await vectordb.upsert("test_delete_filter", records)
 
         # Delete all category A
-        deleted = await vectordb.delete("test_delete_filter", filters={"category": "A"})
+        deleted = await vectordb.delete(
+            "test_delete_filter", filters={"category": "A"}, exact_count=True
+        )
         assert deleted == 2
 
         total = await vectordb.count("test_delete_filter")
         assert total == 1
 
+    @pytest.mark.asyncio
+    async def test_delete_by_filter_without_exact_count(self, vectordb):
+        """Test filter-only deletes skip counting and return -1."""
+        await vectordb.create_collection("test_delete_estimate", dimension=3)
+
+        records = [
+            VectorRecord(id="vec1", vector=[0.1, 0.2, 0.3], payload={"category": "A"}),
+            VectorRecord(id="vec2", vector=[0.2, 0.3, 0.4], payload={"category": "B"}),
+        ]
+        await vectordb.upsert("test_delete_estimate", records)
+
+        deleted = await vectordb.delete("test_delete_estimate", filters={"category": "A"})
+        assert deleted == -1
+
+        total = await vectordb.count("test_delete_estimate")
+        assert total == 1
+
     @pytest.mark.asyncio
     async def test_delete_no_params(self, vectordb):
         """Test delete raises error when no params provided."""
@@ -373,6 +841,21 @@ class TestChromaVectorDB:
         with pytest.raises(ValueError, match="does not exist"):
             await vectordb.count("nonexistent")
 
+    @pytest.mark.asyncio
+    async def test_distances_to_scores_matches_scalar(self, vectordb):
+        """Test the vectorized conversion agrees with the scalar one."""
+        import numpy as np
+
+        distances = np.array([0.0, 0.25, 1.0, 1.5, 2.0, 3.0], dtype=np.float32)
+        for metric in ("cosine", "l2", "ip", "unknown"):
+            scores = vectordb._distances_to_scores(-distances if metric == "ip" else distances, metric)
+            expected = [
+                vectordb._distance_to_score(float(-d if metric == "ip" else d), metric)
+                for d in distances
+            ]
+            assert scores.dtype == np.float32
+            assert scores.tolist() == pytest.approx(expected, abs=1e-6)
+
     @pytest.mark.asyncio
     async def test_distance_to_score_cosine(self, vectordb):
         """Test distance to score conversion for cosine metric."""
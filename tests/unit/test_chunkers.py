@@ -148,6 +148,18 @@ Content for section 2."""
         for chunk in chunks:
             assert len(chunk.content) <= 100 + 50  # Some tolerance
 
+    @pytest.mark.asyncio
+    async def test_chunk_long_section_lines(self):
+        """Test lines of a long section are grouped, stripped and newline-joined."""
+        chunker = SemanticChunker(max_chunk_size=30)
+        text = "alpha line one\nbeta line two\n  gamma indented \n \ndelta"
+        chunks = await chunker.chunk(text)
+
+        assert [chunk.content for chunk in chunks] == [
+            "alpha line one\nbeta line two",
+            "gamma indented\ndelta",
+        ]
+
     @pytest.mark.asyncio
     async def test_chunk_metadata(self, chunker):
         """Test metadata propagation."""
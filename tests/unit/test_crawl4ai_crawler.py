@@ -0,0 +1,204 @@
+"""Tests for Crawl4AI crawler."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from docvector.ingestion.crawl4ai_crawler import Crawl4AICrawler
+
+
+def make_result(url, links):
+    """Build a successful crawl4ai result linking to ``links``."""
+    return SimpleNamespace(
+        success=True,
+        markdown=SimpleNamespace(raw_markdown=f"# {url}"),
+        metadata={"title": url},
+        status_code=200,
+        links={"internal": [{"href": link} for link in links]},
+    )
+
+
+def make_stub_crawler(site):
+    """Build a crawler whose arun serves pages from a {url: [links]} dict."""
+
+    async def arun(url, config=None):
+        await asyncio.sleep(0)
+        return make_result(url, site.get(url, []))
+
+    stub = MagicMock()
+    stub.arun = MagicMock(side_effect=arun)
+    return stub
+
+
+class TestCrawl4AICrawlerBFS:
+    """Test the BFS worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_crawl_bfs_stops_at_max_pages(self):
+        """Test the crawl stops once max_pages documents are collected."""
+        site = {
+            "https://example.com": [f"https://example.com/page{i}" for i in range(20)],
+        }
+        stub = make_stub_crawler(site)
+        crawler = Crawl4AICrawler(concurrent_requests=4)
+
+        docs = await crawler._crawl_bfs(
+            stub,
+            "https://example.com",
+            max_pages=3,
+            max_depth=2,
+            allowed_domains=["example.com"],
+            respect_robots=False,
+        )
+
+        assert len(docs) == 3
+        assert len({doc.url for doc in docs}) == 3
+
+    @pytest.mark.asyncio
+    async def test_crawl_bfs_fetches_each_url_once(self):
+        """Test pages linking to each other are only fetched once."""
+        site = {
+            "https://example.com": ["https://example.com/a", "https://example.com/b"],
+            "https://example.com/a": ["https://example.com", "https://example.com/b"],
+            "https://example.com/b": ["https://example.com/a", "https://example.com/b#top"],
+        }
+        stub = make_stub_crawler(site)
+        crawler = Crawl4AICrawler(concurrent_requests=2)
+
+        docs = await crawler._crawl_bfs(
+            stub,
+            "https://example.com",
+            max_pages=10,
+            max_depth=3,
+            allowed_domains=["example.com"],
+            respect_robots=False,
+        )
+
+        fetched = [call.kwargs["url"] for call in stub.arun.call_args_list]
+        assert sorted(fetched) == sorted(set(fetched))
+        assert sorted(doc.url for doc in docs) == sorted(site)
+
+    @pytest.mark.asyncio
+    async def test_crawl_bfs_returns_when_frontier_drains(self):
+        """Test the crawl ends and leaves no worker running once the queue is empty."""
+        site = {
+            "https://example.com": ["https://example.com/a"],
+            "https://example.com/a": ["https://other.com/b"],
+        }
+        stub = make_stub_crawler(site)
+        crawler = Crawl4AICrawler(concurrent_requests=3)
+        tasks_before = asyncio.all_tasks()
+
+        docs = await asyncio.wait_for(
+            crawler._crawl_bfs(
+                stub,
+                "https://example.com",
+                max_pages=10,
+                max_depth=5,
+                allowed_domains=["example.com"],
+                respect_robots=False,
+            ),
+            timeout=5,
+        )
+
+        assert [doc.url for doc in docs] == ["https://example.com", "https://example.com/a"]
+        assert [doc.metadata["depth"] for doc in docs] == [0, 1]
+        assert asyncio.all_tasks() == tasks_before
+
+
+class FakeResponse:
+    """Minimal aiohttp response for robots.txt requests."""
+
+    def __init__(self, status, body=""):
+        self.status = status
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def text(self):
+        return self._body
+
+
+def make_session(response=None, error=None):
+    """Build a session whose get returns ``response`` or raises ``error``."""
+    session = MagicMock()
+    session.get = MagicMock(side_effect=error, return_value=response)
+    return session
+
+
+class TestCrawl4AICrawlerRobots:
+    """Test robots.txt loading."""
+
+    @pytest.mark.asyncio
+    async def test_robots_txt_rules_are_parsed(self):
+        """Test a 200 robots.txt is parsed and applied."""
+        crawler = Crawl4AICrawler()
+        crawler._session = make_session(
+            FakeResponse(200, "User-agent: *\nDisallow: /private/\n")
+        )
+
+        assert await crawler._can_fetch("https://example.com/docs")
+        assert not await crawler._can_fetch("https://example.com/private/page")
+        crawler._session.get.assert_called_once_with("https://example.com/robots.txt")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [401, 403])
+    async def test_robots_txt_auth_error_disallows_all(self, status):
+        """Test a 401 or 403 robots.txt blocks the whole host."""
+        crawler = Crawl4AICrawler()
+        crawler._session = make_session(FakeResponse(status))
+
+        assert not await crawler._can_fetch("https://example.com/docs")
+
+    @pytest.mark.asyncio
+    async def test_robots_txt_missing_allows_all(self):
+        """Test any other 4xx robots.txt allows the whole host."""
+        crawler = Crawl4AICrawler()
+        crawler._session = make_session(FakeResponse(404))
+
+        assert await crawler._can_fetch("https://example.com/docs")
+
+    @pytest.mark.asyncio
+    async def test_robots_txt_fetch_error_allows_all(self):
+        """Test a failed robots.txt request allows the whole host."""
+        crawler = Crawl4AICrawler()
+        crawler._session = make_session(error=ConnectionError("refused"))
+
+        assert await crawler._can_fetch("https://example.com/docs")
+        assert crawler._robots_cache["https://example.com"].allow_all
+        assert not crawler._robots_pending
+
+    @pytest.mark.asyncio
+    async def test_concurrent_can_fetch_shares_one_request(self):
+        """Test concurrent checks for a new host fetch its robots.txt once."""
+        crawler = Crawl4AICrawler()
+        release = asyncio.Event()
+
+        class SlowResponse(FakeResponse):
+            async def text(self):
+                await release.wait()
+                return "User-agent: *\nDisallow: /private/\n"
+
+        crawler._session = make_session(SlowResponse(200))
+
+        checks = asyncio.gather(
+            *(crawler._can_fetch(f"https://example.com/page{i}") for i in range(5)),
+            crawler._can_fetch("https://example.com/private/page"),
+        )
+        await asyncio.sleep(0)
+        assert "https://example.com" in crawler._robots_pending
+        release.set()
+
+        assert await checks == [True] * 5 + [False]
+        crawler._session.get.assert_called_once_with("https://example.com/robots.txt")
+        assert not crawler._robots_pending
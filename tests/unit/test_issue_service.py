@@ -265,21 +265,21 @@ class TestIssueVoteOperations:
 
         with patch.object(issue_service.issue_repo, 'get_by_id', new_callable=AsyncMock) as mock_get_i:
             with patch.object(issue_service.vote_repo, 'upsert', new_callable=AsyncMock) as mock_upsert:
-                with patch.object(issue_service.vote_repo, 'get_vote_score', new_callable=AsyncMock) as mock_score:
-                    with patch.object(issue_service.issue_repo, 'update', new_callable=AsyncMock):
-                        mock_get_i.return_value = mock_issue
-                        mock_upsert.return_value = mock_vote
-                        mock_score.return_value = 1
-
-                        result = await issue_service.vote(
-                            target_type="issue",
-                            target_id=issue_id,
-                            voter_id="agent-123",
-                            voter_type="agent",
-                            value=1,
-                        )
-
-                        assert result.value == 1
+                with patch.object(issue_service.vote_repo, 'refresh_score', new_callable=AsyncMock) as mock_score:
+                    mock_get_i.return_value = mock_issue
+                    mock_upsert.return_value = mock_vote
+                    mock_score.return_value = 1
+
+                    result = await issue_service.vote(
+                        target_type="issue",
+                        target_id=issue_id,
+                        voter_id="agent-123",
+                        voter_type="agent",
+                        value=1,
+                    )
+
+                    assert result.value == 1
+                    mock_score.assert_called_once_with(Issue, "issue", issue_id)
 
     @pytest.mark.asyncio
     async def test_vote_on_solution(self, issue_service, mock_session):
@@ -299,21 +299,21 @@ class TestIssueVoteOperations:
 
         with patch.object(issue_service.solution_repo, 'get_by_id', new_callable=AsyncMock) as mock_get_s:
             with patch.object(issue_service.vote_repo, 'upsert', new_callable=AsyncMock) as mock_upsert:
-                with patch.object(issue_service.vote_repo, 'get_vote_score', new_callable=AsyncMock) as mock_score:
-                    with patch.object(issue_service.solution_repo, 'update', new_callable=AsyncMock):
-                        mock_get_s.return_value = mock_solution
-                        mock_upsert.return_value = mock_vote
-                        mock_score.return_value = -1
-
-                        result = await issue_service.vote(
-                            target_type="solution",
-                            target_id=solution_id,
-                            voter_id="agent-123",
-                            voter_type="agent",
-                            value=-1,
-                        )
-
-                        assert result.value == -1
+                with patch.object(issue_service.vote_repo, 'refresh_score', new_callable=AsyncMock) as mock_score:
+                    mock_get_s.return_value = mock_solution
+                    mock_upsert.return_value = mock_vote
+                    mock_score.return_value = -1
+
+                    result = await issue_service.vote(
+                        target_type="solution",
+                        target_id=solution_id,
+                        voter_id="agent-123",
+                        voter_type="agent",
+                        value=-1,
+                    )
+
+                    assert result.value == -1
+                    mock_score.assert_called_once_with(Solution, "solution", solution_id)
 
     @pytest.mark.asyncio
     async def test_invalid_target_type_raises_error(self, issue_service):
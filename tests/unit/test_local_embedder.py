@@ -1,8 +1,11 @@
 """Tests for LocalEmbedder with registry integration."""
 
+from unittest.mock import MagicMock, patch
+
+import numpy as np
 import pytest
 
-from docvector.embeddings.local_embedder import LocalEmbedder
+from docvector.embeddings.local_embedder import LocalEmbedder, _load_model, _resolve_device
 from docvector.embeddings.registry import DEFAULT_MODEL, EMBEDDING_MODELS
 
 
@@ -109,6 +112,64 @@ class TestDeviceAndBatchSize:
         )
         assert embedder.batch_size == 64
 
+    def test_explicit_device_not_resolved(self):
+        """Should pass explicit devices through unchanged."""
+        assert _resolve_device("cpu") == "cpu"
+        assert _resolve_device("cuda") == "cuda"
+
+    def test_auto_device_resolves_to_available_device(self):
+        """Should resolve auto to a concrete device."""
+        assert _resolve_device("auto") in {"cpu", "cuda", "mps"}
+
+
+class TestBackend:
+    """Tests for inference backend selection."""
+
+    def test_default_backend_is_torch(self):
+        """Should use the torch backend unless configured otherwise."""
+        embedder = LocalEmbedder(model_name="sentence-transformers/all-MiniLM-L6-v2")
+        assert embedder.backend == "torch"
+
+    def test_onnx_backend_requested(self):
+        """Should load the model with the requested backend."""
+        with patch("docvector.embeddings.local_embedder.SentenceTransformer") as model_cls:
+            model = _load_model("org/model", "cpu", "onnx")
+
+        model_cls.assert_called_once_with("org/model", device="cpu", backend="onnx")
+        assert model is model_cls.return_value
+
+    def test_unavailable_backend_falls_back_to_torch(self):
+        """Should fall back to a torch model when the backend cannot load."""
+        torch_model = MagicMock()
+        with patch(
+            "docvector.embeddings.local_embedder.SentenceTransformer",
+            side_effect=[ImportError("optimum not installed"), torch_model],
+        ) as model_cls:
+            model = _load_model("org/model", "cpu", "onnx")
+
+        assert model is torch_model
+        assert model_cls.call_args_list[-1].args == ("org/model",)
+
+    def test_half_precision_on_cuda(self):
+        """Should cast a CUDA torch model to half precision."""
+        import torch
+
+        with patch("docvector.embeddings.local_embedder.SentenceTransformer") as model_cls:
+            with patch("torch.cuda.is_bf16_supported", return_value=False):
+                model = _load_model("org/model", "cuda", "torch", half_precision=True)
+
+        cuda_model = model_cls.return_value.to.return_value
+        cuda_model.to.assert_called_once_with(dtype=torch.float16)
+        assert model is cuda_model.to.return_value
+
+    def test_half_precision_ignored_on_cpu(self):
+        """Should keep a CPU model in float32."""
+        with patch("docvector.embeddings.local_embedder.SentenceTransformer") as model_cls:
+            model = _load_model("org/model", "cpu", "torch", half_precision=True)
+
+        model_cls.return_value.to.assert_not_called()
+        assert model is model_cls.return_value
+
 
 class TestModelNotLoaded:
     """Tests for behavior before model loading."""
@@ -124,6 +185,24 @@ class TestModelNotLoaded:
         assert embedder._dimension is None
 
 
+class TestEmbedArray:
+    """Tests for array output."""
+
+    @pytest.mark.asyncio
+    async def test_embed_array_returns_contiguous_float32(self):
+        """embed_array should return one float32 block, embed plain lists."""
+        embedder = LocalEmbedder(model_name="sentence-transformers/all-MiniLM-L6-v2")
+        embedder.model = MagicMock()
+        embedder.model.encode.return_value = np.ones((2, 3), dtype=np.float64)
+
+        result = await embedder.embed_array(["a", "b"])
+
+        assert result.dtype == np.float32
+        assert result.flags["C_CONTIGUOUS"]
+        assert result.shape == (2, 3)
+        assert await embedder.embed(["a", "b"]) == [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0]]
+
+
 class TestOpenAIModelValidation:
     """Tests for OpenAI model rejection in LocalEmbedder."""
 
@@ -72,6 +72,36 @@ class TestHTMLParser:
         assert "color:red" not in result.content
         assert "Content" in result.content
 
+    @pytest.mark.asyncio
+    async def test_parse_html_skips_nested_navigation(self, parser):
+        """Test navigation chrome is skipped, including tags nested inside it."""
+        html = (
+            b"<html><body><nav><ul><li>Home</li><li><span>Docs</span></li></ul></nav>"
+            b"<p>First</p><div><footer>Copyright</footer><p>Second</p></div></body></html>"
+        )
+        result = await parser.parse(html)
+
+        assert "Home" not in result.content
+        assert "Docs" not in result.content
+        assert "Copyright" not in result.content
+        assert "First" in result.content
+        assert "Second" in result.content
+
+    @pytest.mark.asyncio
+    async def test_parse_html_main_content_skips_matches_in_removed_tags(self, parser):
+        """Test main content lookup passes over matches inside navigation chrome."""
+        body = "Real documentation text. " * 20
+        html = (
+            b"<html><body><header><article>Site banner</article></header>"
+            b"<p>Sidebar teaser</p>"
+            b"<article><p>" + body.encode() + b"</p></article></body></html>"
+        )
+        result = await parser.parse(html)
+
+        assert "Real documentation text." in result.content
+        assert "Site banner" not in result.content
+        assert "Sidebar teaser" not in result.content
+
     @pytest.mark.asyncio
     async def test_parse_html_extracts_language(self, parser):
         """Test language extraction."""
@@ -91,13 +91,13 @@ class TestQuestionOperations:
         question_id = uuid4()
         tag_id = uuid4()
 
-        with patch.object(qa_service.tag_repo, 'get_or_create', new_callable=AsyncMock) as mock_get_tag:
-            with patch.object(qa_service.tag_repo, 'increment_usage', new_callable=AsyncMock):
+        with patch.object(qa_service.tag_repo, 'get_or_create_many', new_callable=AsyncMock) as mock_get_tags:
+            with patch.object(qa_service.tag_repo, 'increment_usage_many', new_callable=AsyncMock) as mock_increment:
                 with patch.object(qa_service.question_repo, 'create', new_callable=AsyncMock) as mock_create:
                     mock_tag = MagicMock(spec=Tag)
                     mock_tag.id = tag_id
                     mock_tag.name = "async"
-                    mock_get_tag.return_value = mock_tag
+                    mock_get_tags.return_value = [mock_tag]
 
                     mock_question = MagicMock(spec=Question)
                     mock_question.id = question_id
@@ -114,7 +114,8 @@ class TestQuestionOperations:
                     )
 
                     assert len(result.tags) == 1
-                    mock_get_tag.assert_called_once_with("async")
+                    mock_get_tags.assert_called_once_with(["async"])
+                    mock_increment.assert_called_once_with([tag_id])
 
     @pytest.mark.asyncio
     async def test_get_question_not_found(self, qa_service):
@@ -237,22 +238,22 @@ class TestVoteOperations:
 
         with patch.object(qa_service.question_repo, 'get_by_id', new_callable=AsyncMock) as mock_get_q:
             with patch.object(qa_service.vote_repo, 'upsert', new_callable=AsyncMock) as mock_upsert:
-                with patch.object(qa_service.vote_repo, 'get_vote_score', new_callable=AsyncMock) as mock_score:
-                    with patch.object(qa_service.question_repo, 'update', new_callable=AsyncMock):
-                        mock_get_q.return_value = mock_question
-                        mock_upsert.return_value = mock_vote
-                        mock_score.return_value = 1
-
-                        result = await qa_service.vote(
-                            target_type="question",
-                            target_id=question_id,
-                            voter_id="agent-123",
-                            voter_type="agent",
-                            value=1,
-                        )
-
-                        assert result.value == 1
-                        mock_upsert.assert_called_once()
+                with patch.object(qa_service.vote_repo, 'refresh_score', new_callable=AsyncMock) as mock_score:
+                    mock_get_q.return_value = mock_question
+                    mock_upsert.return_value = mock_vote
+                    mock_score.return_value = 1
+
+                    result = await qa_service.vote(
+                        target_type="question",
+                        target_id=question_id,
+                        voter_id="agent-123",
+                        voter_type="agent",
+                        value=1,
+                    )
+
+                    assert result.value == 1
+                    mock_upsert.assert_called_once()
+                    mock_score.assert_called_once_with(Question, "question", question_id)
 
     @pytest.mark.asyncio
     async def test_invalid_vote_value_raises_error(self, qa_service):
@@ -4,6 +4,7 @@ import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import grpc
 import pytest
 
 # Add src to path for imports
@@ -47,6 +48,16 @@ def mock_qdrant_client():
     return client
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Keep shared clients from leaking between tests."""
+    from docvector.vectordb import qdrant_client
+
+    qdrant_client._client_cache.clear()
+    yield
+    qdrant_client._client_cache.clear()
+
+
 @pytest.fixture
 async def vectordb(mock_qdrant_client):
     """Create QdrantVectorDB instance with mocked client."""
@@ -64,19 +75,34 @@ async def vectordb(mock_qdrant_client):
     await db.close()
 
 
+class FakeRpcError(grpc.RpcError):
+    """gRPC call error like those qdrant-client raises with prefer_grpc=True."""
+
+    def __init__(self, code, details=""):
+        super().__init__(details)
+        self._code = code
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+
 class TestQdrantVectorDB:
     """Test Qdrant vector database implementation."""
 
     @pytest.mark.asyncio
     async def test_initialize_local(self, mock_qdrant_client):
         """Test Qdrant initialization for local deployment."""
-        db = QdrantVectorDB(host="localhost", port=6333)
+        db = QdrantVectorDB(host="localhost", port=6333, use_grpc=False)
 
         with patch("docvector.vectordb.qdrant_client.AsyncQdrantClient", return_value=mock_qdrant_client) as mock_class:
             await db.initialize()
 
             # Verify AsyncQdrantClient was called with correct args
-            mock_class.assert_called_once_with(host="localhost", port=6333)
+            mock_class.assert_called_once_with(host="localhost", port=6333, pool_size=100)
             assert db.client is not None
 
     @pytest.mark.asyncio
@@ -87,7 +113,9 @@ class TestQdrantVectorDB:
         with patch("docvector.vectordb.qdrant_client.AsyncQdrantClient", return_value=mock_qdrant_client) as mock_class:
             await db.initialize()
 
-            mock_class.assert_called_once_with(host="localhost", grpc_port=6334, prefer_grpc=True)
+            mock_class.assert_called_once_with(
+                host="localhost", grpc_port=6334, prefer_grpc=True, pool_size=None
+            )
 
     @pytest.mark.asyncio
     async def test_initialize_cloud(self, mock_qdrant_client):
@@ -97,7 +125,61 @@ class TestQdrantVectorDB:
         with patch("docvector.vectordb.qdrant_client.AsyncQdrantClient", return_value=mock_qdrant_client) as mock_class:
             await db.initialize()
 
-            mock_class.assert_called_once_with(url="https://example.qdrant.cloud", api_key="test-key")
+            mock_class.assert_called_once_with(
+                url="https://example.qdrant.cloud", api_key="test-key", pool_size=100
+            )
+
+    @pytest.mark.asyncio
+    async def test_initialize_defaults_to_grpc(self, mock_qdrant_client):
+        """Test local deployments use gRPC unless disabled."""
+        from docvector.core import Settings
+
+        assert Settings.model_fields["qdrant_use_grpc"].default is True
+
+        db = QdrantVectorDB(host="localhost")
+        with patch("docvector.vectordb.qdrant_client.AsyncQdrantClient", return_value=mock_qdrant_client) as mock_class:
+            await db.initialize()
+
+            assert mock_class.call_args.kwargs["prefer_grpc"] is True
+
+    @pytest.mark.asyncio
+    async def test_initialize_grpc_falls_back_to_http(self, mock_qdrant_client):
+        """Test an unreachable gRPC port falls back to the HTTP transport."""
+        grpc_client = AsyncMock()
+        grpc_client.get_collections.side_effect = ConnectionError("unreachable")
+        db = QdrantVectorDB(host="localhost", port=6333, use_grpc=True)
+
+        with patch(
+            "docvector.vectordb.qdrant_client.AsyncQdrantClient",
+            side_effect=[grpc_client, mock_qdrant_client],
+        ) as mock_class:
+            await db.initialize()
+
+            assert db.client is mock_qdrant_client
+            grpc_client.close.assert_awaited_once()
+            assert mock_class.call_args.kwargs == {"host": "localhost", "port": 6333, "pool_size": 100}
+
+    @pytest.mark.asyncio
+    async def test_initialize_pool_size(self, mock_qdrant_client):
+        """Test an explicit pool size is passed to the client."""
+        db = QdrantVectorDB(host="localhost", grpc_port=6334, use_grpc=True, pool_size=8)
+
+        with patch("docvector.vectordb.qdrant_client.AsyncQdrantClient", return_value=mock_qdrant_client) as mock_class:
+            await db.initialize()
+
+            assert mock_class.call_args.kwargs["pool_size"] == 8
+
+    @pytest.mark.asyncio
+    async def test_initialize_concurrent(self, mock_qdrant_client):
+        """Test concurrent first-time initialization creates one client."""
+        import asyncio
+
+        db = QdrantVectorDB(host="localhost", port=6333, use_grpc=False)
+
+        with patch("docvector.vectordb.qdrant_client.AsyncQdrantClient", return_value=mock_qdrant_client) as mock_class:
+            await asyncio.gather(*(db.initialize() for _ in range(5)))
+
+            mock_class.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_initialize_idempotent(self, vectordb):
@@ -113,6 +195,56 @@ class TestQdrantVectorDB:
         await vectordb.close()
         assert vectordb.client is None
 
+    @pytest.mark.asyncio
+    async def test_close_closes_last_reference(self, vectordb, mock_qdrant_client):
+        """Test closing the only user of a shared client closes it."""
+        await vectordb.close()
+        mock_qdrant_client.close.assert_awaited_once()
+
+        await vectordb.close()
+        mock_qdrant_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_instances_share_client(self, mock_qdrant_client):
+        """Test instances with the same settings reuse one client."""
+        from docvector.vectordb.qdrant_client import shutdown_all
+
+        first = QdrantVectorDB(host="localhost", port=6333, use_grpc=False)
+        second = QdrantVectorDB(host="localhost", port=6333, use_grpc=False)
+        other = QdrantVectorDB(host="otherhost", port=6333, use_grpc=False)
+        other_client = AsyncMock()
+
+        with patch(
+            "docvector.vectordb.qdrant_client.AsyncQdrantClient",
+            side_effect=[mock_qdrant_client, other_client],
+        ) as mock_class:
+            await first.initialize()
+            await second.initialize()
+            await other.initialize()
+
+        assert first.client is mock_qdrant_client
+        assert second.client is mock_qdrant_client
+        assert other.client is other_client
+        assert mock_class.call_count == 2
+
+        # The shared client stays open until its last user is closed
+        await first.close()
+        mock_qdrant_client.close.assert_not_called()
+        await second.close()
+        mock_qdrant_client.close.assert_awaited_once()
+
+        await shutdown_all()
+        other_client.close.assert_awaited_once()
+
+        # Closing after shutdown_all does not close the client again
+        await other.close()
+        other_client.close.assert_awaited_once()
+
+        # A fresh client is created after shutdown
+        with patch("docvector.vectordb.qdrant_client.AsyncQdrantClient") as mock_class:
+            await QdrantVectorDB(host="localhost", port=6333, use_grpc=False).initialize()
+            mock_class.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_create_collection_cosine(self, vectordb, mock_qdrant_client):
         """Test creating collection with cosine metric."""
@@ -160,6 +292,90 @@ class TestQdrantVectorDB:
         call_args = mock_qdrant_client.create_collection.call_args
         assert call_args.kwargs["vectors_config"].distance == models.Distance.DOT
 
+    @pytest.mark.asyncio
+    async def test_create_collection_distance_enum(self, vectordb, mock_qdrant_client):
+        """Test Distance members and mixed-case names resolve to the same metric."""
+        from qdrant_client import models
+
+        from docvector.vectordb import Distance
+
+        await vectordb.create_collection("test_enum", dimension=8, distance_metric=Distance.DOT)
+        call_args = mock_qdrant_client.create_collection.call_args
+        assert call_args.kwargs["vectors_config"].distance == models.Distance.DOT
+
+        await vectordb.create_collection("test_mixed", dimension=8, distance_metric="Euclidean")
+        call_args = mock_qdrant_client.create_collection.call_args
+        assert call_args.kwargs["vectors_config"].distance == models.Distance.EUCLID
+
+    @pytest.mark.asyncio
+    async def test_create_collection_metric_aliases(self, vectordb, mock_qdrant_client):
+        """Test backend metric names such as "Euclid" and "l2" are accepted."""
+        from qdrant_client import models
+
+        for alias in ("Euclid", "L2"):
+            await vectordb.create_collection(f"test_{alias}", dimension=8, distance_metric=alias)
+            call_args = mock_qdrant_client.create_collection.call_args
+            assert call_args.kwargs["vectors_config"].distance == models.Distance.EUCLID
+
+        await vectordb.create_collection("test_ip", dimension=8, distance_metric="ip")
+        call_args = mock_qdrant_client.create_collection.call_args
+        assert call_args.kwargs["vectors_config"].distance == models.Distance.DOT
+
+    @pytest.mark.asyncio
+    async def test_create_collection_quantization(self, vectordb, mock_qdrant_client):
+        """Test new collections use int8 scalar quantization unless overridden."""
+        from qdrant_client import models
+
+        await vectordb.create_collection("test_quant", dimension=8)
+        call_args = mock_qdrant_client.create_collection.call_args
+        config = call_args.kwargs["quantization_config"]
+        assert config.scalar.type == models.ScalarType.INT8
+        assert config.scalar.quantile == 0.99
+        assert call_args.kwargs["vectors_config"].on_disk is False
+
+        await vectordb.create_collection("test_plain", dimension=8, quantization="none")
+        call_args = mock_qdrant_client.create_collection.call_args
+        assert call_args.kwargs["quantization_config"] is None
+        assert call_args.kwargs["vectors_config"].on_disk is False
+
+        await vectordb.create_collection("test_on_disk", dimension=8, on_disk=True)
+        call_args = mock_qdrant_client.create_collection.call_args
+        assert call_args.kwargs["vectors_config"].on_disk is True
+
+        with pytest.raises(ValueError, match="Unknown quantization"):
+            await vectordb.create_collection("test_bad", dimension=8, quantization="int4")
+
+    @pytest.mark.asyncio
+    async def test_search_params_forwarded(self, vectordb, mock_qdrant_client):
+        """Test quantization search params reach the query."""
+        from qdrant_client import models
+
+        params = models.SearchParams(
+            quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+        )
+        await vectordb.search("test_search", [0.1, 0.2, 0.3], search_params=params)
+        assert mock_qdrant_client.query_points.call_args.kwargs["search_params"] is params
+
+    @pytest.mark.asyncio
+    async def test_create_collection_bulk_load(self, vectordb, mock_qdrant_client):
+        """Test bulk-load collections defer indexing until finalize_index."""
+        await vectordb.create_collection("test_bulk", dimension=8, bulk_load=True)
+        optimizers = mock_qdrant_client.create_collection.call_args.kwargs["optimizers_config"]
+        assert optimizers.indexing_threshold == 0
+
+        await vectordb.finalize_index("test_bulk")
+        call_args = mock_qdrant_client.update_collection.call_args
+        assert call_args.kwargs["collection_name"] == "test_bulk"
+        assert call_args.kwargs["optimizers_config"].indexing_threshold == 100
+
+    @pytest.mark.asyncio
+    async def test_create_collection_unknown_metric(self, vectordb, mock_qdrant_client):
+        """Test an unknown distance metric is rejected before any RPC."""
+        with pytest.raises(ValueError):
+            await vectordb.create_collection("test_typo", dimension=8, distance_metric="cosin")
+
+        mock_qdrant_client.create_collection.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_create_collection_already_exists(self, vectordb, mock_qdrant_client):
         """Test creating collection that already exists."""
@@ -200,6 +416,19 @@ class TestQdrantVectorDB:
         exists = await vectordb.collection_exists("test_exists")
         assert exists is True
 
+    @pytest.mark.asyncio
+    async def test_collection_exists_cached(self, vectordb, mock_qdrant_client):
+        """Test a positive existence check is remembered until deletion."""
+        mock_qdrant_client.get_collection.return_value = MagicMock()
+
+        assert await vectordb.collection_exists("test_cached") is True
+        assert await vectordb.collection_exists("test_cached") is True
+        assert mock_qdrant_client.get_collection.call_count == 1
+
+        await vectordb.delete_collection("test_cached")
+        mock_qdrant_client.get_collection.side_effect = Exception("Not found")
+        assert await vectordb.collection_exists("test_cached") is False
+
     @pytest.mark.asyncio
     async def test_collection_exists_false(self, vectordb, mock_qdrant_client):
         """Test checking if collection exists (false case)."""
@@ -253,7 +482,86 @@ class TestQdrantVectorDB:
         mock_qdrant_client.upsert.assert_called_once()
         call_args = mock_qdrant_client.upsert.call_args
         assert call_args.kwargs["collection_name"] == "test_collection"
-        assert len(call_args.kwargs["points"]) == 1
+        assert call_args.kwargs["points"].ids == ["vec1"]
+        assert call_args.kwargs["wait"] is False
+
+    @pytest.mark.asyncio
+    async def test_upsert_numpy_vectors(self, vectordb, mock_qdrant_client):
+        """Test records carrying NumPy vectors are sent as float lists."""
+        import numpy as np
+
+        records = [
+            VectorRecord(id=f"vec{i}", vector=np.full(3, i, dtype=np.float64), payload={})
+            for i in range(2)
+        ]
+
+        assert await vectordb.upsert("test_collection", records) == 2
+
+        batch = mock_qdrant_client.upsert.call_args.kwargs["points"]
+        assert batch.vectors == [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]]
+        assert all(isinstance(v, float) for v in batch.vectors[1])
+
+    @pytest.mark.asyncio
+    async def test_upsert_many(self, vectordb, mock_qdrant_client):
+        """Test upsert_many sends one request per chunk."""
+        records = [
+            VectorRecord(id=f"vec{i}", vector=[0.1, 0.2], payload={"index": i})
+            for i in range(10)
+        ]
+
+        count = await vectordb.upsert_many("test_collection", records, chunk_size=4, max_concurrency=2)
+        assert count == 10
+
+        assert mock_qdrant_client.upsert.call_count == 3
+        sent = sorted(
+            id_ for call in mock_qdrant_client.upsert.call_args_list for id_ in call.kwargs["points"].ids
+        )
+        assert sent == sorted(r.id for r in records)
+
+    @pytest.mark.asyncio
+    async def test_upsert_splits_oversized_batches(self, vectordb, mock_qdrant_client):
+        """Test upsert never sends more than 1024 points in one request."""
+        records = [
+            VectorRecord(id=f"vec{i}", vector=[0.1, 0.2], payload={})
+            for i in range(2500)
+        ]
+
+        count = await vectordb.upsert("test_collection", records)
+        assert count == 2500
+
+        sizes = sorted(
+            len(call.kwargs["points"].ids) for call in mock_qdrant_client.upsert.call_args_list
+        )
+        assert sizes == [452, 1024, 1024]
+
+    @pytest.mark.asyncio
+    async def test_upsert_acknowledged(self, vectordb, mock_qdrant_client):
+        """Test acknowledged (not yet applied) writes count as accepted."""
+        from qdrant_client import models
+
+        mock_qdrant_client.upsert.return_value = MagicMock(status=models.UpdateStatus.ACKNOWLEDGED)
+        records = [VectorRecord(id="vec1", vector=[0.1, 0.2], payload={})]
+
+        assert await vectordb.upsert("test_collection", records) == 1
+
+    @pytest.mark.asyncio
+    async def test_upsert_wait(self, vectordb, mock_qdrant_client):
+        """Test wait=True is passed through for durable writes."""
+        records = [VectorRecord(id="vec1", vector=[0.1, 0.2], payload={})]
+
+        await vectordb.upsert("test_collection", records, wait=True)
+
+        assert mock_qdrant_client.upsert.call_args.kwargs["wait"] is True
+
+    @pytest.mark.asyncio
+    async def test_flush_collection_barrier(self, vectordb, mock_qdrant_client):
+        """Test flush(collection) issues a waited empty upsert as a barrier."""
+        await vectordb.flush("test_collection")
+
+        call_args = mock_qdrant_client.upsert.call_args
+        assert call_args.kwargs["collection_name"] == "test_collection"
+        assert call_args.kwargs["points"].ids == []
+        assert call_args.kwargs["wait"] is True
 
     @pytest.mark.asyncio
     async def test_upsert_multiple_records(self, vectordb, mock_qdrant_client):
@@ -267,7 +575,7 @@ class TestQdrantVectorDB:
         assert count == 10
 
         call_args = mock_qdrant_client.upsert.call_args
-        assert len(call_args.kwargs["points"]) == 10
+        assert len(call_args.kwargs["points"].ids) == 10
 
     @pytest.mark.asyncio
     async def test_upsert_empty(self, vectordb, mock_qdrant_client):
@@ -296,6 +604,86 @@ class TestQdrantVectorDB:
         with pytest.raises(ValueError, match="does not exist"):
             await vectordb.upsert("nonexistent", records)
 
+    @pytest.mark.asyncio
+    async def test_upsert_from_numpy(self, vectordb, mock_qdrant_client):
+        """Test upserting from a NumPy array is split into batches."""
+        import numpy as np
+
+        vectors = np.random.rand(5, 3).astype(np.float32)
+        ids = [f"vec{i}" for i in range(5)]
+        payloads = [{"index": i} for i in range(5)]
+
+        count = await vectordb.upsert_from_numpy(
+            "test_numpy", ids, vectors, payloads, batch_size=2
+        )
+        assert count == 5
+
+        # 5 rows in batches of 2 -> 3 upsert calls
+        assert mock_qdrant_client.upsert.call_count == 3
+        last_batch = mock_qdrant_client.upsert.call_args.kwargs["points"]
+        assert last_batch.ids == ["vec4"]
+        assert last_batch.vectors[0] == pytest.approx(vectors[4].tolist())
+        # Slices are pipelined rather than each waiting to be applied
+        assert mock_qdrant_client.upsert.call_args.kwargs["wait"] is False
+
+    @pytest.mark.asyncio
+    async def test_upsert_bulk_binary(self, vectordb, mock_qdrant_client):
+        """Test bulk load sends batched, unwaited upserts on the async client."""
+        import numpy as np
+
+        vectors = np.random.rand(2050, 3).astype(np.float32)
+        ids = [f"vec{i}" for i in range(2050)]
+
+        count = await vectordb.upsert_bulk_binary("test_bulk", ids, vectors, [{}] * 2050)
+        assert count == 2050
+
+        calls = mock_qdrant_client.upsert.call_args_list
+        assert [len(call.kwargs["points"].ids) for call in calls] == [1024, 1024, 2]
+        assert all(call.kwargs["collection_name"] == "test_bulk" for call in calls)
+        assert all(call.kwargs["wait"] is False for call in calls)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_upserts_coalesced(self, vectordb, mock_qdrant_client):
+        """Test concurrent small upserts share one request per collection."""
+        import asyncio
+
+        counts = await asyncio.gather(*(
+            vectordb.upsert(
+                "test_coalesce",
+                [VectorRecord(id=f"vec{i}", vector=[0.1, 0.2], payload={"index": i})],
+            )
+            for i in range(5)
+        ))
+
+        assert counts == [1] * 5
+        mock_qdrant_client.upsert.assert_called_once()
+        batch = mock_qdrant_client.upsert.call_args.kwargs["points"]
+        assert batch.ids == [f"vec{i}" for i in range(5)]
+        assert len(batch.vectors) == len(batch.payloads) == 5
+
+    @pytest.mark.asyncio
+    async def test_coalesced_upsert_errors_isolated(self, vectordb, mock_qdrant_client):
+        """Test a failing request does not fail the requests merged with it."""
+        import asyncio
+
+        from qdrant_client import models
+
+        async def upsert(collection_name, points, wait):
+            if "bad" in points.ids:
+                raise RuntimeError("rejected")
+            return MagicMock(status=models.UpdateStatus.COMPLETED)
+
+        mock_qdrant_client.upsert.side_effect = upsert
+
+        good, bad = await asyncio.gather(
+            vectordb.upsert("test_coalesce", [VectorRecord(id="good", vector=[0.1], payload={})]),
+            vectordb.upsert("test_coalesce", [VectorRecord(id="bad", vector=[0.1], payload={})]),
+            return_exceptions=True,
+        )
+
+        assert good == 1
+        assert isinstance(bad, RuntimeError)
+
     @pytest.mark.asyncio
     async def test_search_basic(self, vectordb, mock_qdrant_client):
         """Test basic vector search."""
@@ -326,6 +714,51 @@ class TestQdrantVectorDB:
         assert results[0].score == 0.95
         assert results[0].payload == {"name": "test1"}
 
+    @pytest.mark.asyncio
+    async def test_search_with_payload_selection(self, vectordb, mock_qdrant_client):
+        """Test with_payload is forwarded to search and retrieve."""
+        await vectordb.search("test_search", [0.1, 0.2, 0.3], with_payload=("doc_id", "page"))
+        assert mock_qdrant_client.query_points.call_args.kwargs["with_payload"] == ["doc_id", "page"]
+
+        await vectordb.search("test_search", [0.1, 0.2, 0.3], with_payload=False)
+        assert mock_qdrant_client.query_points.call_args.kwargs["with_payload"] is False
+
+        mock_qdrant_client.retrieve.return_value = []
+        await vectordb.get("test_search", ["vec1"], with_payload=["doc_id"])
+        assert mock_qdrant_client.retrieve.call_args.kwargs["with_payload"] == ["doc_id"]
+
+    @pytest.mark.asyncio
+    async def test_get_large_id_list_is_chunked(self, vectordb, mock_qdrant_client):
+        """Test get() and aget() split long id lists into concurrent requests."""
+        def _retrieve(collection_name, ids, **kwargs):
+            return [MagicMock(id=id_, vector=[0.1], payload={}) for id_ in ids]
+
+        mock_qdrant_client.retrieve.side_effect = _retrieve
+        ids = [f"vec{i}" for i in range(600)]
+
+        points = await vectordb.get("test_get", ids)
+        assert [p["id"] for p in points] == ids
+        assert mock_qdrant_client.retrieve.call_count == 3
+
+        streamed = [point["id"] async for point in vectordb.aget("test_get", ids)]
+        assert sorted(streamed) == sorted(ids)
+        assert mock_qdrant_client.retrieve.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_search_keeps_native_ids(self, vectordb, mock_qdrant_client):
+        """Test integer point ids are returned without string conversion."""
+        hit = MagicMock()
+        hit.id = 42
+        hit.score = 0.9
+        hit.payload = {}
+
+        query_result = MagicMock()
+        query_result.points = [hit]
+        mock_qdrant_client.query_points.return_value = query_result
+
+        results = await vectordb.search("test_search", [0.1, 0.2, 0.3])
+        assert results[0].id == 42
+
     @pytest.mark.asyncio
     async def test_search_with_limit(self, vectordb, mock_qdrant_client):
         """Test search respects limit parameter."""
@@ -413,34 +846,75 @@ class TestQdrantVectorDB:
             )
 
     @pytest.mark.asyncio
-    async def test_delete_by_ids(self, vectordb, mock_qdrant_client):
-        """Test deleting vectors by IDs."""
-        # Setup pre and post counts
-        pre_info = MagicMock()
-        pre_info.points_count = 5
+    async def test_search_batch_single_round_trip(self, vectordb, mock_qdrant_client):
+        """Test batch search sends all queries in one call and keeps order."""
+        hit = MagicMock()
+        hit.id = "vec1"
+        hit.score = 0.9
+        hit.payload = {"name": "test1"}
+
+        first = MagicMock()
+        first.points = [hit]
+        second = MagicMock()
+        second.points = []
+        mock_qdrant_client.query_batch_points.return_value = [first, second]
+
+        results = await vectordb.search_batch(
+            collection="test_batch",
+            query_vectors=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+            limit=3,
+            filters={"category": "A"},
+        )
 
-        post_info = MagicMock()
-        post_info.points_count = 3
+        assert len(results) == 2
+        assert results[0][0].id == "vec1"
+        assert results[1] == []
 
-        mock_qdrant_client.get_collection.side_effect = [pre_info, post_info]
+        mock_qdrant_client.query_batch_points.assert_called_once()
+        requests = mock_qdrant_client.query_batch_points.call_args.kwargs["requests"]
+        assert len(requests) == 2
+        assert requests[1].query == [0.4, 0.5, 0.6]
+        assert all(request.limit == 3 for request in requests)
+        assert all(request.filter is not None for request in requests)
 
+    @pytest.mark.asyncio
+    async def test_search_batch_empty(self, vectordb, mock_qdrant_client):
+        """Test batch search with no queries does not hit the server."""
+        assert await vectordb.search_batch("test_batch", []) == []
+        mock_qdrant_client.query_batch_points.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_by_ids(self, vectordb, mock_qdrant_client):
+        """Test deleting vectors by IDs returns len(ids) without counting."""
         deleted = await vectordb.delete("test_delete", ids=["vec1", "vec2"])
         assert deleted == 2
 
+        mock_qdrant_client.delete.assert_called_once()
+        mock_qdrant_client.get_collection.assert_not_called()
+        mock_qdrant_client.count.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_delete_by_filter(self, vectordb, mock_qdrant_client):
         """Test deleting vectors by metadata filter."""
-        pre_info = MagicMock()
-        pre_info.points_count = 5
+        deleted = await vectordb.delete("test_delete", filters={"category": "A"})
+        assert deleted == -1
 
-        post_info = MagicMock()
-        post_info.points_count = 3
+        mock_qdrant_client.delete.assert_called_once()
+        mock_qdrant_client.count.assert_not_called()
 
-        mock_qdrant_client.get_collection.side_effect = [pre_info, post_info]
+    @pytest.mark.asyncio
+    async def test_delete_exact_count(self, vectordb, mock_qdrant_client):
+        """Test exact_count counts matching points once before deleting."""
+        mock_qdrant_client.count.return_value = MagicMock(count=2)
 
-        deleted = await vectordb.delete("test_delete", filters={"category": "A"})
+        deleted = await vectordb.delete(
+            "test_delete", filters={"category": "A"}, exact_count=True
+        )
         assert deleted == 2
 
+        mock_qdrant_client.count.assert_called_once()
+        mock_qdrant_client.get_collection.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_delete_no_params(self, vectordb):
         """Test delete raises error when no params provided."""
@@ -474,6 +948,49 @@ class TestQdrantVectorDB:
             await vectordb.count("nonexistent")
 
 
+    @pytest.mark.asyncio
+    async def test_create_collection_already_exists_grpc(self, vectordb, mock_qdrant_client):
+        """Test ALREADY_EXISTS from the gRPC transport maps to ValueError."""
+        mock_qdrant_client.create_collection.side_effect = FakeRpcError(
+            grpc.StatusCode.ALREADY_EXISTS, "Collection test_dup already exists"
+        )
+
+        with pytest.raises(ValueError, match="already exists"):
+            await vectordb.create_collection("test_dup", dimension=384)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method,call",
+        [
+            ("upsert", lambda db: db.upsert("missing", [VectorRecord(id="v", vector=[0.1], payload={})])),
+            ("query_points", lambda db: db.search("missing", query_vector=[0.1])),
+            ("delete", lambda db: db.delete("missing", ids=["v"])),
+            ("retrieve", lambda db: db.get("missing", ids=["v"])),
+            ("count", lambda db: db.count("missing")),
+        ],
+    )
+    async def test_grpc_not_found(self, vectordb, mock_qdrant_client, method, call):
+        """Test NOT_FOUND from the gRPC transport maps to ValueError."""
+        getattr(mock_qdrant_client, method).side_effect = FakeRpcError(
+            grpc.StatusCode.NOT_FOUND, "Collection missing not found"
+        )
+        vectordb._known_collections.add("missing")
+
+        with pytest.raises(ValueError, match="does not exist"):
+            await call(vectordb)
+        assert "missing" not in vectordb._known_collections
+
+    @pytest.mark.asyncio
+    async def test_grpc_other_error_is_runtime_error(self, vectordb, mock_qdrant_client):
+        """Test other gRPC failures are not reported as a missing collection."""
+        mock_qdrant_client.query_points.side_effect = FakeRpcError(
+            grpc.StatusCode.UNAVAILABLE, "connection refused"
+        )
+
+        with pytest.raises(RuntimeError, match="Search failed"):
+            await vectordb.search("test_search", query_vector=[0.1])
+
+
 class TestQdrantFilterBuilder:
     """Test Qdrant filter building functionality."""
 
@@ -519,6 +1036,60 @@ class TestQdrantFilterBuilder:
         assert qdrant_filter.must is not None
         assert len(qdrant_filter.must) == 3
 
+    @pytest.mark.asyncio
+    async def test_build_filter_cached(self, vectordb):
+        """Test equal filters reuse one compiled Filter, keeping literal types apart."""
+        first = vectordb._build_filter({"category": "A", "count": 1})
+        again = vectordb._build_filter({"count": 1, "category": "A"})
+        other = vectordb._build_filter({"category": "A", "count": True})
+
+        assert again is first
+        assert other is not first
+        assert other.must[1].match.value is True
+
+
+    @pytest.mark.asyncio
+    async def test_build_filter_single_field_fast_path(self, vectordb):
+        """Test single-field filters are compiled directly and cached by type."""
+        from qdrant_client import models
+
+        exact = vectordb._build_filter({"count": 1})
+        assert exact.must[0].match == models.MatchValue(value=1)
+        assert vectordb._build_filter({"count": 1}) is exact
+        assert vectordb._build_filter({"count": True}).must[0].match.value is True
+
+        any_of = vectordb._build_filter({"category": {"$in": ["A", "B"]}})
+        assert any_of.must[0].match == models.MatchAny(any=["A", "B"])
+
+    @pytest.mark.asyncio
+    async def test_build_filter_or(self, vectordb):
+        """Test $or becomes a should clause instead of being dropped."""
+        from qdrant_client import models
+
+        only_or = vectordb._build_filter({"$or": [{"library": "react"}, {"library": "vue"}]})
+        assert only_or.must is None
+        assert [c.match.value for c in only_or.should] == ["react", "vue"]
+
+        mixed = vectordb._build_filter(
+            {"version": "18", "$or": [{"library": "react"}, {"type": "docs", "lang": "en"}]}
+        )
+        assert len(mixed.must) == 2
+        nested = mixed.must[1]
+        assert isinstance(nested, models.Filter)
+        assert nested.should[0].key == "library"
+        assert len(nested.should[1].must) == 2
+
+    @pytest.mark.asyncio
+    async def test_build_filter_and_keeps_nested_or(self, vectordb):
+        """Test an $or inside $and is kept as a nested filter."""
+        from qdrant_client import models
+
+        qdrant_filter = vectordb._build_filter(
+            {"$and": [{"version": "18"}, {"$or": [{"library": "react"}, {"library": "vue"}]}]}
+        )
+        assert qdrant_filter.must[0].key == "version"
+        assert isinstance(qdrant_filter.must[1], models.Filter)
+        assert len(qdrant_filter.must[1].should) == 2
 
 class TestQdrantConfiguration:
     """Test Qdrant configuration and settings."""
@@ -1,11 +1,17 @@
 """Tests for utility functions."""
 
 from docvector.utils import (
+    bulk_uuid4,
     clean_text,
+    compute_content_hash,
+    compute_fast_digest,
     compute_hash,
     compute_text_hash,
     count_tokens_approximate,
+    is_crawlable_url,
+    normalize_url,
     normalize_whitespace,
+    parse_url,
     remove_html_tags,
     truncate_text,
 )
@@ -44,6 +50,33 @@ class TestHashUtils:
         assert isinstance(result, str)
         assert len(result) == 64
 
+    def test_compute_content_hash_matches_text_hash(self):
+        """Test content hash equals the text hash of the decoded bytes."""
+        for content in (b"plain ascii", "caf\u00e9 \u2013 docs".encode("utf-8"), b"bad \xff\xfe bytes"):
+            expected = compute_text_hash(content.decode("utf-8", errors="ignore"))
+            assert compute_content_hash(content) == expected
+
+    def test_compute_fast_digest(self):
+        """Test fast digest is a stable 64-bit int that matches str and bytes."""
+        result = compute_fast_digest(b"page body")
+        assert 0 <= result < 2**64
+        assert compute_fast_digest("page body") == result
+        assert compute_fast_digest(b"other body") != result
+
+
+class TestIdUtils:
+    """Test identifier utilities."""
+
+    def test_bulk_uuid4(self):
+        """Test bulk UUIDs are distinct, valid version 4 UUIDs."""
+        ids = bulk_uuid4(100)
+        assert len(set(ids)) == 100
+        assert all(uid.version == 4 and uid.variant == "specified in RFC 4122" for uid in ids)
+
+    def test_bulk_uuid4_empty(self):
+        """Test no UUIDs are generated for a zero count."""
+        assert bulk_uuid4(0) == []
+
 
 class TestTextUtils:
     """Test text processing utilities."""
@@ -147,3 +180,52 @@ class TestTextUtils:
         """Test token counting with empty text."""
         result = count_tokens_approximate("")
         assert result == 0
+
+
+class TestUrlUtils:
+    """Test URL utilities."""
+
+    def test_normalize_url_strips_fragment_and_trailing_slash(self):
+        """Test fragments and trailing slashes are removed."""
+        result = normalize_url("https://example.com/docs/#intro")
+        assert result == "https://example.com/docs"
+
+    def test_normalize_url_keeps_root_and_query(self):
+        """Test the root path and query string are preserved."""
+        assert normalize_url("https://example.com/") == "https://example.com/"
+        assert normalize_url("https://example.com/a?page=2") == "https://example.com/a?page=2"
+
+    def test_normalize_url_empty(self):
+        """Test empty input stays empty."""
+        assert normalize_url("") == ""
+
+    def test_normalize_url_fast_path_matches_urlparse(self):
+        """Test the string fast path agrees with urlparse-based normalization."""
+        from docvector.utils.url_utils import _normalize_parsed
+
+        urls = [
+            "https://example.com",
+            "https://example.com/?",
+            "https://example.com/a/?q=1#f",
+            "https://example.com/a#b?c",
+            "http://example.com:8080/x//",
+            "https://example.com/a/b/?x=/",
+            "https://user@example.com/a/",
+            "https://example.com/a;params/",
+        ]
+        for url in urls:
+            assert normalize_url(url) == _normalize_parsed(url), url
+
+    def test_parse_url_is_cached(self):
+        """Test repeated parses return the cached result."""
+        first = parse_url("https://example.com/cached")
+        assert parse_url("https://example.com/cached") is first
+        assert first.netloc == "example.com"
+
+    def test_is_crawlable_url(self):
+        """Test scheme, extension and domain checks."""
+        assert is_crawlable_url("https://docs.example.com/guide", ("example.com",))
+        assert not is_crawlable_url("ftp://example.com/file")
+        assert not is_crawlable_url("https://example.com/logo.PNG")
+        assert not is_crawlable_url("https://other.com/guide", ("example.com",))
+        assert not is_crawlable_url("")
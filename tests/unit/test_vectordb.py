@@ -5,7 +5,7 @@ from unittest.mock import Mock
 import pytest
 from qdrant_client.http.exceptions import UnexpectedResponse
 
-from docvector.vectordb import QdrantVectorDB, SearchResult
+from docvector.vectordb import BaseVectorDB, QdrantVectorDB, SearchResult
 
 
 class TestSearchResult:
@@ -33,7 +33,7 @@ class TestSearchResult:
 
 
 class TestQdrantVectorDB:
-    """Test Qdrant vector database implementation."""
+    """Test the legacy BaseVectorDB API over the Qdrant implementation."""
 
     @pytest.fixture
     def vectordb(self, mocker, mock_qdrant_client):
@@ -41,14 +41,14 @@ class TestQdrantVectorDB:
         db = QdrantVectorDB()
         # Patch the client creation
         mocker.patch.object(db, "client", mock_qdrant_client)
-        return db
+        return BaseVectorDB(db)
 
     @pytest.mark.asyncio
     async def test_initialize(self, vectordb, mock_qdrant_client):
         """Test initialization."""
         await vectordb.initialize()
         # Should initialize client (mocked, so just verify it's set)
-        assert vectordb.client is not None
+        assert vectordb.store.client is not None
 
     @pytest.mark.asyncio
     async def test_create_collection(self, vectordb, mock_qdrant_client):
@@ -61,6 +61,20 @@ class TestQdrantVectorDB:
 
         mock_qdrant_client.create_collection.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_collection_bulk_load(self, vectordb, mock_qdrant_client):
+        """Test bulk-load collections defer indexing until finalize_index."""
+        await vectordb.initialize()
+        await vectordb.create_collection("bulk", 384, bulk_load=True)
+
+        optimizers = mock_qdrant_client.create_collection.call_args.kwargs["optimizers_config"]
+        assert optimizers.indexing_threshold == 0
+
+        await vectordb.finalize_index("bulk")
+
+        optimizers = mock_qdrant_client.update_collection.call_args.kwargs["optimizers_config"]
+        assert optimizers.indexing_threshold > 0
+
     @pytest.mark.asyncio
     async def test_create_collection_already_exists(self, vectordb, mock_qdrant_client):
         """Test creating collection that already exists."""
@@ -135,6 +149,16 @@ class TestQdrantVectorDB:
         # Should not call upsert for empty data
         mock_qdrant_client.upsert.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_flush_waits_on_collection(self, vectordb, mock_qdrant_client):
+        """Test flush sends a waited upsert as a write barrier."""
+        await vectordb.initialize()
+
+        await vectordb.flush("test")
+
+        mock_qdrant_client.upsert.assert_called_once()
+        assert mock_qdrant_client.upsert.call_args.kwargs["wait"] is True
+
     @pytest.mark.asyncio
     async def test_search(self, vectordb, mock_qdrant_client, mocker):
         """Test searching vectors."""
@@ -144,7 +168,7 @@ class TestQdrantVectorDB:
         mock_result.score = 0.95
         mock_result.payload = {"content": "test"}
 
-        mock_qdrant_client.search.return_value = [mock_result]
+        mock_qdrant_client.query_points.return_value = mocker.Mock(points=[mock_result])
 
         await vectordb.initialize()
 
@@ -159,9 +183,9 @@ class TestQdrantVectorDB:
         assert results[0].score == 0.95
 
     @pytest.mark.asyncio
-    async def test_search_with_filter(self, vectordb, mock_qdrant_client):
+    async def test_search_with_filter(self, vectordb, mock_qdrant_client, mocker):
         """Test searching with filters."""
-        mock_qdrant_client.search.return_value = []
+        mock_qdrant_client.query_points.return_value = mocker.Mock(points=[])
 
         await vectordb.initialize()
 
@@ -173,7 +197,7 @@ class TestQdrantVectorDB:
         )
 
         # Verify filter was built and passed
-        call_args = mock_qdrant_client.search.call_args
+        call_args = mock_qdrant_client.query_points.call_args
         assert call_args[1]["query_filter"] is not None
 
     @pytest.mark.asyncio
@@ -233,7 +257,7 @@ class TestQdrantVectorDB:
     def test_build_filter_simple(self, vectordb):
         """Test building simple filter."""
         filter_dict = {"field": "value"}
-        result = vectordb._build_filter(filter_dict)
+        result = vectordb.store._build_filter(filter_dict)
 
         assert result.must is not None
         assert len(result.must) == 1
@@ -241,14 +265,14 @@ class TestQdrantVectorDB:
     def test_build_filter_in(self, vectordb):
         """Test building filter with $in operator."""
         filter_dict = {"field": {"$in": ["val1", "val2"]}}
-        result = vectordb._build_filter(filter_dict)
+        result = vectordb.store._build_filter(filter_dict)
 
         assert result.must is not None
 
     def test_build_filter_range(self, vectordb):
         """Test building filter with range operators."""
         filter_dict = {"age": {"$gt": 18, "$lt": 65}}
-        result = vectordb._build_filter(filter_dict)
+        result = vectordb.store._build_filter(filter_dict)
 
         assert result.must is not None
         assert len(result.must) == 2  # Two range conditions
@@ -39,6 +39,31 @@ class TestWebCrawler:
             assert doc.mime_type == "text/html"
             assert doc.title == "Test"
 
+    @pytest.mark.asyncio
+    async def test_session_reused_across_fetches(self, crawler):
+        """Test the HTTP session stays open between fetch calls."""
+        with aioresponses() as m:
+            m.get("https://example.com/one", status=200, body=b"one")
+            m.get("https://example.com/two", status=200, body=b"two")
+
+            await crawler.fetch_single("https://example.com/one")
+            session = crawler.session
+            await crawler.fetch_single("https://example.com/two")
+
+            assert session is not None
+            assert crawler.session is session
+
+        await crawler.close()
+        assert crawler.session is None
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_session(self):
+        """Test the crawler releases its session on context exit."""
+        async with WebCrawler(concurrent_requests=2) as crawler_instance:
+            assert crawler_instance.session is not None
+
+        assert crawler_instance.session is None
+
     @pytest.mark.asyncio
     async def test_fetch_single_handles_error(self, crawler):
         """Test handling fetch errors."""
@@ -96,6 +121,29 @@ class TestWebCrawler:
             assert "https://example.com/page1" in urls
             assert "https://example.com/page2" in urls
 
+    @pytest.mark.asyncio
+    async def test_fetch_sitemap_follows_index(self, crawler):
+        """Test sitemap indexes are followed to their nested sitemaps."""
+        index_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <sitemap><loc>https://example.com/sitemap-docs.xml</loc></sitemap>
+        </sitemapindex>
+        """
+        docs_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <url><loc>https://example.com/docs/a</loc></url>
+            <url><loc>https://example.com/docs/b</loc></url>
+        </urlset>
+        """
+
+        with aioresponses() as m:
+            m.get("https://example.com/sitemap.xml", status=200, body=index_xml.encode())
+            m.get("https://example.com/sitemap-docs.xml", status=200, body=docs_xml.encode())
+
+            urls = await crawler._fetch_sitemap("https://example.com")
+
+            assert urls == {"https://example.com/docs/a", "https://example.com/docs/b"}
+
     @pytest.mark.asyncio
     async def test_fetch_sitemap_handles_missing(self, crawler):
         """Test handling missing sitemap."""
@@ -119,6 +167,113 @@ class TestWebCrawler:
 
         assert "start_url" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_crawl_recursive_follows_links(self, crawler):
+        """Test link discovery follows anchors with an href."""
+        with aioresponses() as m:
+            m.get(
+                "https://example.com/",
+                status=200,
+                body=b'<html><body><a href="/a">A</a><a>none</a>'
+                b'<div><a href="https://other.com/x">X</a></div></body></html>',
+                headers={"Content-Type": "text/html"},
+            )
+            m.get(
+                "https://example.com/a",
+                status=200,
+                body=b"<html><body>leaf</body></html>",
+                headers={"Content-Type": "text/html"},
+            )
+
+            await crawler._init_session()
+            urls = await crawler._crawl_recursive(
+                start_url="https://example.com/",
+                max_depth=2,
+                max_pages=10,
+                allowed_domains=["example.com"],
+            )
+
+            assert sorted(urls) == ["https://example.com/", "https://example.com/a"]
+
+    @pytest.mark.asyncio
+    async def test_crawl_recursive_skips_oversized_pages(self):
+        """Test pages above max_body_bytes are neither parsed nor returned."""
+        crawler_instance = WebCrawler(max_depth=2, max_pages=10, max_body_bytes=64)
+        with aioresponses() as m:
+            m.get(
+                "https://example.com/",
+                status=200,
+                body=b'<html><body><a href="/big">Big</a></body></html>',
+                headers={"Content-Type": "text/html"},
+            )
+            m.get(
+                "https://example.com/big",
+                status=200,
+                body=b"<html><body>" + b"x" * 128 + b'<a href="/hidden">H</a></body></html>',
+                headers={"Content-Type": "text/html"},
+            )
+
+            await crawler_instance._init_session()
+            try:
+                urls = await crawler_instance._crawl_recursive(
+                    start_url="https://example.com/",
+                    max_depth=2,
+                    max_pages=10,
+                    allowed_domains=["example.com"],
+                )
+            finally:
+                await crawler_instance.close()
+
+            assert urls == ["https://example.com/"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_single_rejects_oversized_page(self):
+        """Test fetched pages above max_body_bytes raise instead of being returned."""
+        from docvector.core import DocVectorException
+
+        crawler_instance = WebCrawler(max_body_bytes=64)
+        with aioresponses() as m:
+            m.get(
+                "https://example.com/big",
+                status=200,
+                body=b"<html><body>" + b"x" * 128 + b"</body></html>",
+                headers={"Content-Type": "text/html"},
+            )
+
+            try:
+                with pytest.raises(DocVectorException) as exc_info:
+                    await crawler_instance.fetch_single("https://example.com/big")
+            finally:
+                await crawler_instance.close()
+
+            assert exc_info.value.code == "DOCUMENT_TOO_LARGE"
+
+    @pytest.mark.asyncio
+    async def test_fetch_reuses_crawled_pages(self, crawler):
+        """Test pages downloaded during link discovery are not fetched again."""
+        with aioresponses() as m:
+            m.get("https://example.com/sitemap.xml", status=404)
+            # Each mock answers once, so a second request would fail
+            m.get(
+                "https://example.com/",
+                status=200,
+                body=b'<html><head><title>Home</title></head><body><a href="/a">A</a></body></html>',
+                headers={"Content-Type": "text/html"},
+            )
+            m.get(
+                "https://example.com/a",
+                status=200,
+                body=b"<html><head><title>A</title></head><body>leaf</body></html>",
+                headers={"Content-Type": "text/html"},
+            )
+
+            documents = await crawler.fetch(
+                {"start_url": "https://example.com/", "allowed_domains": ["example.com"]}
+            )
+
+            titles = {doc.url: doc.title for doc in documents}
+            assert titles == {"https://example.com/": "Home", "https://example.com/a": "A"}
+
     @pytest.mark.asyncio
     async def test_fetch_url_metadata(self, crawler):
         """Test that metadata is captured."""